@@ -0,0 +1,51 @@
+"""
+Benchmark calling a small declarative hook in a loop from a document that has
+ accumulated a large amount of public data. The time per call should not depend on the
+ amount of data the caller has.
+
+Run with `python benchmarks/bench_dcl_hooks.py [max_exponent]`.
+"""
+import sys
+import time
+
+from tackle import tackle
+
+
+def generate_document(number_of_keys: int, loop: bool) -> dict:
+    document = {f'key_{i}': i for i in range(number_of_keys)}
+    document['greet<-'] = {
+        'name': 'str',
+        'exec': {'greeting->': 'var Hello {{name}}'},
+    }
+    if loop:
+        document['loop->'] = 'greet --name {{item}} --for items'
+    return document
+
+
+def run_document(number_of_keys: int, number_of_calls: int, loop: bool) -> float:
+    document = generate_document(number_of_keys, loop)
+    existing_data = {'items': [str(i) for i in range(number_of_calls)]}
+    start = time.perf_counter()
+    tackle(raw_input=document, existing_data=existing_data)
+    return time.perf_counter() - start
+
+
+def bench_dcl_hook(number_of_keys: int, number_of_calls: int = 200):
+    # Parsing the rest of the document is subtracted so only the calls are timed
+    elapsed = run_document(number_of_keys, number_of_calls, loop=True)
+    elapsed -= run_document(number_of_keys, number_of_calls, loop=False)
+    print(
+        f"{number_of_keys:>8} keys: {elapsed:.3f}s "
+        f"({elapsed / number_of_calls * 1e6:.1f}us per call)"
+    )
+
+
+def main(max_exponent: int = 5):
+    # Warm up the imports of the native providers
+    run_document(1, 1, loop=True)
+    for exponent in range(1, max_exponent + 1):
+        bench_dcl_hook(10**exponent)
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:]])
@@ -0,0 +1,73 @@
+"""
+Benchmark parsing hook call strings (ie `key->: hook arg --kwarg thing --flag`), both
+ on their own and within parse heavy documents where the same hook calls are run on
+ every loop iteration.
+
+Run with `python benchmarks/bench_hook_parsing.py [number_of_iterations]`.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from tackle import tackle
+from tackle.parser import parse_hook_string
+from tackle.utils.command import parse_args_kwargs_string
+
+HOOK_STRINGS = [
+    'literal foo',
+    'var {{item}}-{{index}} --if index>0',
+    'literal ["foo","bar"] --for i in range(2)',
+    'tackle secrets.yaml --if isfile(path_join([cwd,\'secrets.yaml\']))',
+    'this that --for i, k, v in foo --try',
+]
+
+
+def generate_document(number_of_iterations: int) -> dict:
+    # Hook args are split on whitespace so the list needs to be compact
+    items = json.dumps(list(range(number_of_iterations)), separators=(',', ':'))
+    return {
+        'items->': f'literal {items}',
+        'loop->': {
+            'for': 'items',
+            'a->': 'var {{item}}-{{index}}',
+            'b->': 'literal ["foo","bar"] --if index>=0',
+            'c->': 'var {{item*2}} --try',
+            'd->': 'literal {"foo":"bar"} --if item!=-1 --try',
+        },
+    }
+
+
+def bench_parse(number_of_iterations: int):
+    for name, parse in (
+        ('uncached', parse_args_kwargs_string.__wrapped__),
+        ('cached', parse_args_kwargs_string),
+    ):
+        start = time.perf_counter()
+        for _ in range(number_of_iterations):
+            for i in HOOK_STRINGS:
+                parse(i).unpack()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>8} parse: {elapsed:.3f}s")
+
+
+def bench_document(number_of_iterations: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'tackle.yaml')
+        with open(path, 'w') as f:
+            json.dump(generate_document(number_of_iterations), f)
+        parse_hook_string.cache_clear()
+        start = time.perf_counter()
+        tackle(path)
+        elapsed = time.perf_counter() - start
+    print(f"document: {elapsed:.3f}s - {parse_hook_string.cache_info()}")
+
+
+def main(number_of_iterations: int = 2000):
+    bench_parse(number_of_iterations)
+    bench_document(number_of_iterations)
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:]])
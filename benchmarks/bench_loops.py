@@ -0,0 +1,46 @@
+"""
+Benchmark `for` loops over a single hook call, ie `key->: var {{item}} --for items`,
+ with the number of items going from 10^3 to 10^6. The items are passed in as existing
+ data so that only the loop is timed.
+
+Run with `python benchmarks/bench_loops.py [max_exponent]`.
+"""
+import sys
+import time
+
+from tackle import tackle
+
+LOOP_HOOK_CALLS = {
+    'literal': 'literal foo --for items',
+    'var': 'var {{item}}-{{index}} --for items',
+    'if_else': {
+        '->': 'var {{item}}',
+        'for': 'items',
+        'if': 'item % 2 == 0',
+        'else': 'odd',
+    },
+    'merge': 'literal {"{{item}}":"{{index}}"} --for items --merge',
+}
+
+
+def bench_loop(number_of_items: int, name: str, hook_call):
+    existing_data = {'items': [str(i) for i in range(number_of_items)]}
+    if name == 'if_else':
+        existing_data['items'] = list(range(number_of_items))
+    start = time.perf_counter()
+    output = tackle(raw_input={'loop->': hook_call}, existing_data=existing_data)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:>8} {number_of_items:>8} items: {elapsed:.3f}s "
+        f"({elapsed / number_of_items * 1e6:.1f}us per item) - {len(output)} keys"
+    )
+
+
+def main(max_exponent: int = 6):
+    for exponent in range(3, max_exponent + 1):
+        for name, hook_call in LOOP_HOOK_CALLS.items():
+            bench_loop(10**exponent, name, hook_call)
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:]])
@@ -0,0 +1,94 @@
+"""
+Benchmark the memory allocated per hook call when calling hooks in a loop. Reports the
+ bytes allocated at peak and the number of blocks still allocated after the run, both
+ per call, as measured by `tracemalloc`. Blocks and declarative hooks create a context
+ for each call so the size of a context is reported as well.
+
+Run with `python benchmarks/bench_memory.py [number_of_calls] [output_file]` where the
+ results are also written to the optional output file as json to compare runs.
+"""
+import json
+import sys
+import tracemalloc
+
+from tackle import tackle
+from tackle.factory import new_context
+
+DOCUMENTS = {
+    'literal': {
+        'loop->': 'literal {{item}} --for items',
+    },
+    'block': {
+        'loop->': {
+            'for': 'items',
+            'a->': 'var {{item}}',
+            'b': '{{a}}',
+        },
+    },
+    'dcl_hook': {
+        'greet<-': {
+            'name': 'str',
+            'exec': {'greeting->': 'var Hello {{name}}'},
+        },
+        'loop->': 'greet --name {{item}} --for items',
+    },
+}
+
+
+def run_document(document: dict, number_of_calls: int) -> tuple[int, int]:
+    existing_data = {'items': [str(i) for i in range(number_of_calls)]}
+    tracemalloc.start()
+    try:
+        output = tackle(raw_input=document, existing_data=existing_data)
+        blocks = sum(i.count for i in tracemalloc.take_snapshot().statistics('lineno'))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del output
+    return peak, blocks
+
+
+def bench_memory(name: str, number_of_calls: int) -> dict:
+    peak, blocks = run_document(DOCUMENTS[name], number_of_calls)
+    print(
+        f"{name:>10}: {peak / number_of_calls / 1024:.1f}KiB peak per call, "
+        f"{blocks / number_of_calls:.1f} blocks retained per call"
+    )
+    return {
+        'peak_bytes_per_call': peak / number_of_calls,
+        'blocks_retained_per_call': blocks / number_of_calls,
+    }
+
+
+def bench_context(number_of_contexts: int) -> dict:
+    context = new_context(raw_input={})
+    tracemalloc.start()
+    try:
+        contexts = [context.fork() for _ in range(number_of_contexts)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del contexts
+    print(f"{'context':>10}: {size / number_of_contexts:.0f}B per fork")
+    return {'bytes_per_fork': size / number_of_contexts}
+
+
+def main(number_of_calls: int = 1000, output_file: str | None = None):
+    # Warm up the imports of the native providers and the caches so they are not
+    #  counted as allocations of the calls
+    for document in DOCUMENTS.values():
+        run_document(document, 1)
+    results = {
+        'python': sys.version.split()[0],
+        'number_of_calls': number_of_calls,
+    }
+    for name in DOCUMENTS:
+        results[name] = bench_memory(name, number_of_calls)
+    results['context'] = bench_context(number_of_calls)
+    if output_file is not None:
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main(*[int(i) if i.isdigit() else i for i in sys.argv[1:]])
@@ -0,0 +1,52 @@
+"""
+Benchmark the yaml loaders in `tackle.utils.yaml_loaders` on a large generated
+ document, ie a manifest with many resources.
+
+Run with `python benchmarks/bench_yaml_loaders.py [number_of_resources]`.
+"""
+import sys
+import time
+
+from tackle.utils.yaml_loaders import YAML_LOADERS, load_yaml
+
+RESOURCE = """- apiVersion: apps/v1
+  kind: Deployment
+  metadata:
+    name: app-{i}
+    labels: {{app: app-{i}, tier: backend, enabled: true}}
+  spec:
+    replicas: {i}
+    ratio: 0.{i}
+    created: 2023-01-01
+    containers:
+      - name: app
+        image: "registry.example.com/app:{i}"
+        args: [--port, "80{i}", --verbose]
+        env:
+          - {{name: FOO, value: bar}}
+          - {{name: EMPTY, value: null}}
+"""
+
+
+def generate_document(number_of_resources: int) -> str:
+    return ''.join(RESOURCE.format(i=i) for i in range(number_of_resources))
+
+
+def main(number_of_resources: int = 20000):
+    document = generate_document(number_of_resources)
+    size_mb = len(document.encode()) / 1e6
+    print(f"Document size: {size_mb:.1f} MB")
+
+    outputs = {}
+    for name in YAML_LOADERS:
+        start = time.perf_counter()
+        outputs[name] = load_yaml(document, loader=name)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>8}: {elapsed:.2f}s ({size_mb / elapsed:.1f} MB/s)")
+
+    first, *others = outputs.values()
+    assert all(first == i for i in others), "Loaders returned different data."
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:]])
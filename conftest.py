@@ -6,6 +6,7 @@ import pytest
 from tackle.context import Source
 from tackle.factory import new_context
 from tackle.imports import import_native_providers
+from tackle.settings import settings
 
 
 @pytest.fixture(scope='function', autouse=True)
@@ -14,6 +15,12 @@ def cd_cwd(request):
     os.chdir(request.fspath.dirname)
 
 
+@pytest.fixture(scope='function', autouse=True)
+def tmp_cache_dir(tmp_path, monkeypatch):
+    """Keep the caches written by tests out of the user's cache dir."""
+    monkeypatch.setattr(settings, 'cache_dir', os.path.join(tmp_path, '.cache'))
+
+
 @pytest.fixture(scope='function')
 def cd(request):
     """Change to a local directory from a test, usually a fixtures dir."""
@@ -1,23 +1,32 @@
+import json
 import os
 
 from pydantic import BaseModel
 
 from tackle import BaseHook, Field
-from tackle.context import Context, Hooks
-from tackle.imports import import_python_hooks_from_file
+from tackle.context import Context
+from tackle.imports import (
+    NATIVE_HOOKS_INDEX,
+    NATIVE_PROVIDERS_DIRECTORY,
+    get_module_from_path,
+    is_base_hook_subclass,
+)
 
 
 class CachedHook(BaseModel):
     hook_name: str
+    class_name: str
     module_name: str
+    file_path: str
     provider_name: str
     hooks_path: str
 
 
 class GenerateNativeHookCache(BaseHook):
     """
-    Hook to generate tackle.lock.json files for all the native providers and thereby make
-     startup times much faster.
+    Hook to generate the native hooks index (ie `providers/.native_hooks.json`) which
+     lets tackle import native providers lazily and thereby make startup times much
+     faster.
     """
 
     hook_name = 'provider_cache_data'
@@ -25,6 +34,11 @@ class GenerateNativeHookCache(BaseHook):
         None,
         description="Abs path to providers dir.",
     )
+    write_index: bool = Field(
+        False,
+        description="Write the data to the native hooks index which is used unless the "
+        "`import_all_native_providers` setting is set.",
+    )
 
     cached_hooks_: list = []
 
@@ -34,39 +48,40 @@ class GenerateNativeHookCache(BaseHook):
         provider_name: str,
         provider_directory: str,
     ):
-        for file in os.scandir(os.path.join(provider_directory, 'hooks')):
+        # Same module naming as `tackle.imports.import_native_hooks_from_directory`
+        for file in sorted(
+            os.scandir(os.path.join(provider_directory, 'hooks')), key=lambda x: x.name
+        ):
             file_base, file_extension = os.path.splitext(file.name)
             if file_extension != '.py':
                 continue
 
-            context.hooks = Hooks(private={})
-
-            module_name = provider_name + '.hooks.' + file_base
-            import_python_hooks_from_file(
+            module_name = 'providers.' + provider_name + '.hooks.' + file_base
+            mod = get_module_from_path(
                 context=context,
                 module_name=module_name,
                 file_path=file.path,
             )
 
-            for hook_name, hook in context.hooks.private.items():
+            for k, v in mod.__dict__.items():
+                if not is_base_hook_subclass(key=k, value=v):
+                    continue
                 self.cached_hooks_.append(
                     CachedHook(
-                        hook_name=hook_name,
-                        provider_name=provider_name,
+                        hook_name=v.hook_name,
+                        class_name=k,
                         module_name=module_name,
+                        file_path=f'{provider_name}/hooks/{file.name}',
+                        provider_name=provider_name,
                         hooks_path=f'../providers/{provider_name}/hooks',
                     ).__dict__
                 )
 
     def exec(self, context: Context):
         if self.providers_dir is None:
-            self.providers_dir = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), '..', 'providers'
-            )
-
-        context_hooks = context.hooks  # to be put back later
+            self.providers_dir = NATIVE_PROVIDERS_DIRECTORY
 
-        for i in os.scandir(self.providers_dir):
+        for i in sorted(os.scandir(self.providers_dir), key=lambda x: x.name):
             if i.is_dir() and i.name != '__pycache__':
                 self.get_provider_data(
                     context=context,
@@ -74,5 +89,13 @@ class GenerateNativeHookCache(BaseHook):
                     provider_name=i.name,
                 )
 
-        context.hooks = context_hooks
+        if self.write_index:
+            index = [
+                {k: v for k, v in i.items() if k != 'hooks_path'}
+                for i in self.cached_hooks_
+            ]
+            with open(NATIVE_HOOKS_INDEX, 'w') as f:
+                json.dump(index, f, indent=2)
+                f.write('\n')
+
         return self.cached_hooks_
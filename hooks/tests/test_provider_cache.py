@@ -1,4 +1,7 @@
+import json
+
 from tackle import tackle
+from tackle.imports import NATIVE_HOOKS_INDEX
 
 
 def test_native_hook_lock(base_hooks_dir):
@@ -6,3 +9,12 @@ def test_native_hook_lock(base_hooks_dir):
 
     assert 'hook_name' in output['data'][0]
     assert len(output['data']) > 90
+
+
+def test_native_hook_index_up_to_date(base_hooks_dir):
+    """Check that the native hooks index has been regenerated with the providers."""
+    output = tackle(raw_input={'data->': 'provider_cache_data'})
+    with open(NATIVE_HOOKS_INDEX) as f:
+        index = json.load(f)
+
+    assert [i['hook_name'] for i in output['data']] == [i['hook_name'] for i in index]
@@ -3,6 +3,7 @@ from typing import Optional, Union
 
 from tackle import BaseHook, Context, Field
 from tackle.exceptions import HookCallException
+from tackle.scopes import merge_frames
 from tackle.utils.data_crud import encode_key_path, nested_get
 
 
@@ -88,11 +89,16 @@ class SortHook(BaseHook):
 
     def get_src(self, context: Context):
         value = None
-        contexts = ['public', 'private', 'temporary', 'existing']
-        for i in contexts:
+        contexts = {
+            'public': context.data.public,
+            'private': context.data.private,
+            'temporary': merge_frames(context.data),
+            'existing': context.data.existing,
+        }
+        for i in contexts.values():
             try:
                 value = nested_get(
-                    element=getattr(context.data, i),
+                    element=i,
                     keys=encode_key_path(self.src, self.sep),
                 )
             except KeyError:
@@ -1,6 +1,7 @@
 from typing import Any, Optional, Union
 
 from tackle import BaseHook, Context, Field
+from tackle.scopes import merge_frames
 from tackle.utils.data_crud import encode_key_path, get_target_and_key, nested_get
 
 
@@ -45,7 +46,7 @@ class AppendHook(BaseHook):
                 # TODO: This is not ideal - need to nest this and catch errors
                 #  Better if we ?
                 target = nested_get(
-                    element=context.data.temporary,
+                    element=merge_frames(context.data),
                     keys=set_key_path,
                 )
 
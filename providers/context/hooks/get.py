@@ -2,6 +2,7 @@ from typing import Any, Union
 
 from tackle import BaseHook, Context, Field
 from tackle.exceptions import HookCallException
+from tackle.scopes import merge_frames
 from tackle.utils.data_crud import encode_key_path, nested_get
 
 # Hack because fallback value should be able to be None so None can't be default
@@ -33,10 +34,15 @@ class GetKeyHook(BaseHook):
     def exec(self, context: Context):
         """Run the hook."""
         value = None
-        for i in ['public', 'private', 'temporary', 'existing']:
+        for i in [
+            context.data.public,
+            context.data.private,
+            merge_frames(context.data),
+            context.data.existing,
+        ]:
             try:
                 value = nested_get(
-                    element=getattr(context.data, i),
+                    element=i,
                     keys=encode_key_path(self.path, self.sep),
                 )
             except KeyError:
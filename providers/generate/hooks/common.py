@@ -1,4 +1,5 @@
 from tackle import BaseHook, Context
+from tackle.scopes import merge_frames
 
 
 def init_context(self: BaseHook, context: 'Context'):
@@ -8,16 +9,15 @@ def init_context(self: BaseHook, context: 'Context'):
 
     # fmt: off
     existing = context.data.existing if context.data.existing is not None else {}
-    temporary = context.data.temporary if context.data.temporary is not None else {}
     private = context.data.private if context.data.private is not None else {}
     public = context.data.public if context.data.public is not None else {}
     # fmt: on
 
     self.render_context = {
         **existing,
-        **temporary,
         **private,
         **public,
+        **merge_frames(context.data),
     }
 
     if self.extra_context is not None:
@@ -15,6 +15,7 @@ from providers.generate.hooks.exceptions import (
     UndefinedVariableInTemplate,
 )
 from tackle import BaseHook, Context, Field
+from tackle.scopes import merge_frames
 
 
 class GenerateHook(BaseHook):
@@ -99,17 +100,16 @@ class GenerateHook(BaseHook):
         # Update the render_context that will be used
         if self.render_context is None:
             # fmt: off
-            existing_context = context.data.existing if context.data.temporary is not None else {}
-            temporary_context = context.data.temporary if context.data.temporary is not None else {}
+            existing_context = context.data.existing if context.data.existing is not None else {}
             private_context = context.data.private if context.data.private is not None else {}
             public_context = context.data.public if context.data.public is not None else {}
             # fmt: on
 
             self.render_context = {
                 **existing_context,
-                **temporary_context,
                 **private_context,
                 **public_context,
+                **merge_frames(context.data),
             }
 
         if self.extra_context is not None:
@@ -5,6 +5,7 @@ from tackle import BaseHook, Context, Field, exceptions
 from tackle.models import HookCallInput
 from tackle.parser import walk_document
 from tackle.render import render_string
+from tackle.scopes import scope_frame
 
 
 class MatchHook(BaseHook):
@@ -33,18 +34,9 @@ class MatchHook(BaseHook):
     _docs_order = 3
 
     def run_key(self, context: Context, value: Any):
-        tmp_context = Context(
-            # overrides=context.data.overrides,
-            verbose=context.verbose,
-            no_input=context.no_input,
-            key_path=context.key_path.copy(),
-            key_path_block=context.key_path.copy(),
-            path=context.path,
-            data=context.data,
-            hooks=context.hooks,
-        )
-
-        walk_document(context=tmp_context, value=value.copy())
+        with scope_frame(context.data) as block_frame:
+            tmp_context = context.fork(block_frame=block_frame)
+            walk_document(context=tmp_context, value=value.copy())
 
         return tmp_context.data.public
 
@@ -5,6 +5,7 @@ from InquirerPy import prompt
 from rich import print
 
 from tackle import BaseHook, Context, Field, exceptions
+from tackle.scopes import merge_frames
 
 DATA_NAMESPACES = ['public', 'private', 'temporary', 'existing']
 
@@ -43,11 +44,17 @@ class DebugHook(BaseHook):
         # print(panel)
         pprint(print_data)
 
+    def get_data(self, context: 'Context', data_name: str):
+        if data_name == 'temporary':
+            # Variables scoped to the blocks / loops being parsed
+            return merge_frames(context.data)
+        return getattr(context.data, data_name)
+
     def exec(self, context: 'Context') -> None:
         print(f"Debug at key_path={context.key_path}")
         if self.data is not None:
             if self.data in DATA_NAMESPACES:
-                output = getattr(self, f'{self.data}_data')
+                output = self.get_data(context, self.data)
                 if output is not None:
                     self.print_data(output, self.data)
                 else:
@@ -60,7 +67,7 @@ class DebugHook(BaseHook):
         else:
             printed = None
             for i in DATA_NAMESPACES:
-                output = getattr(context.data, f'{i}')
+                output = self.get_data(context, i)
                 if output is not None and output != {}:
                     if self.key is not None:
                         if self.key in output:
@@ -12,6 +12,8 @@ from tackle import BaseHook, Context, exceptions
 from tackle.factory import new_context
 from tackle.imports import import_hooks_from_file
 from tackle.utils.command import unpack_args_kwargs_string
+from tackle.utils.fetch import RemoteSource, fetch_remote_sources
+from tackle.utils.vcs import get_worktree_commit
 
 
 class RepoSource(BaseModel):
@@ -65,8 +67,15 @@ class ImportHook(BaseHook):
                 _strict_source=True,
             )
             # Put the hooks in right namespace
-            context.hooks.public.update(tmp_context.hooks.public)
-            context.hooks.private.update(tmp_context.hooks.private)
+            for hook_space, tmp_hook_space in (
+                (context.hooks.public, tmp_context.hooks.public),
+                (context.hooks.private, tmp_context.hooks.private),
+            ):
+                for hook_name, Hook in tmp_hook_space.items():
+                    if hook_space.get(hook_name) is not Hook:
+                        # Imported hooks can redefine existing ones
+                        context.hooks.compiled.clear()
+                        hook_space[hook_name] = Hook
 
     def _create_repo_source(self, context: Context, **kwargs) -> RepoSource:
         try:
@@ -138,15 +147,30 @@ class ImportHook(BaseHook):
                 latest=self.latest,
             )
         elif isinstance(self.src, list):
+            repo_sources = []
             for i in self.src:
                 if isinstance(i, str):
                     kwargs = self._new_import_src_from_str(context, provider_str=i)
                     repo_source = self._create_repo_source(context=context, **kwargs)
                 else:
                     repo_source = self._create_repo_source(context=context, **i)
+                repo_sources.append(repo_source)
+
+            # Resolve the remote sources in parallel and then import them all in order
+            # from the fetched commits
+            remote_sources = [
+                RemoteSource(i.src, i.version, i.latest) for i in repo_sources
+            ]
+            fetched = fetch_remote_sources(remote_sources)
+            for repo_source, remote_source in zip(repo_sources, remote_sources):
+                if remote_source in fetched:
+                    version = get_worktree_commit(fetched[remote_source])
+                    latest = None
+                else:
+                    version, latest = repo_source.version, repo_source.latest
                 self._do_import(
                     context=context,
                     src=repo_source.src,
-                    version=repo_source.version,
-                    latest=repo_source.latest,
+                    version=version,
+                    latest=latest,
                 )
@@ -1,10 +1,11 @@
-import copy
 from typing import Any, Union
 
 from pydantic import SecretStr
 
 import tackle as tkl
 from tackle import BaseHook, Context, Field
+from tackle.context import Data
+from tackle.scopes import merge_frames, new_overlay
 
 
 class TackleHook(BaseHook):
@@ -72,28 +73,23 @@ class TackleHook(BaseHook):
             # If not given, assume we're looking for default tackle file in current dir
             self.input_arg = '.'
 
-        existing_context = {}
-
-        if self.override != {}:
-            # This is a hack as we need extra vars to be mapped to both the
-            # existing_context (allowing rendering of unknown vars) and the overrides
-            # (allowing for calling of declarative hooks with args / kwargs)
-            existing_context.update(self.override)
-
-        if context.data.existing:
-            existing_context.update(context.data.existing)
-
-        if context.data.temporary:
-            existing_context.update(context.data.temporary)
-
-        # if self.private_context:
-        #     existing_context.update(self.private_context)
-
-        if context.data.public:
-            existing_context.update(context.data.public)
-
-        if self.extra_context:
-            existing_context.update(self.extra_context)
+        # The data from this context is passed by reference in an overlay (in
+        # descending priority) which the called context can write to without copying.
+        # The `override` is a hack as we need extra vars to be mapped to both the
+        # existing_context (allowing rendering of unknown vars) and the overrides
+        # (allowing for calling of declarative hooks with args / kwargs).
+        existing_context = new_overlay(
+            self.extra_context,
+            # Variables scoped to where the hook is called, ie loop variables
+            merge_frames(context.data),
+            context.data.public,
+            context.data.existing,
+            self.override,
+        )
+        data = Data(
+            existing=existing_context,
+            overrides=new_overlay(context.data.overrides),
+        )
 
         if isinstance(self.additional_args, str):
             self.additional_args = [self.additional_args]
@@ -109,11 +105,9 @@ class TackleHook(BaseHook):
             no_input=self.no_input if not self.no_input else context.no_input,
             verbose=context.verbose,
             overrides=self.override,
-            existing_data=existing_context,
             # Evaluated in factory
             _paths=context.path,
-            # TODO: Handle this in factory? Don't want to copy every time?
-            _data=copy.deepcopy(context.data),
+            _data=data,
             # Implicit
             # _hooks=context.hooks,
             **self.override,
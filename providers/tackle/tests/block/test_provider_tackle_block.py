@@ -54,9 +54,6 @@ def test_provider_system_hook_block_block_merge():
     assert len(output) == 3
 
 
-# TODO: The error here is that context.data.existing is not properly flushed between
-#  runs. When we are in the second object (ie block1_nested) we still get data from
-#  the prior execution.
 def test_hook_block_block_loop_block():
     """Make sure we preserve the temporary context from nested blocks."""
     output = tackle('block-loop-block.yaml')
@@ -66,6 +63,17 @@ def test_hook_block_block_loop_block():
     assert len(output['block1_nested']) == 2
 
 
+def test_provider_tackle_block_frames():
+    """Check items are rendered from the frames of the blocks they are within."""
+    context = tackle('frames.yaml', return_context=True)
+
+    assert context.data.public == {
+        'outer': {'a': {'b': 1}, 'c': 2, 'inner': {'d': 3}, 'e': 3},
+        'after': 3,
+    }
+    assert context.data.frames == []
+
+
 def test_provider_system_hook_block_list():
     """Macro re-written block, simple."""
     output = tackle('list.yaml')
@@ -76,3 +76,21 @@ def test_provider_tackle_a_dir_with_tackle_file():
     assert output['call']['current_directory'].endswith('a-dir-with-tackle-file')
     assert output['call']['current_file'].endswith('tackle.yaml')
     assert output['call']['calling_file'].endswith('a-dir-with-tackle-file.yaml')
+
+
+def test_provider_tackle_data_by_reference():
+    """Check the called context reads the data by reference without modifying it."""
+    big = {'a': [1, 2, 3]}
+    context = tackle(
+        raw_input={
+            'foo': 'parent',
+            'shell': {'->': 'tackle reference.yaml', 'chdir': 'fixture'},
+        },
+        existing_data={'big': big},
+        return_context=True,
+    )
+
+    assert context.data.public['shell'] == {'ref': big, 'foo': 'child'}
+    assert context.data.public['shell']['ref'] is big
+    assert context.data.public['foo'] == 'parent'
+    assert context.data.existing == {'big': big}
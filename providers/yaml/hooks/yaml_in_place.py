@@ -6,6 +6,7 @@ from ruyaml import YAML
 
 from tackle import BaseHook, Field
 from tackle.utils.data_crud import merge
+from tackle.utils.yaml_loaders import load_yaml, to_plain_containers
 
 
 class YamlHook(BaseHook):
@@ -66,12 +67,11 @@ class YamlHook(BaseHook):
             with open(self.path, 'r') as f:
                 self.contents = yaml.load(f)
         elif not self.contents:
-            yaml = YAML()
             # We are reading. Contents is read from path
             self.write = False
             mode = self.mode or 'r'
             with open(self.path, mode) as f:
-                self.contents = yaml.load(f)
+                self.contents = load_yaml(f)
 
     def _append_each_item(self, append_item):
         if isinstance(self.append_keys, str):
@@ -132,7 +132,7 @@ class YamlHook(BaseHook):
             yaml = YAML()
             with open(self.path, mode) as f:
                 yaml.dump(self.contents, f)
-                return self.contents
+                return to_plain_containers(self.contents)
         else:
             # Read operation, just return contents
             return self.contents
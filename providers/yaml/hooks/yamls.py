@@ -3,9 +3,9 @@ from io import StringIO
 from typing import Union
 
 from ruyaml import YAML
-from ruyaml.composer import ComposerError
 
 from tackle import BaseHook, Field
+from tackle.utils.yaml_loaders import load_yaml, load_yaml_file
 
 
 def str_representer(dumper, data):
@@ -37,33 +37,17 @@ class YamlHook(BaseHook):
         if not os.path.exists(os.path.dirname(self.path)) and self.data:
             os.makedirs(os.path.dirname(self.path))
 
-        yaml = YAML()
-
-        yaml.default_flow_style = False
-        yaml.indent(sequence=4, offset=2)
-        yaml.representer.add_representer(str, str_representer)
-
         if self.data:
+            yaml = YAML()
+            yaml.default_flow_style = False
+            yaml.indent(sequence=4, offset=2)
+            yaml.representer.add_representer(str, str_representer)
             with open(self.path, 'w') as f:
                 yaml.dump(self.data, f)
             return self.path
 
         else:
-            try:
-                with open(self.path, 'r') as f:
-                    data = yaml.load(f)
-            except ComposerError:
-                data = []
-                with open(self.path, 'r') as f:
-                    for doc in yaml.load_all(f):
-                        data.append(doc)
-
-            # TODO: Improve this - https://github.com/sudoblockio/tackle/issues/56
-            import json
-
-            data = json.loads(json.dumps(data))
-
-            return data
+            return load_yaml_file(self.path)
 
 
 class YamlEncodeHook(BaseHook):
@@ -92,6 +76,4 @@ class YamlDecodeHook(BaseHook):
     args: list = ['data']
 
     def exec(self) -> dict:
-        yaml = YAML(typ='safe', pure=True)
-        output = yaml.load(self.data)
-        return output
+        return load_yaml(self.data)
@@ -37,7 +37,11 @@ INSTALL_REQUIREMENTS = [
 ]
 
 # Add tomli only for Python 3.10
-EXTRAS_REQUIRE = {':python_version == "3.10"': ['tomli>=1.0.0']}
+EXTRAS_REQUIRE = {
+    ':python_version == "3.10"': ['tomli>=1.0.0'],
+    # libyaml backed yaml loading, see tackle/utils/yaml_loaders.py
+    'speedups': ['PyYAML>=5.1'],
+}
 
 setup(
     name='tackle',
@@ -1,16 +1,60 @@
 """Main package for tackle."""
 __version__ = "0.7.6"  # x-release-please-version
 
-from pydantic import Field
+import importlib
+from typing import TYPE_CHECKING
 
-from tackle.context import Context
-from tackle.decorators import public, private, hook
-from tackle.factory import new_context
-from tackle.main import tackle
-from tackle.models import BaseHook, HookCallInput
+# Lazy proxy so is cheap to import. Also keeps `tackle.settings` pointing to the
+#  settings object instead of the module.
 from tackle.settings import settings
-from tackle.types import DocumentKeyType, DocumentType, DocumentValueType
-from tackle.utils.hooks import get_hook
+
+if TYPE_CHECKING:
+    from pydantic import Field
+
+    from tackle.context import Context
+    from tackle.decorators import hook, private, public
+    from tackle.factory import new_context
+    from tackle.main import tackle
+    from tackle.models import BaseHook, HookCallInput
+    from tackle.types import DocumentKeyType, DocumentType, DocumentValueType
+    from tackle.utils.hooks import get_hook
+
+# The public API is imported on first access so that importing tackle (ie to define a
+#  hook) does not import the parser / jinja / ruyaml etc.
+_LAZY_ATTRIBUTES = {
+    'Field': 'pydantic',
+    'Context': 'tackle.context',
+    'hook': 'tackle.decorators',
+    'private': 'tackle.decorators',
+    'public': 'tackle.decorators',
+    'new_context': 'tackle.factory',
+    'tackle': 'tackle.main',
+    'BaseHook': 'tackle.models',
+    'HookCallInput': 'tackle.models',
+    'DocumentKeyType': 'tackle.types',
+    'DocumentType': 'tackle.types',
+    'DocumentValueType': 'tackle.types',
+    'get_hook': 'tackle.utils.hooks',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    # Submodules (ie `tkl.main`) are imported on access
+    try:
+        return importlib.import_module(f'{__name__}.{name}')
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     'tackle',
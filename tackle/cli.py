@@ -1,12 +1,53 @@
 """Main `tackle` CLI."""
 import argparse
 import ast
+import importlib
 import sys
+from typing import TYPE_CHECKING
 
-from tackle import __version__, tackle
-from tackle.context import Context
-from tackle.utils.command import unpack_args_kwargs_list
-from tackle.utils.log import configure_logger
+from tackle import __version__
+
+if TYPE_CHECKING:
+    from tackle.context import Context
+    from tackle.daemon import serve
+    from tackle.factory import new_context
+    from tackle.main import tackle
+    from tackle.settings import settings
+    from tackle.utils.command import unpack_args_kwargs_list
+    from tackle.utils.fetch import fetch_remote_sources, get_import_sources
+    from tackle.utils.file_cache import clear_tackle_file_cache
+    from tackle.utils.log import configure_logger
+    from tackle.utils.paths import work_in
+
+# The runtime is only imported when a call is run in process (see `import_runtime`)
+#  so that forwarding a call to a daemon stays cheap.
+_LAZY_ATTRIBUTES = {
+    'serve': 'tackle.daemon',
+    'new_context': 'tackle.factory',
+    'tackle': 'tackle.main',
+    'settings': 'tackle.settings',
+    'unpack_args_kwargs_list': 'tackle.utils.command',
+    'fetch_remote_sources': 'tackle.utils.fetch',
+    'get_import_sources': 'tackle.utils.fetch',
+    'clear_tackle_file_cache': 'tackle.utils.file_cache',
+    'configure_logger': 'tackle.utils.log',
+    'work_in': 'tackle.utils.paths',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def import_runtime():
+    """Import the runtime, keeping any attributes that are already set (ie mocks)."""
+    for name in _LAZY_ATTRIBUTES:
+        if name not in globals():
+            __getattr__(name)
 
 
 def _validate_print_format(print_format: str):
@@ -51,10 +92,31 @@ def print_public_data(context: 'Context', print_format: str):
         print(output)
 
 
+def fetch(*args, **kwargs):
+    """Fetch the remote sources of all the imports in a source in parallel."""
+    import_runtime()
+    context = new_context(*args, **kwargs)
+    with work_in(context.source.directory):
+        sources = get_import_sources(context.data.raw_input)
+        fetched = fetch_remote_sources(sources)
+    for source, directory in fetched.items():
+        version = source.version or ('latest' if source.latest else 'release')
+        print(f"{source.src}@{version} -> {directory}")
+
+
 def main(raw_args=None):
     """Main cli entrypoint."""
     if raw_args is None:
         raw_args = sys.argv[1:]
+        if '--daemon' not in raw_args:
+            # Hand the call off to a running daemon otherwise run in process. Only the
+            # client is imported until here.
+            from tackle.daemon import run_client
+
+            exit_code = run_client(argv=raw_args)
+            if exit_code is not None:
+                sys.exit(exit_code)
+    import_runtime()
 
     parser = argparse.ArgumentParser(
         description="tackle is a DSL for creating declarative CLIs. Call tackle "
@@ -162,6 +224,28 @@ def main(raw_args=None):
         metavar="",
         help="The format to print to output. Defaults to json.",
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Bypass the cache of parsed tackle files.",
+    )
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help="Clear the cache of parsed tackle files before running.",
+    )
+    parser.add_argument(
+        '--fetch',
+        action='store_true',
+        help="Fetch the remote providers imported in the source in parallel without "
+        "running it.",
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help="Run a daemon which keeps a warm runtime that subsequent calls are "
+        "forwarded to. Calls are run in process when no daemon is running.",
+    )
     parser.add_argument('--version', action='version', version=f'tackle {__version__}')
 
     # Decompose args. Unknown args are passed in to be consumed by the tackle script.
@@ -216,6 +300,27 @@ def main(raw_args=None):
         debug_file=getattr(args, "debug_file", None),
     )
 
+    if args.daemon:
+        serve()
+        return
+
+    if args.clear_cache:
+        clear_tackle_file_cache()
+    if args.no_cache:
+        settings.file_cache = False
+
+    if args.fetch:
+        fetch(
+            *input_args,
+            checkout=args.checkout,
+            latest=args.latest,
+            file=args.file,
+            directory=args.directory,
+            find_in_parent=args.find_in_parent,
+            **input_kwargs,
+        )
+        return
+
     context = tackle(
         *input_args,
         **input_kwargs,
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import warnings
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Mapping
 
 from jinja2 import StrictUndefined
 from jinja2.nativetypes import NativeEnvironment
 from jinja2.nativetypes import NativeEnvironment as Environment
 
 from tackle.models import GenericHookType
+from tackle.scopes import merge_frames
 from tackle.types import DocumentObjectType, DocumentType
 
+if TYPE_CHECKING:
+    from tackle.utils.data_crud import WriteCursor
+    from tackle.utils.file_cache import CachedTackleFile
 
-@dataclass
+
+@dataclass(slots=True)
 class Source:
     input_string: str | None = None
     checkout: str | None = None
@@ -25,7 +32,7 @@ class Source:
     raw: dict | list = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Data:
     input: DocumentType | None = None
     raw_input: DocumentType | None = None
@@ -34,19 +41,36 @@ class Data:
     hooks_input: DocumentObjectType | None = None
     public: DocumentType | None = None
     private: DocumentType | None = None
-    temporary: DocumentType | None = None
     existing: DocumentObjectType | None = None
     overrides: DocumentObjectType | None = None
-
-
-@dataclass
+    # Variables scoped to part of a document (ie loop variables) which take precedence
+    # over the other namespaces when rendering. See `tackle.scopes`.
+    frames: list[dict] = field(default_factory=list)
+    # Set when the raw_input was read from a tackle file with the file cache enabled
+    cached_file: CachedTackleFile | None = None
+
+    @property
+    def temporary(self) -> dict:
+        """
+        Deprecated read-only view of the values in the frames which used to be copied
+         into a `temporary` namespace. Use `frames` instead.
+        """
+        warnings.warn(
+            "`Data.temporary` is deprecated, use `Data.frames` instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return merge_frames(self)
+
+
+@dataclass(slots=True)
 class Paths:
     current: Source = None
     calling: Source = None
     tackle: Source = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InputArguments:
     args: list = None
     kwargs: dict = None
@@ -63,14 +87,14 @@ class StrictEnvironment(Environment):
         super(StrictEnvironment, self).__init__(undefined=StrictUndefined, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class HookMethods:
     public: dict[GenericHookType] = None
     private: dict[GenericHookType] = None
     default: dict = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Hooks:
     """Collection of hooks to call. Kept generic to break circular dependency."""
 
@@ -78,9 +102,12 @@ class Hooks:
     private: dict[str, 'GenericHookType'] = None
     native: dict[str, 'GenericHookType'] = None
     default: dict = None
+    # Declarative hooks compiled from the public / private hooks keyed on the hook's
+    # name and input fingerprint. Cleared whenever those namespaces are updated.
+    compiled: dict[tuple, 'GenericHookType'] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     """Main container for all data passed through tackle."""
 
@@ -95,6 +122,12 @@ class Context:
     # An indexed version of the key path used within blocks to maintain temporary
     # data for rendering. See [docs]()
     key_path_block: list = None
+    # The scope frame of the current block which references the values set within it
+    # (indexed from the key_path_block) so they can be rendered by later items.
+    block_frame: dict | None = None
+    # References to the containers along the key path in the public / private data so
+    # values can be set without walking down from the root. Built on the first write.
+    write_cursor: WriteCursor | None = None
 
     # Internal data objects
     input: InputArguments | None = None
@@ -108,3 +141,54 @@ class Context:
     # Hold the environment in the context
     # env_: Environment = StrictEnvironment()
     env_: Environment = NativeEnvironment(undefined=StrictUndefined)
+
+    def child(self, existing_data: Mapping | None = None) -> Context:
+        """
+        Create a context to evaluate part of a document in (ie a declarative hook's
+         body, field default factories, and validators) with its own data. Inherits
+         the source, paths, hooks, and environment instead of discovering / reading /
+         importing them again so that it never touches the filesystem. The existing
+         data is only read so it can be an overlay on this context's data (ie a
+         `ChainMap`) instead of a copy.
+        """
+        return Context(
+            no_input=self.no_input,
+            verbose=self.verbose,
+            key_path=[],
+            key_path_block=[],
+            input=InputArguments(args=[], kwargs={}),
+            source=self.source,
+            hooks=self.hooks,
+            data=Data(
+                raw_input={},
+                public={},
+                private={},
+                existing=existing_data if existing_data is not None else {},
+                overrides={},
+            ),
+            path=Paths(
+                current=self.source,
+                calling=self.path.current,
+                tackle=self.source,
+            ),
+            env_=self.env_,
+        )
+
+    def fork(self, block_frame: dict | None = None) -> Context:
+        """
+        Create a context sharing this context's data to parse an indented part of the
+         document in (ie the items of a block) which is indexed from the current key.
+         Values set within it are referenced in the `block_frame` (see `tackle.scopes`).
+        """
+        return Context(
+            no_input=self.no_input,
+            verbose=self.verbose,
+            key_path=self.key_path.copy(),
+            key_path_block=self.key_path.copy(),
+            block_frame=block_frame,
+            source=self.source,
+            hooks=self.hooks,
+            data=self.data,
+            path=self.path,
+            env_=self.env_,
+        )
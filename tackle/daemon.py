@@ -0,0 +1,352 @@
+"""
+Daemon mode which keeps a warm runtime around for CLI calls. The daemon imports the
+ native providers once and then forks a child per request so that each call gets its
+ own `Context`, working directory, environment and stdio (passed over a unix socket)
+ while reusing everything that was already imported / compiled in the parent.
+
+Before forking, the declarative hooks and templates of the tackle file / hooks in the
+ directory the daemon is started in are compiled in the parent. Compiled hooks are
+ only used by calls whose public / private hooks are unchanged (see
+ `tackle.hooks.warm_compiled_hooks`). Anything else cached while running a call is
+ cached in the child and discarded when it exits.
+
+Start with `tackle --daemon`. When no daemon is running, the CLI runs in process. The
+ client side (`run_client`) only uses the standard library so that forwarding a call
+ does not import the runtime.
+"""
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import traceback
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tackle.context import Context
+
+logger = logging.getLogger(__name__)
+
+STDIO_FDS = (0, 1, 2)
+
+
+def _send_message(sock: socket.socket, message: dict, fds: list[int] = None):
+    """Send a newline terminated json message, optionally with file descriptors."""
+    data = json.dumps(message).encode() + b'\n'
+    if fds:
+        sent = socket.send_fds(sock, [data], fds)
+        data = data[sent:]
+    sock.sendall(data)
+
+
+def _recv_message(sock: socket.socket, maxfds: int = 0) -> tuple[dict | None, list]:
+    """Receive a newline terminated json message. Returns None if the peer hung up."""
+    fds = []
+    if maxfds:
+        data, fds, _, _ = socket.recv_fds(sock, 65536, maxfds)
+    else:
+        data = sock.recv(65536)
+    while data and not data.endswith(b'\n'):
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    if not data.endswith(b'\n'):
+        return None, fds
+    return json.loads(data), fds
+
+
+def is_supported() -> bool:
+    """The daemon relies on forking and passing file descriptors over unix sockets."""
+    return hasattr(socket, 'AF_UNIX') and hasattr(socket, 'send_fds')
+
+
+def _get_stdio_fds() -> list[int]:
+    """Get the client's stdio file descriptors, subbing in devnull for closed ones."""
+    fds = []
+    for fd in STDIO_FDS:
+        try:
+            os.fstat(fd)
+        except OSError:
+            fd = os.open(os.devnull, os.O_RDWR)
+        fds.append(fd)
+    return fds
+
+
+def get_client_socket() -> str:
+    """
+    Get the socket to forward calls to without resolving the settings (ie importing
+     pydantic). Same as the default `daemon_socket` setting which the client only reads
+     from the `TACKLE_DAEMON_SOCKET` env var, not the config file.
+    """
+    socket_path = os.environ.get('TACKLE_DAEMON_SOCKET')
+    if socket_path:
+        return socket_path
+    # Same as xdg's config home
+    config_home = os.environ.get('XDG_CONFIG_HOME', '')
+    if not os.path.isabs(config_home):
+        config_home = os.path.join(os.path.expanduser('~'), '.config')
+    return os.path.join(config_home, 'tackle', 'daemon.sock')
+
+
+def run_client(argv: list[str], socket_path: str = None) -> int | None:
+    """
+    Forward a CLI call to a running daemon and return the exit code. Returns None when
+     no daemon could take the request so that the caller can run it in process.
+    """
+    if socket_path is None:
+        socket_path = get_client_socket()
+    if not is_supported() or not os.path.exists(socket_path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        _send_message(
+            sock,
+            {'argv': argv, 'cwd': os.getcwd(), 'env': dict(os.environ)},
+            fds=_get_stdio_fds(),
+        )
+        response, _ = _recv_message(sock)
+    except OSError:
+        sock.close()
+        return None
+    if response is None:
+        # Daemon hung up before running anything
+        sock.close()
+        return None
+
+    # Forward signals (ie ctrl-c) to the process running the call
+    pid = response['pid']
+
+    def forward_signal(signum, frame):
+        os.kill(pid, signum)
+
+    handlers = {
+        signum: signal.signal(signum, forward_signal)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        response, _ = _recv_message(sock)
+    finally:
+        sock.close()
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    if response is None:
+        return 1
+    return response['exit_code']
+
+
+def warm_templates(context: 'Context', value: Any, is_hook_call: bool = False):
+    """Compile the templates in a document so that they are in the template cache."""
+    from tackle.parser import parse_hook_string
+    from tackle.render import template_cache
+
+    if isinstance(value, dict):
+        for k, v in value.items():
+            warm_templates(context, v, is_hook_call=str(k)[-2:] in ('->', '_>'))
+    elif isinstance(value, list):
+        for i in value:
+            warm_templates(context, i)
+    elif isinstance(value, str) and ('{{' in value or '{%' in value):
+        raws = [value]
+        try:
+            if is_hook_call:
+                # The args / kwargs of hook calls are rendered on their own or with
+                #  the remaining args joined (ie `var Hello {{name}}`)
+                args, kwargs, _ = parse_hook_string(value)
+                raws += [*args[1:], *(v for _, v in kwargs)]
+                if all(isinstance(i, str) for i in args[1:]):
+                    raws.append(' '.join(args[1:]))
+            for raw in raws:
+                if isinstance(raw, str) and ('{{' in raw or '{%' in raw):
+                    template_cache.get(context.env_, raw)
+        except Exception as e:  # noqa - Raised again when the call renders it
+            logger.debug(f"Could not compile the template `{value}` - {e}")
+
+
+def warm_directory(directory: str):
+    """
+    Compile the declarative hooks and templates of the tackle file / hooks in a
+     directory. The file is only split into its hooks and inputs so nothing is called.
+    """
+    from tackle.factory import new_context
+    from tackle.hooks import warm_compiled_dcl_hooks
+    from tackle.models import LazyBaseHook
+    from tackle.parser import split_input_data
+    from tackle.utils.paths import work_in
+
+    with work_in(directory):
+        context = new_context()
+        split_input_data(context=context)
+    warm_compiled_dcl_hooks(context=context)
+    warm_templates(context, context.data.pre_input)
+    warm_templates(context, context.data.post_input)
+    for hook_space in (context.hooks.public, context.hooks.private):
+        for Hook in hook_space.values():
+            if isinstance(Hook, LazyBaseHook):
+                warm_templates(context, Hook.input_raw)
+
+
+def warm_runtime(directory: str = None):
+    """
+    Import everything that is shared between calls before forking along with compiling
+     the hooks / templates of a directory (ie the one the daemon was started in).
+    """
+    from tackle.context import Context, Hooks
+    from tackle.imports import import_lazy_hook, import_native_providers
+    from tackle.models import LazyImportHook
+
+    native_hooks = import_native_providers()
+    context = Context(hooks=Hooks(native=native_hooks))
+    for hook_name, Hook in native_hooks.items():
+        if isinstance(Hook, LazyImportHook):
+            native_hooks[hook_name] = import_lazy_hook(context=context, hook=Hook)
+
+    if directory is not None:
+        try:
+            warm_directory(directory)
+        except Exception as e:  # noqa - Calls are still run, just not as warm
+            logger.debug(f"Could not warm the hooks / templates in {directory} - {e}")
+
+
+def _reload_settings():
+    """Update the settings in place in case the client has different `TACKLE_` vars."""
+    from tackle.settings import Settings, settings, update_settings
+
+    new_settings = Settings()
+    update_settings(settings=new_settings)
+    for k in Settings.model_fields:
+        setattr(settings, k, getattr(new_settings, k))
+
+
+def _run_cli(argv: list[str]) -> int:
+    """Run the CLI and return an exit code the same way the interpreter would."""
+    from tackle.cli import main
+
+    try:
+        main(argv)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except BaseException:  # noqa
+        sys.excepthook(*sys.exc_info())
+        return 1
+    return 0
+
+
+def _run_request(conn: socket.socket, request: dict, fds: list[int]):
+    """Run a request within the forked child. Never returns."""
+    exit_code = 1
+    try:
+        _send_message(conn, {'pid': os.getpid()})
+        for target, fd in zip(STDIO_FDS, fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, 'r', closefd=False)
+        sys.stdout = open(1, 'w', closefd=False)
+        sys.stderr = open(2, 'w', closefd=False)
+        sys.argv = ['tackle'] + request['argv']
+
+        tackle_env = {k: v for k, v in os.environ.items() if k.startswith('TACKLE_')}
+        os.environ.clear()
+        os.environ.update(request['env'])
+        os.chdir(request['cwd'])
+        if tackle_env != {
+            k: v for k, v in os.environ.items() if k.startswith('TACKLE_')
+        }:
+            _reload_settings()
+
+        exit_code = _run_cli(request['argv'])
+    except BaseException:  # noqa
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            _send_message(conn, {'exit_code': exit_code})
+        finally:
+            os._exit(exit_code)
+
+
+def run_ping(socket_path: str) -> bool:
+    """Check if a daemon is listening on the socket."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        _send_message(sock, {'ping': True})
+    except OSError:
+        return False
+    finally:
+        sock.close()
+    return True
+
+
+def serve(socket_path: str = None):
+    """Run the daemon in the foreground, forking a child for each call."""
+    from tackle import exceptions
+    from tackle.settings import settings
+
+    if socket_path is None:
+        socket_path = settings.daemon_socket
+    if not is_supported():
+        raise exceptions.DaemonException(
+            "The tackle daemon is not supported on this platform."
+        )
+    if os.path.exists(socket_path):
+        if run_ping(socket_path):
+            raise exceptions.DaemonException(
+                f"The tackle daemon is already running at `{socket_path}`."
+            )
+        os.unlink(socket_path)  # Stale socket from a daemon that was killed
+
+    warm_runtime(directory=os.getcwd())
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Only the user running the daemon should be able to connect to it
+    umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(umask)
+    server.listen()
+    # Children are reaped automatically
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    logger.info(f"Tackle daemon listening on {socket_path}")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            try:
+                request, fds = _recv_message(conn, maxfds=len(STDIO_FDS))
+            except OSError:
+                conn.close()
+                continue
+            if request is None or 'argv' not in request:
+                # Pings and broken requests
+                for fd in fds:
+                    os.close(fd)
+                conn.close()
+                continue
+
+            if os.fork() == 0:
+                server.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.default_int_handler)
+                _run_request(conn=conn, request=request, fds=fds)
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -4,10 +4,12 @@ import inspect
 from inspect import currentframe, signature, Parameter
 from typing import Any, Callable, TypeVar, overload
 
-from tackle.imports import PyImportContext
-from tackle.models import BaseHook, HookCallInput
+from tackle.models import BaseHook, HookCall, HookCallInput
 from tackle.pydantic.create_model import create_model
-from tackle import Context
+
+# Same as `tackle.imports.PY_IMPORT_CONTEXT_KEY` which is not imported so that defining
+#  a hook does not import the parser.
+PY_IMPORT_CONTEXT_KEY = '__py_import_context'
 
 T = TypeVar("T", bound=Callable[..., Any])
 
@@ -26,7 +28,7 @@ def _importing_module_globals() -> dict[str, Any] | None:
     f = currentframe()
     while f:
         g = f.f_globals
-        if PyImportContext.key in g:
+        if PY_IMPORT_CONTEXT_KEY in g:
             return g
         f = f.f_back
     return None
@@ -48,7 +50,7 @@ def public(func: T) -> T:
     else:
         g = _importing_module_globals()
         if g:
-            ctx = g[PyImportContext.key]
+            ctx = g[PY_IMPORT_CONTEXT_KEY]
             name0, name1 = func.__qualname__.split(".", 1)
             ctx.public_hook_methods.setdefault(name0, []).append(name1)
     return func
@@ -58,7 +60,7 @@ def private(func: T) -> T:
     if not _is_hook_or_method(func):
         g = _importing_module_globals()
         if g:
-            ctx = g[PyImportContext.key]
+            ctx = g[PY_IMPORT_CONTEXT_KEY]
             name0, name1 = func.__qualname__.split(".", 1)
             ctx.private_hook_methods.setdefault(name0, []).append(name1)
     return func
@@ -71,14 +73,19 @@ def _build_hook_from_func(
     name: str | None,
     help: str | None,
 ) -> type[BaseHook]:
+    # Imported here so that defining a hook does not import the runtime
+    from tackle.context import Context
+
     fn = name or func.__name__
     sig = signature(func)
 
     injectable = {
         Context: lambda ctx, _: ctx,
         HookCallInput: lambda _, hc: hc,
+        HookCall: lambda _, hc: hc,
         "Context": lambda ctx, _: ctx,
         "HookCallInput": lambda _, hc: hc,
+        "HookCall": lambda _, hc: hc,
     }
 
     std_params: list[str] = []
@@ -121,7 +128,7 @@ def _build_hook_from_func(
         for pn, ann in inj_params.items():
             if ann in (Context, "Context"):
                 kwargs[pn] = context
-            elif ann in (HookCallInput, "HookCallInput"):
+            elif ann in (HookCallInput, HookCall, "HookCallInput", "HookCall"):
                 kwargs[pn] = hook_call
             else:
                 raise RuntimeError(f"Unsupported injectable: {ann}")
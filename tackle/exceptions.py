@@ -515,6 +515,24 @@ class InvalidZipRepository(GeneralException):
     """
 
 
+class DaemonException(GeneralException):
+    """
+    Exception for the tackle daemon.
+
+    Raised when the daemon can't be started, ie is already running or the platform does
+     not support unix sockets.
+    """
+
+
+class FileLockTimeout(GeneralException):
+    """
+    Exception when waiting for a file lock times out.
+
+    Raised when another process holds a lock (ie while cloning a provider) for longer
+     than the timeout.
+    """
+
+
 #
 # Function create exceptions
 #
@@ -8,8 +8,6 @@ from copy import copy
 from pathlib import Path
 from typing import Optional, Union
 
-from ruyaml.parser import ParserError
-
 from tackle import exceptions
 from tackle.context import Context, Data, Hooks, InputArguments, Paths, Source
 from tackle.imports import (
@@ -18,6 +16,14 @@ from tackle.imports import (
     import_with_fallback_install,
 )
 from tackle.settings import settings
+from tackle.utils.file_cache import (
+    CachedTackleFile,
+    get_content_hash,
+    get_tackle_file_cache_key,
+    is_racy_cached_file,
+    read_cached_tackle_file,
+    refresh_cached_tackle_file,
+)
 from tackle.utils.files import read_config_file
 from tackle.utils.paths import (
     find_hooks_dir_from_tests,
@@ -30,6 +36,7 @@ from tackle.utils.paths import (
     is_repo_url,
 )
 from tackle.utils.vcs import get_repo_source
+from tackle.utils.yaml_loaders import YAML_PARSER_ERRORS
 from tackle.utils.zipfiles import unzip
 
 
@@ -86,18 +93,46 @@ def create_hooks(
         )
 
 
-def extract_base_file(context: 'Context') -> list | dict:
-    """Read the tackle file and initialize input_context."""
+def extract_base_file(context: 'Context', data: Data) -> list | dict:
+    """
+    Read the tackle file and initialize input_context. When the file cache is enabled,
+     the parsed file is read from the cache or otherwise a cache entry is started which
+     is written once the input is split in `tackle.parser.split_input_data`.
+    """
     if context.source.file:
+        content = None
+        if settings.file_cache:
+            stat = os.stat(context.source.file)
+            key = get_tackle_file_cache_key(context.source.file, stat=stat)
+            cached_file = read_cached_tackle_file(key)
+            if cached_file is not None and not is_racy_cached_file(cached_file, stat):
+                data.cached_file = cached_file
+                return cached_file.raw_input
+            # Read once to both hash and parse it
+            with open(context.source.file, 'rb') as f:
+                content = f.read()
+            content_hash = get_content_hash(content)
+            if cached_file is not None and cached_file.content_hash == content_hash:
+                # Checked so can be trusted from now on
+                refresh_cached_tackle_file(cached_file)
+                data.cached_file = cached_file
+                return cached_file.raw_input
+            content = content.decode('utf-8')
         try:
-            raw_input = read_config_file(context.source.file)
-        except ParserError as e:
+            raw_input = read_config_file(context.source.file, content=content)
+        except YAML_PARSER_ERRORS as e:
             raise exceptions.TackleFileInitialParsingException(e) from None  # noqa
         if raw_input is None:
             raise exceptions.EmptyTackleFileException(
                 f"Tackle file found at {os.path.join(context.source.directory)} is empty.",
                 context=context,
             ) from None
+        if settings.file_cache:
+            data.cached_file = CachedTackleFile(
+                key=key,
+                raw_input=raw_input,
+                content_hash=content_hash,
+            )
     else:
         raw_input = {}
     return raw_input
@@ -189,11 +224,14 @@ def new_data(
         # Wipe the public data as we don't know the type yet -> ie list or dict
         data.public = None
         data.private = None
+        # Frames (ie loop variables) were scoped to the parent's document
+        data.frames = []
 
     get_overrides(context=context, data=data, overrides=overrides)
 
+    data.cached_file = None
     if raw_input is None:
-        data.raw_input = extract_base_file(context=context)
+        data.raw_input = extract_base_file(context=context, data=data)
     else:
         data.raw_input = raw_input
 
@@ -0,0 +1,217 @@
+"""
+Per hook class call plans. Everything the parser needs to know about a hook's class to
+ call it (ie which keys are fields, how each field is rendered, how args map to fields,
+ and what to inject into the exec method) is derived once from the class and cached
+ here so that calling the same hook repeatedly (ie in a loop) is only dict lookups.
+"""
+import inspect
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
+from weakref import WeakKeyDictionary
+
+from tackle import exceptions
+from tackle.context import Context
+from tackle.models import BaseHook, CompiledHookType, HookCall, HookCallInput
+
+# Render policies for the keys in a hook call
+RENDER = 'render'
+RENDER_BY_DEFAULT = 'render_by_default'
+RENDER_EXCLUDE = 'render_exclude'
+
+# Params injected into a hook's exec method
+INJECT_CONTEXT = 'context'
+INJECT_HOOK_CALL = 'hook_call'
+
+# Hook calls are passed as a `HookCall` which has the same attributes as the model
+HOOK_CALL_TYPES = (HookCall, HookCallInput, 'HookCall', 'HookCallInput')
+
+BASE_HOOK_FIELDS = frozenset(BaseHook.model_fields.keys())
+
+
+@dataclass(frozen=True)
+class HookPlan:
+    # Render policy for each field name and alias that can be given in a hook call
+    key_render_policies: Mapping[str, str]
+    # The field names that positional args are mapped to, in order
+    args: tuple[str, ...]
+    # The annotation of the last arg which determines how remaining args are joined
+    last_arg_annotation: Any
+    # The field that extra kwargs are mapped to
+    kwargs_field: str | None
+    kwargs_field_is_dict: bool
+    allow_extra: bool
+    # The (param name, injected object) of the exec method or None if no exec method
+    exec_params: tuple[tuple[str, str], ...] | None
+
+
+_hook_plans: 'WeakKeyDictionary[type, HookPlan]' = WeakKeyDictionary()
+
+
+def get_hook_level_render_var(
+    context: 'Context',
+    Hook: CompiledHookType,
+    render_var: str,
+) -> list[str]:
+    """Getter for both hook level `render_by_default` and `render_exclude` variables."""
+    render_var_value = Hook.model_fields[render_var].default
+    if render_var_value:
+        # We need manually validate this here as Hook is not instantiated
+        if isinstance(render_var_value, list):
+            for i in render_var_value:
+                if i not in Hook.model_fields:
+                    raise exceptions.MalformedHookDefinitionException(
+                        f'The values in the field=`{render_var}` need to be names of '
+                        f'fields. Got `{i}` which is not as field name.',
+                        context=context,
+                        hook_name=Hook.hook_name,
+                    )
+            return render_var_value
+        else:
+            raise exceptions.MalformedHookDefinitionException(
+                f"The `{render_var}` field must be a list of field names.",
+                context=context,
+                hook_name=Hook.hook_name,
+            )
+    return []
+
+
+def get_field_level_render_var(
+    context: 'Context',
+    Hook: CompiledHookType,
+    hook_key: str,
+    render_var: str,
+) -> bool:
+    # Need to check for this field in the `json_schema_extra`
+    json_schema_extra = Hook.model_fields[hook_key].json_schema_extra
+    if isinstance(json_schema_extra, dict) and render_var in json_schema_extra:
+        if not isinstance(json_schema_extra[render_var], bool):
+            raise exceptions.MalformedHookDefinitionException(
+                f"The `{render_var}` field in key=`{hook_key}` must be a boolean.",
+                context=context,
+                hook_name=Hook.hook_name,
+            )
+        return json_schema_extra[render_var]
+    return False
+
+
+def get_key_render_policies(
+    context: 'Context',
+    Hook: CompiledHookType,
+) -> dict[str, str]:
+    """
+    Get how each key (field name or alias) in a hook call is rendered. Hook level
+     `render_exclude` / `render_by_default` take precedence over the field level ones.
+    """
+    hook_render_exclude = get_hook_level_render_var(context, Hook, 'render_exclude')
+    hook_render_by_default = get_hook_level_render_var(
+        context, Hook, 'render_by_default'
+    )
+
+    key_render_policies = {}
+    for field_name, field_info in Hook.model_fields.items():
+        if get_field_level_render_var(context, Hook, field_name, 'render_by_default'):
+            field_policy = RENDER_BY_DEFAULT
+        elif get_field_level_render_var(context, Hook, field_name, 'render_exclude'):
+            field_policy = RENDER_EXCLUDE
+        else:
+            field_policy = RENDER
+
+        keys = [field_name]
+        if field_info.alias is not None:
+            keys.append(field_info.alias)
+        for key in keys:
+            if key in hook_render_exclude:
+                key_render_policies[key] = RENDER_EXCLUDE
+            elif key in hook_render_by_default:
+                key_render_policies[key] = RENDER_BY_DEFAULT
+            else:
+                key_render_policies[key] = field_policy
+    return key_render_policies
+
+
+def get_exec_params(
+    context: 'Context',
+    Hook: CompiledHookType,
+) -> tuple[tuple[str, str], ...] | None:
+    """
+    Get the params to inject into the hook's exec method based on their type, ie
+     `def exec(self, context: Context)`. Returns None when there is no exec method.
+    """
+    if not hasattr(Hook, 'exec'):
+        return None
+    # Accessed from the class so the first param is `self`
+    parameters = list(inspect.signature(Hook.exec).parameters.items())[1:]
+
+    exec_params = []
+    for k, v in parameters:
+        param_type = v.annotation
+        # Types can sometimes be in quotes - ie def exec(self, context: 'Context')
+        if param_type is Context or param_type == 'Context':
+            exec_params.append((k, INJECT_CONTEXT))
+        elif param_type in HOOK_CALL_TYPES:
+            exec_params.append((k, INJECT_HOOK_CALL))
+        else:
+            raise exceptions.MalformedHookDefinitionException(
+                f"The exec method in hook={Hook.hook_name} has an unknown "
+                f"parameter={k} with type={v} which is not supported. Only params of "
+                f"type `Context` and `HookCallInput` are supported.",
+                context=context,
+                hook_name=Hook.hook_name,
+            )
+    return tuple(exec_params)
+
+
+def validate_base_fields(context: 'Context', Hook: CompiledHookType):
+    """Check that any of the BaseHook's fields the hook overrides keep their type."""
+    for k, v in BaseHook.model_fields.items():
+        if k in Hook.model_fields:
+            if Hook.model_fields[k].annotation != v.annotation:
+                hook_type = Hook.model_fields[k].annotation
+                raise exceptions.MalformedHookDefinitionException(
+                    f"The field name=`{k}` of type={hook_type} is not the "
+                    f"same type as the BaseHook's type=`{v.annotation}`. Exiting...",
+                    context=context,
+                    hook_name=Hook.hook_name,
+                )
+
+
+def create_hook_plan(context: 'Context', Hook: CompiledHookType) -> HookPlan:
+    validate_base_fields(context, Hook)
+
+    args = tuple(Hook.model_fields['args'].default or ())
+    last_arg_annotation = None
+    if args and args[-1] in Hook.model_fields:
+        last_arg_annotation = Hook.model_fields[args[-1]].annotation
+
+    kwargs_field = Hook.model_fields['kwargs'].default
+    kwargs_field_is_dict = (
+        kwargs_field in Hook.model_fields
+        and Hook.model_fields[kwargs_field].annotation == dict
+    )
+
+    return HookPlan(
+        key_render_policies=MappingProxyType(get_key_render_policies(context, Hook)),
+        args=args,
+        last_arg_annotation=last_arg_annotation,
+        kwargs_field=kwargs_field,
+        kwargs_field_is_dict=kwargs_field_is_dict,
+        allow_extra=Hook.model_config.get('extra') in ['allow', 'ignore'],
+        exec_params=get_exec_params(context, Hook),
+    )
+
+
+def get_hook_plan(context: 'Context', Hook: CompiledHookType) -> HookPlan:
+    """
+    Get the call plan of a hook class, creating it the first time the class is used.
+     Plans are dropped along with their class. Malformed hooks raise every time.
+    """
+    hook_plan = _hook_plans.get(Hook)
+    if hook_plan is None:
+        hook_plan = _hook_plans[Hook] = create_hook_plan(context, Hook)
+    return hook_plan
+
+
+def clear_hook_plan(Hook: CompiledHookType):
+    """Drop the plan of a hook class after it has been modified, ie its exec method."""
+    _hook_plans.pop(Hook, None)
@@ -1,10 +1,13 @@
 import datetime as datetime_types
 import enum
+import inspect
 import ipaddress as ipaddress_types
+import os
 import pydoc
 import re
 import typing
 import typing as typing_types
+from collections import ChainMap
 from copy import deepcopy
 from functools import partial, partialmethod
 from typing import Annotated, Any, Callable, Optional, Type, TypeVar, Union
@@ -23,7 +26,8 @@ from pydantic import types as pydantic_types
 from pydantic.fields import FieldInfo
 
 from tackle import Context, exceptions
-from tackle.factory import new_context_from_context
+from tackle.hook_plan import get_hook_plan
+from tackle.imports import import_lazy_hook
 from tackle.macros.hook_macros import hook_macros
 from tackle.models import (
     AnyHookType,
@@ -32,12 +36,13 @@ from tackle.models import (
     DclHookInput,
     HookFieldValidator,
     LazyBaseHook,
+    LazyImportHook,
 )
 from tackle.pydantic.config import DclHookModelConfig
 from tackle.pydantic.create_model import create_model
 from tackle.pydantic.field_types import FieldInput
 from tackle.render import render_variable
-from tackle.types import DocumentType, DocumentValueType
+from tackle.types import DEFAULT_HOOK_NAME, DocumentType, DocumentValueType
 from tackle.utils.render import wrap_jinja_braces
 
 
@@ -46,7 +51,7 @@ def parse_tmp_context(context: 'Context', element: Any, existing_context: dict):
     Parse an arbitrary element. Only used for declarative hook field defaults and in
      the `run_hook` hook in the tackle provider.
     """
-    tmp_context = new_context_from_context(context=context)
+    tmp_context = context.child()
     tmp_context.key_path = ['->']
     tmp_context.key_path_block = ['->']
 
@@ -72,12 +77,14 @@ def dcl_hook_exec(
     elif not isinstance(input_element, (list, dict)):
         input_element = {'returns->': input_element}
 
-    # We have exec data so we need to parse that which will be the return of the hook
+    # We have exec data so we need to parse that which will be the return of the hook.
+    # The caller's public data is read through an overlay with the hook's fields on top
+    # so that none of it is copied.
+    hook_fields = {}
     if context.data.public and isinstance(context.data.public, dict):
-        # Move the public data to an existing context
-        existing_data = context.data.public.copy()
+        existing_data = ChainMap(hook_fields, context.data.public)
     else:
-        existing_data = {}
+        existing_data = ChainMap(hook_fields)
 
     for field in hook.hook_field_set:
         value = hook.model_fields[field]
@@ -89,7 +96,7 @@ def dcl_hook_exec(
                 element={field: value},
                 existing_context=existing_data,
             )
-            existing_data.update(output)
+            hook_fields.update(output)
             try:
                 input_element[field] = output[field]
             except KeyError:
@@ -101,15 +108,9 @@ def dcl_hook_exec(
                 ) from None
         else:
             # Otherwise just the value itself
-            existing_data.update({field: getattr(hook, field)})
+            hook_fields[field] = getattr(hook, field)
 
-    hook_context = new_context_from_context(
-        context=context,
-        existing_data=existing_data,
-        # Pass the source and hooks because we are still in the same file
-        _hooks=context.hooks,
-        _source=context.source,
-    )
+    hook_context = context.child(existing_data=existing_data)
 
     tmp_key = None
     if isinstance(input_element, dict):
@@ -378,7 +379,7 @@ def create_validator_field_type(
         info: ValidationInfo,
     ):
         # Inject the field names and values into existing context
-        tmp_context = new_context_from_context(context=context)
+        tmp_context = context.child()
         tmp_context.data.existing[hook_validator.field_names.value] = v
         if hook_validator.field_names.value == 'v':
             # The default is `v` but it is easier to just think of it as the field name
@@ -386,7 +387,10 @@ def create_validator_field_type(
         tmp_context.data.existing[hook_validator.field_names.info] = info.data
 
         # Walk the body and return the public data
-        return get_public_data_from_walk(context=tmp_context, value=hook_validator.body)
+        return get_public_data_from_walk(
+            context=tmp_context,
+            value=deepcopy(hook_validator.body),
+        )
 
     if hook_validator.mode == 'before':
         ValidatorType = BeforeValidator
@@ -480,6 +484,18 @@ def get_public_data_from_walk(context: 'Context', value: DocumentType) -> Docume
     return context.data.public
 
 
+def get_public_data_from_default_factory(
+    context: 'Context',
+    default_factory: DocumentType,
+) -> DocumentType:
+    """
+    Walk a field's default_factory in a new context so that it is evaluated on each call
+     of a hook even though the hook is only compiled once.
+    """
+    tmp_context = context.child()
+    return get_public_data_from_walk(tmp_context, deepcopy(default_factory))
+
+
 def create_default_factory(
     context: Context,
     hook_name: str,
@@ -505,13 +521,8 @@ def create_default_factory(
 
     # Create a callable from a dict which walks the data and returns the public data
     # from execution. Is used in default_factory which expects a callable with no args.
-    tmp_context = new_context_from_context(
-        context=context,
-        _hooks=context.hooks,
-        _source=context.source,
-    )
     value['default_factory'] = partial(
-        get_public_data_from_walk, tmp_context, default_factory
+        get_public_data_from_default_factory, context, default_factory
     )
 
 
@@ -819,19 +830,21 @@ def create_dcl_method(
     """Upgrade a declarative hook method."""
     # method_raw will still have the arrow as the first key
     method = Hook.model_fields[arg].default
+    # Copied as the hook is compiled once and compiling the method modifies the input
+    method_input_raw = deepcopy(method.input_raw)
 
     # Update method with values from base class so that fields can be inherited
     # from the base hook. function_fields is a list of those fields that aren't
     # methods / special vars (ie args, return, etc).
     for i in Hook.model_fields['hook_field_set'].default:
         # Base method should not override child.
-        if i not in method.input_raw:
-            method.input_raw[i] = Hook.model_fields[i]
+        if i not in method_input_raw:
+            method_input_raw[i] = Hook.model_fields[i]
 
     return create_dcl_hook(
         context=context,
         hook_name=arg,
-        hook_input_raw=method.input_raw,
+        hook_input_raw=method_input_raw,
     )
 
 
@@ -875,6 +888,142 @@ def enrich_hook(
     return Hook
 
 
+FINGERPRINT_SCALAR_TYPES = (
+    str,
+    int,
+    float,
+    bytes,
+    datetime_types.date,
+    datetime_types.time,
+    type(None),
+)
+
+
+def get_input_raw_fingerprint(value: Any) -> tuple | None:
+    """
+    Get a hashable fingerprint of a declarative hook's raw input which includes the
+     types of the values (ie `1` vs `1.0` vs `True`) as they are used to infer a field's
+     type. Returns None if the hook can't be cached, ie when it has objects in it or
+     its compilation depends on the data (templated `enum` fields).
+    """
+    if isinstance(value, dict):
+        if isinstance(value.get('enum'), str):
+            return None
+        items = []
+        for k, v in value.items():
+            v = get_input_raw_fingerprint(v)
+            if v is None:
+                return None
+            items.append((k, v))
+        return type(value), tuple(items)
+    elif isinstance(value, list):
+        items = []
+        for i in value:
+            i = get_input_raw_fingerprint(i)
+            if i is None:
+                return None
+            items.append(i)
+        return type(value), tuple(items)
+    elif isinstance(value, FINGERPRINT_SCALAR_TYPES):
+        return type(value), value
+    return None
+
+
+# Declarative hooks compiled before forking (see `tackle.daemon`) so that they can be
+#  shared between contexts with the same public / private hooks. Keyed on the
+#  fingerprint of those namespaces along with the key of the compiled hook.
+warm_compiled_hooks: dict[tuple, CompiledHookType] = {}
+
+
+def get_namespace_hook_fingerprint(Hook: Any) -> tuple | None:
+    """Fingerprint of a public / private hook which other hooks could be compiled from."""
+    if isinstance(Hook, LazyBaseHook):
+        input_raw = get_input_raw_fingerprint(Hook.input_raw)
+        if input_raw is None:
+            return None
+        return Hook.hook_name, Hook.is_public, input_raw
+    try:
+        # Python hooks are fingerprinted by the file they were imported from
+        file = inspect.getfile(Hook)
+        stat = os.stat(file)
+    except (TypeError, OSError):
+        return None
+    return Hook.__qualname__, file, stat.st_mtime_ns, stat.st_size
+
+
+def get_namespaces_fingerprint(context: 'Context') -> tuple | None:
+    """
+    Fingerprint of the hooks in a context's public / private namespaces and default hook
+     which is all a declarative hook's compilation depends on besides its own input.
+     Returns None if any of the hooks can't be fingerprinted.
+    """
+    fingerprint = []
+    for hook_space in (context.hooks.public, context.hooks.private):
+        for hook_name, Hook in (hook_space or {}).items():
+            hook_fingerprint = get_namespace_hook_fingerprint(Hook)
+            if hook_fingerprint is None:
+                return None
+            fingerprint.append((hook_name, hook_fingerprint))
+    if context.hooks.default is not None:
+        hook_fingerprint = get_namespace_hook_fingerprint(context.hooks.default)
+        if hook_fingerprint is None:
+            return None
+        fingerprint.append((DEFAULT_HOOK_NAME, hook_fingerprint))
+    return tuple(fingerprint)
+
+
+def warm_compiled_dcl_hooks(context: 'Context'):
+    """
+    Compile the declarative hooks in a context's namespaces and keep them in the
+     `warm_compiled_hooks` to be used by other contexts with the same hooks.
+    """
+    namespaces_fingerprint = get_namespaces_fingerprint(context)
+    if namespaces_fingerprint is None:
+        return
+    for hook_space in (context.hooks.public, context.hooks.private):
+        for hook_name, Hook in hook_space.items():
+            if isinstance(Hook, LazyBaseHook):
+                get_compiled_dcl_hook(
+                    context=context, hook_name=hook_name, lazy_hook=Hook
+                )
+    for key, Hook in context.hooks.compiled.items():
+        warm_compiled_hooks[(namespaces_fingerprint, key)] = Hook
+
+
+def get_compiled_dcl_hook(
+    context: 'Context',
+    hook_name: str,
+    lazy_hook: LazyBaseHook,
+) -> CompiledHookType:
+    """
+    Compile a declarative hook or get it from the compiled hooks of the namespace so
+     that calling a hook repeatedly (ie in a loop) does not create a new model each
+     time. Field defaults are still evaluated per call.
+    """
+    fingerprint = get_input_raw_fingerprint(lazy_hook.input_raw)
+    if fingerprint is None:
+        return create_dcl_hook(
+            context=context,
+            hook_name=hook_name,
+            hook_input_raw=deepcopy(lazy_hook.input_raw),
+        )
+
+    key = (hook_name, lazy_hook.is_public, fingerprint)
+    Hook = context.hooks.compiled.get(key)
+    if Hook is None and warm_compiled_hooks:
+        Hook = warm_compiled_hooks.get((get_namespaces_fingerprint(context), key))
+        if Hook is not None:
+            context.hooks.compiled[key] = Hook
+    if Hook is None:
+        Hook = create_dcl_hook(
+            context=context,
+            hook_name=hook_name,
+            hook_input_raw=deepcopy(lazy_hook.input_raw),
+        )
+        context.hooks.compiled[key] = Hook
+    return Hook
+
+
 def get_hooks_from_namespace(
     context: 'Context',
     hook_name: str,
@@ -888,11 +1037,16 @@ def get_hooks_from_namespace(
         Hook = hook_space.get(hook_name, None)
         if Hook is not None:
             if isinstance(Hook, LazyBaseHook):
-                Hook = create_dcl_hook(
+                Hook = get_compiled_dcl_hook(
                     context=context,
                     hook_name=hook_name,
-                    hook_input_raw=deepcopy(Hook.input_raw),
+                    lazy_hook=Hook,
                 )
+            elif isinstance(Hook, LazyImportHook):
+                # Native hooks from the index are imported on first use and then
+                # replaced in the namespace so the import only happens once
+                Hook = import_lazy_hook(context=context, hook=Hook)
+                hook_space[hook_name] = Hook
             return Hook
 
 
@@ -920,16 +1074,6 @@ def get_hook_from_context(
         args=args,
     )
 
-    # Validate the hook
-    for k, v in BaseHook.model_fields.items():
-        if k in Hook.model_fields:
-            if Hook.model_fields[k].annotation != BaseHook.model_fields[k].annotation:
-                hook_type = Hook.model_fields[k].annotation
-                base_hook_type = BaseHook.model_fields[k].annotation
-                raise exceptions.MalformedHookDefinitionException(
-                    f"The field name=`{k}` of type={hook_type} is not the "
-                    f"same type as the BaseHook's type=`{base_hook_type}`. Exiting...",
-                    context=context,
-                    hook_name=hook_name,
-                )
+    # Validates the hook and caches what is needed to call it
+    get_hook_plan(context=context, Hook=Hook)
     return Hook
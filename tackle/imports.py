@@ -1,4 +1,5 @@
 import importlib
+import json
 import logging
 import os
 import subprocess
@@ -11,7 +12,8 @@ from pydantic._internal._model_construction import ModelMetaclass  # noqa
 
 from tackle import exceptions
 from tackle.context import Context
-from tackle.models import BaseHook, GenericHookType
+from tackle.decorators import PY_IMPORT_CONTEXT_KEY
+from tackle.models import BaseHook, GenericHookType, LazyImportHook
 from tackle.settings import settings
 from tackle.utils.files import read_config_file
 from tackle.utils.prompts import confirm_prompt
@@ -21,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 class PyImportContext:
 
-    key = '__py_import_context'
+    key = PY_IMPORT_CONTEXT_KEY
     def __init__(self):
         self.public_hook_methods: dict[str, list[str]] = {}
         self.private_hook_methods: dict[str, list[str]] = {}
@@ -112,13 +114,17 @@ def import_python_hooks_from_file(
         if v.__is_public__:
             if hook_class_name in public_hook_methods:
                 v.__public_methods__ = public_hook_methods[hook_class_name]
-            context.hooks.public[hook_name] = v
+            hook_space = context.hooks.public
         else:
             if hook_class_name in private_hook_methods:
                 v.__private_methods__ = private_hook_methods[hook_class_name]
             if hook_class_name in public_hook_methods:
                 v.__public_methods__ = public_hook_methods[hook_class_name]
-            context.hooks.private[hook_name] = v
+            hook_space = context.hooks.private
+        if hook_space.get(hook_name) is not v:
+            # The hook could be the base / type of compiled declarative hooks
+            context.hooks.compiled.clear()
+        hook_space[hook_name] = v
 
 
 def import_declarative_hooks_from_file(
@@ -221,38 +227,86 @@ def import_native_hooks_from_directory(
     return native_hooks
 
 
+NATIVE_PROVIDERS_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'providers'
+)
+# Index of all the native hooks generated with the `provider_cache_data` hook from the
+# root `hooks` directory. Needs to be regenerated whenever a native hook is added.
+NATIVE_HOOKS_INDEX = os.path.join(NATIVE_PROVIDERS_DIRECTORY, '.native_hooks.json')
+
+
+def import_lazy_hook(
+    context: 'Context',
+    hook: LazyImportHook,
+) -> 'GenericHookType':
+    """
+    Import the module a native hook lives in from an index entry and return the hook.
+     Modules are only executed once so hooks sharing a module reuse the import.
+    """
+    mod = sys.modules.get(hook.module_name, None)
+    if mod is None:
+        mod = get_module_from_path(
+            context=context,
+            module_name=hook.module_name,
+            file_path=os.path.join(NATIVE_PROVIDERS_DIRECTORY, hook.file_path),
+        )
+    Hook = getattr(mod, hook.class_name, None)
+    if not is_base_hook_subclass(key=hook.class_name, value=Hook):
+        raise exceptions.TackleHookImportException(
+            f"The native hooks index is stale, could not find hook "
+            f"`{hook.hook_name}` in `{hook.file_path}`. Regenerate it by running "
+            f"`tackle provider_cache_data --write_index` from the root of tackle.",
+            context=context,
+            file=hook.file_path,
+        )
+    Hook.__provider_name = hook.provider_name
+    return Hook
+
+
+def import_native_hooks_index(
+    index_path: str = NATIVE_HOOKS_INDEX,
+) -> dict[str, 'GenericHookType'] | None:
+    """
+    Read the native hooks index into lazy hooks which are imported when they are first
+     used. Returns None if no index has been generated.
+    """
+    if not os.path.isfile(index_path):
+        return None
+    with open(index_path) as f:
+        index = json.load(f)
+
+    return {i['hook_name']: LazyImportHook(**i) for i in index}
+
+
 # Cache the result since this will never change between tackle executions. In tests,
 # is a session scoped patch.
 @lru_cache
 def import_native_providers() -> dict[str, 'GenericHookType']:
     """
-    Import the native providers. First qualifies if we are running locally (ie the
-     `local_install` setting is active in which case we need to manually import all the
-      native provides. Otherwise, just use the cached native providers as we would under
-      normal runs. Importing providers adds about .7 seconds each time we run tackle.
+    Import the native providers. Uses the native hooks index which defers importing
+     each provider's modules until one of its hooks is called unless it is missing or
+     the `import_all_native_providers` setting is active (ie when developing providers)
+     in which case we need to manually import all the native provides. Importing
+     providers adds about .7 seconds each time we run tackle.
     """
+    if not settings.import_all_native_providers:
+        native_hooks = import_native_hooks_index()
+        if native_hooks is not None:
+            return native_hooks
+        logger.debug("No native hooks index found, importing all native providers.")
+
     # Making empty context so the function is cachable
     context = Context()
     native_hooks = {}
-
-    native_providers_directory = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), '..', 'providers'
-    )
-    if settings.local_install:
-        for i in os.scandir(native_providers_directory):
-            if i.is_dir() and i.name != '__pycache__':
-                import_native_hooks_from_directory(
-                    context=context,
-                    hooks_directory=os.path.join(i.path, 'hooks'),
-                    provider_name=i.name,
-                    native_hooks=native_hooks,
-                )
-        return native_hooks
-    else:
-        # This is where we want to implement a native hook cache which could speed up
-        # imports by a whopping .2 seconds or so. Replacing context from pydantic to
-        # dataclasses makes this a low priority.
-        raise NotImplementedError
+    for i in os.scandir(NATIVE_PROVIDERS_DIRECTORY):
+        if i.is_dir() and i.name != '__pycache__':
+            import_native_hooks_from_directory(
+                context=context,
+                hooks_directory=os.path.join(i.path, 'hooks'),
+                provider_name=i.name,
+                native_hooks=native_hooks,
+            )
+    return native_hooks
 
 
 def install_requirements_file(requirements_path: str):
@@ -1,5 +1,17 @@
 import enum
-from typing import Any, Optional, Union, ClassVar, Callable, Literal
+from dataclasses import dataclass, field
+from operator import attrgetter
+from types import UnionType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Literal,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -23,6 +35,23 @@ class LazyBaseHook(BaseModel):
     is_public: bool = Field(..., description="Public or private.")
 
 
+class LazyImportHook(BaseModel):
+    """
+    Entry from the native hooks index which points to the module a native hook lives in.
+     The module is only imported when the hook is first looked up at which point the
+     entry is replaced by the actual hook class.
+    """
+
+    hook_name: str
+    class_name: str = Field(..., description="Name of the hook's class in the module.")
+    module_name: str = Field(..., description="Name to import the module under.")
+    file_path: str = Field(
+        ...,
+        description="Path to the module relative to the native providers directory.",
+    )
+    provider_name: str
+
+
 class HookCallInput(BaseModel):
     """
     Deserializer for hook base methods. Takes all the extra key value pairs and puts
@@ -114,6 +143,101 @@ class HookCallInput(BaseModel):
     )
 
 
+def _get_allowed_types(annotation: Any) -> tuple[type, ...] | None:
+    """Get the types a value can already be in for a field or None if any is allowed."""
+    if annotation is Any:
+        return None
+    if get_origin(annotation) in (Union, UnionType):
+        return tuple(get_origin(i) or i for i in get_args(annotation))
+    return (annotation,)
+
+
+# Map of both field names and aliases to field names
+HOOK_CALL_FIELD_NAMES = {k: k for k in HookCallInput.model_fields} | {
+    v.alias: k for k, v in HookCallInput.model_fields.items() if v.alias is not None
+}
+HOOK_CALL_FIELD_TYPES = {
+    k: _get_allowed_types(v.annotation) for k, v in HookCallInput.model_fields.items()
+}
+HOOK_CALL_FIELD_DEFAULTS = {k: v.default for k, v in HookCallInput.model_fields.items()}
+get_hook_call_fields = attrgetter(*HOOK_CALL_FIELD_DEFAULTS)
+
+
+def with_hook_call_fields(cls: type) -> type:
+    """
+    Make a class a slotted dataclass with the fields / defaults of `HookCallInput` plus
+     the extra keys in `model_extra` so that they don't need to be kept in line by hand.
+    """
+    cls.__annotations__ = {k: Any for k in HOOK_CALL_FIELD_DEFAULTS}
+    for k, v in HOOK_CALL_FIELD_DEFAULTS.items():
+        setattr(cls, k, v)
+    cls.__annotations__['model_extra'] = dict
+    cls.model_extra = field(default_factory=dict)
+    return dataclass(slots=True, repr=False, eq=False)(cls)
+
+
+@with_hook_call_fields
+class HookCall:
+    """
+    Slotted version of `HookCallInput` used when parsing hook calls which is validated
+     once when it is created and then cheap to copy for each iteration of a loop. Has
+     the same attributes as `HookCallInput` (ie `for_` and `model_extra`) so that it
+     can be passed to hooks' exec methods - use `to_model` if the model is needed.
+    """
+
+    @classmethod
+    def validate(cls, hook_dict: dict) -> 'HookCall':
+        """
+        Create from a dict of field names / aliases and extra keys, falling back to
+         validating with `HookCallInput` (which raises pydantic's ValidationError) when
+         a value is not already one of its field's types.
+        """
+        model_extra = {}
+        fields = {}
+        for k, v in hook_dict.items():
+            field_name = HOOK_CALL_FIELD_NAMES.get(k)
+            if field_name is None:
+                model_extra[k] = v
+                continue
+            field_types = HOOK_CALL_FIELD_TYPES[field_name]
+            if field_name in fields or (
+                field_types is not None and not isinstance(v, field_types)
+            ):
+                return cls.from_model(HookCallInput(**hook_dict))
+            if isinstance(v, (list, dict)) and field_types is not None:
+                # Same as the model, containers are copied when they are validated
+                v = v.copy()
+            fields[field_name] = v
+        return cls(**fields, model_extra=model_extra)
+
+    @classmethod
+    def from_model(cls, hook_call_input: HookCallInput) -> 'HookCall':
+        return cls(
+            **{k: getattr(hook_call_input, k) for k in HOOK_CALL_FIELD_DEFAULTS},
+            model_extra=dict(hook_call_input.model_extra),
+        )
+
+    def to_model(self) -> HookCallInput:
+        """Convert to a `HookCallInput` without validating it again."""
+        hook_call_input = HookCallInput.model_construct(
+            **{k: getattr(self, k) for k in HOOK_CALL_FIELD_DEFAULTS},
+        )
+        # Extra keys can have the same names as fields so are added separately
+        hook_call_input.model_extra.update(self.model_extra)
+        return hook_call_input
+
+    def __copy__(self) -> 'HookCall':
+        return self.__class__(*get_hook_call_fields(self), self.model_extra.copy())
+
+    def replace_model_extra(self, model_extra: dict) -> 'HookCall':
+        """Copy with other extra keys (ie the rendered values of a loop's item)."""
+        return self.__class__(*get_hook_call_fields(self), model_extra)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{k}={getattr(self, k)!r}' for k in self.__slots__)
+        return f'{self.__class__.__name__}({fields})'
+
+
 class HookMethods:
     def __int__(self, public: dict, private: dict, default: dict):
         self.public = public
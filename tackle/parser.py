@@ -13,9 +13,9 @@ command line are asserted
 - Main parser
     - Iterate through any keys on the input data
     - Perform macros to expand keys so that they are more easily read by business logic
-    - Copy input values over to a output data split between public, private, temporary
-    and existing memory spaces. Only public is passed between contexts - see memory
-    management docs
+    - Copy input values over to a output data split between public, private, and
+    existing memory spaces along with scope frames for blocks / loops. Only public is
+    passed between contexts - see memory management docs
     - Run any in-line hooks
         - Perform any logic (if / else / for etc)
         - Call the actual hook
@@ -30,35 +30,48 @@ command line are asserted
 This is a really rough overview of what is going on here. Post issues if you are trying
 to fix something and want to know more. Docs should be improved always...
 """
-import inspect
 import logging
 import os
 import re
 from collections import OrderedDict
-from typing import Any, Callable
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple
 
 from pydantic import BaseModel, ValidationError
 
 from tackle import exceptions
 from tackle.context import Context
+from tackle.hook_plan import (
+    BASE_HOOK_FIELDS,
+    INJECT_CONTEXT,
+    RENDER,
+    RENDER_BY_DEFAULT,
+    clear_hook_plan,
+    get_hook_plan,
+)
 from tackle.hooks import create_dcl_hook, get_hook_from_context
 from tackle.macros.function_macros import function_macro
 from tackle.macros.key_macros import key_macro, var_hook_macro
-from tackle.models import BaseHook, CompiledHookType, HookCallInput, LazyBaseHook
+from tackle.models import CompiledHookType, HookCall, LazyBaseHook
 from tackle.render import render_variable
+from tackle.scopes import scope_frame
 from tackle.types import DEFAULT_HOOK_NAME, DocumentValueType
-from tackle.utils.command import unpack_args_kwargs_string
+from tackle.utils.command import ArgsKwargsFlags, unpack_args_kwargs_string
 from tackle.utils.data_crud import (
+    LIST_INDEX_TYPES,
     decode_list_index,
     encode_list_index,
-    get_set_temporary_context,
     get_target_and_key,
     nested_delete,
     nested_get,
     nested_set,
+    pop_key,
+    push_key,
+    set_block_frame_output,
     set_key,
     update_input_dict,
 )
+from tackle.utils.file_cache import write_cached_tackle_file
 from tackle.utils.help import run_help
 from tackle.utils.paths import work_in
 from tackle.utils.render import wrap_jinja_braces
@@ -100,6 +113,8 @@ def merge_block_output(
             value=v,
         )
     nested_delete(element=target_context, keys=key_path)
+    # Keys were moved outside of the key path
+    context.write_cursor = None
 
 
 def merge_output(
@@ -111,12 +126,15 @@ def merge_output(
     if context.key_path[-1] in ('->', '_>'):
         # Expanded key - Remove parent key from key path
         key_path = context.key_path[:-2] + [context.key_path[-1]]
+    elif isinstance(context.key_path[-1], LIST_INDEX_TYPES):
+        # Within a loop
+        key_path = context.key_path.copy()
     else:
         # Compact key
         key_path = context.key_path[:-1] + [context.key_path[-1][-2:]]
 
     if append_hook_value:
-        if isinstance(key_path[-3], bytes):
+        if isinstance(key_path[-3], LIST_INDEX_TYPES):
             # We are merging into a list so we need to keep track of the starting
             # index from which we are merging into, the incremented position.
             incremented_position = encode_list_index(
@@ -161,47 +179,33 @@ def run_hook_exec(
     hook: CompiledHookType,
     # Jinja + Externally called dcl hooks will not have hook_call since there is
     # never any control flow in either of these situations
-    hook_call: HookCallInput | None = None,
+    hook_call: HookCall | None = None,
 ) -> Any:
     """
     Run the hook's exec method by injecting any needed params such as context and
      hook_call if they are present in the function signature.
     """
-    if not hasattr(hook, 'exec'):
+    exec_params = get_hook_plan(context, type(hook)).exec_params
+    if exec_params is None:
         # We will always have a python hook here as dcl hooks always have an exec method
         # attached to them which dumps the hook. Same here when missing exec method
-        return hook.model_dump(exclude=set(BaseHook.model_fields.keys()))
-
-    signature = inspect.signature(hook.exec)
-
-    injected_params = {}
-    for k, v in signature.parameters.items():
-        param_type = v.annotation
-        if param_type is Context:
-            injected_params[k] = context
-        elif param_type is HookCallInput:
-            injected_params[k] = hook_call
-        # Types can sometimes be in quotes - ie def exec(self, context: 'Context')
-        elif param_type == 'Context':
-            injected_params[k] = context
-        elif param_type == 'HookCallInput':
-            injected_params[k] = hook_call
-
-        else:
-            raise exceptions.MalformedHookDefinitionException(
-                f"The exec method in hook={hook.hook_name} has an unknown "
-                f"parameter={k} with type={v} which is not supported. Only params of "
-                f"type `Context` and `HookCallInput` are supported.",
-                context=context,
-                hook_name=hook,
-            )
+        return hook.model_dump(exclude=BASE_HOOK_FIELDS)
 
-    return hook.exec(**injected_params)
+    injected_params = {
+        k: context if v == INJECT_CONTEXT else hook_call for k, v in exec_params
+    }
+    if not any(v == INJECT_CONTEXT for _, v in exec_params):
+        return hook.exec(**injected_params)
+    try:
+        return hook.exec(**injected_params)
+    finally:
+        # The hook could have modified the data so the write cursor is rebuilt after
+        context.write_cursor = None
 
 
 def run_hook_in_dir(
     context: Context,
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     hook: CompiledHookType,
 ) -> Any:
     """Run the `exec` method in a dir if `chdir` is given in `hook_call`."""
@@ -223,7 +227,7 @@ def run_hook_in_dir(
 
 def update_hook_call_with_kwargs_field(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
 ):
     """
     In order to facilitate instantiating objects with dicts, a `kwargs` key can be used
@@ -246,15 +250,16 @@ def update_hook_call_with_kwargs_field(
 
 def update_missing_hook_vars(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     Hook: CompiledHookType,
     key: str,
     value: Any,
 ):
+    hook_plan = get_hook_plan(context, Hook)
     # Check if the field is within the hook
-    if Hook.model_fields['kwargs'].default is None:
+    if hook_plan.kwargs_field is None:
         # We have an unknown key but it could be allowed
-        if Hook.model_config['extra'] in ['allow', 'ignore']:
+        if hook_plan.allow_extra:
             return
         # The Hook has some extra field in it, and we don't have a `kwargs` field which
         # will map extra args to a field so we need to raise here.
@@ -268,9 +273,9 @@ def update_missing_hook_vars(
         raise  # Should have raised by now
     else:
         # Map the extra fields to the `kwargs` field
-        kwargs_field = Hook.model_fields['kwargs'].default
+        kwargs_field = hook_plan.kwargs_field
         # Check that the kwargs_field is a dict - if not it can't be mapped
-        if Hook.model_fields[kwargs_field].annotation == dict:
+        if hook_plan.kwargs_field_is_dict:
             # Create an empty dict if the field is not defined
             if kwargs_field not in hook_call.model_extra:
                 hook_call.model_extra[kwargs_field] = {}
@@ -290,61 +295,9 @@ def update_missing_hook_vars(
             )
 
 
-def get_hook_level_render_var(
-    context: 'Context',
-    Hook: CompiledHookType,
-    render_var: str,
-) -> list[str]:
-    """Getter for both hook level `render_by_default` and `render_exclude` variables."""
-    render_var = Hook.model_fields[render_var].default
-    if render_var:
-        # We need manually validate this here as Hook is not instantiated
-        if isinstance(render_var, list):
-            # Add any alias
-            for i in render_var:
-                if i not in Hook.model_fields:
-                    raise exceptions.MalformedHookDefinitionException(
-                        f'The values in the field=`{render_var}` need to be names of '
-                        f'fields. Got `{i}` which is not as field name.',
-                        context=context,
-                        hook_name=Hook.hook_name,
-                    )
-            return render_var
-        else:
-            raise exceptions.MalformedHookDefinitionException(
-                "The `render_exclude` field must be a list of fields to exclude.",
-                context=context,
-                hook_name=Hook.hook_name,
-            )
-    return []
-
-
-def get_field_level_render_var(
-    context: 'Context',
-    Hook: CompiledHookType,
-    hook_key: str,
-    render_var: str,
-):
-    # Need to check for this field in the `json_schema_extra`
-    if (
-        Hook.model_fields[hook_key].json_schema_extra is not None
-        and render_var in Hook.model_fields[hook_key].json_schema_extra
-    ):
-        if not isinstance(
-            Hook.model_fields[hook_key].json_schema_extra[render_var],
-            bool,
-        ):
-            raise exceptions.MalformedHookDefinitionException(
-                f"The `{render_var}` field in key=`{hook_key}` must be a boolean.",
-                context=context,
-                hook_name=Hook,
-            )
-        return Hook.model_fields[hook_key].json_schema_extra[render_var]
-
-
 def update_hook_vars(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     Hook: CompiledHookType,
 ):
     """
@@ -357,37 +310,16 @@ def update_hook_vars(
     """
     # Update hook_call.model_extra with any `kwargs` field specified in the call
     update_hook_call_with_kwargs_field(context, hook_call)
-    hook_render_exclude = get_hook_level_render_var(context, Hook, 'render_exclude')
-    hook_render_by_default = get_hook_level_render_var(context, Hook, 'render_exclude')
-
-    alias_fields = {
-        v.alias: k for k, v in Hook.model_fields.items() if v.alias is not None
-    }
-    field_map = Hook.model_fields | alias_fields
+    key_render_policies = get_hook_plan(context, Hook).key_render_policies
 
     # Iterate through all the extra hook call items
     for k, v in hook_call.model_extra.copy().items():
-        if k not in field_map:
+        render_policy = key_render_policies.get(k)
+        if render_policy is None:
             update_missing_hook_vars(context, hook_call, Hook=Hook, key=k, value=v)
-            continue
-        elif k in hook_render_exclude:
-            # Hook level `render_exclude`
-            continue
-        elif k in hook_render_by_default:
-            # Hook level `render_by_default`
-            hook_call.model_extra[k] = render_variable(context, wrap_jinja_braces(v))
-            continue
-
-        # Update any fields that should be aliased to their actual key
-        if k in alias_fields:
-            hook_key = alias_fields[k]
-        else:
-            hook_key = k
-
-        if get_field_level_render_var(context, Hook, hook_key, 'render_by_default'):
-            # Field level `render_by_default`
+        elif render_policy == RENDER_BY_DEFAULT:
             hook_call.model_extra[k] = render_variable(context, wrap_jinja_braces(v))
-        elif not get_field_level_render_var(context, Hook, hook_key, 'render_exclude'):
+        elif render_policy == RENDER:
             # Finally render any field that is left over with jinja braces
             hook_call.model_extra[k] = render_variable(context, v)
 
@@ -415,7 +347,7 @@ def parse_sub_context(context: 'Context', hook_target: Any):
     key_path_index = len(context.key_path_block) - len(context.key_path)
     indexed_key_path = context.key_path[key_path_index:]
 
-    if isinstance(indexed_key_path[-1], bytes):
+    if isinstance(indexed_key_path[-1], LIST_INDEX_TYPES):
         # We are in a for loop
         input_dict = nested_get(
             element=context.data.input,
@@ -446,20 +378,13 @@ def parse_sub_context(context: 'Context', hook_target: Any):
 
 def new_hook(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     Hook: CompiledHookType,
 ):
     """
     Create a new instantiated hook which also catches any validation errors with the
      hook_call.try/except which route into additional logic.
     """
-    # We clear the temporary context for hooks that have `skip_output` set and have no
-    # key_path_block (ie when we have reached the base of a temporary context) as this
-    # is a proxy for when we need to clear this data as it should not be carried over
-    # indefinitely.
-    if Hook.model_fields['skip_output'].default and len(context.key_path_block) == 0:
-        context.data.temporary = {}
-
     try:
         hook = Hook.model_validate(hook_call.model_extra)
     except TypeError as e:
@@ -501,7 +426,7 @@ def new_hook(
 
 def parse_hook_execute(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     Hook: CompiledHookType,
     append_hook_value: bool = None,
 ):
@@ -515,6 +440,26 @@ def parse_hook_execute(
         hook_call=hook_call,
         Hook=Hook,
     )
+    execute_hook(
+        context=context,
+        hook_call=hook_call,
+        Hook=Hook,
+        append_hook_value=append_hook_value,
+    )
+
+
+def execute_hook(
+    context: 'Context',
+    hook_call: HookCall,
+    Hook: CompiledHookType,
+    append_hook_value: bool = None,
+    output: list | None = None,
+):
+    """
+    Instantiate and call a hook whose variables have been rendered. When `output` (the
+     list a loop is writing to) is given, the value is inserted into it directly
+     instead of being set from the root of the data.
+    """
     # Instantiate the hook
     hook = new_hook(
         context=context,
@@ -561,18 +506,11 @@ def parse_hook_execute(
         elif context.break_:
             # We hit some hook like `return` where temporary data is not relevant
             return
-        elif context.data.temporary:
-            # TODO: UPDATE 2024
-            #  This is nonsense and needs ripping out. Point is we store state and 
-            #  discard on serialization. All these memory spaces need to go away. They 
-            #  are way too confusing. 
-
-            # Write the indexed output to the `data.temporary` as it was only written
-            # to the `data.public` and not maintained between items in a list
-            if context.key_path_block and isinstance(context.key_path_block[-1], bytes):
-                return
-            if not isinstance(context.key_path[-1], bytes):
-                get_set_temporary_context(context=context)
+        elif context.block_frame is not None:
+            # Reference the output in the block's frame as it was only written to the
+            # `data.public` by the hook
+            if not isinstance(context.key_path[-1], LIST_INDEX_TYPES):
+                set_block_frame_output(context=context)
 
     elif hook_call.merge:
         merge_output(
@@ -580,6 +518,8 @@ def parse_hook_execute(
             context=context,
             append_hook_value=append_hook_value,
         )
+    elif output is not None:
+        output.insert(decode_list_index(context.key_path[-1]), hook_output_value)
     else:
         set_key(
             context=context,
@@ -596,7 +536,7 @@ class ForVariableNames(BaseModel):
 
 def get_for_loop_variable_names(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
 ) -> ForVariableNames:
     """
     Parse a hook's `for` field which can either be a reference to a list or a dict and
@@ -727,12 +667,122 @@ def get_for_loop_variable_names(
         ) from None
 
 
+class LoopBody(NamedTuple):
+    """
+    The parts of a looped hook call that are the same for every item, prepared once
+     before the loop so that each item only renders the values that are templated.
+    """
+
+    hook_call: HookCall
+    # The wrapped `when` / `if` condition evaluated for each item
+    condition: str | None
+    condition_method: str | None
+    # Hook call values that are passed as is
+    static_values: dict
+    # The (key, raw value) of hook call values that are rendered for each item
+    rendered_values: tuple[tuple[str, Any], ...]
+    # The list the loop writes to or None if it needs to be set from the root
+    output: list | None
+
+
+def is_static_value(value: Any) -> bool:
+    """Check if a value would be the same after rendering and is safe to share."""
+    if isinstance(value, str):
+        return '{{' not in value and '{%' not in value
+    return value is None or isinstance(value, (bool, int, float))
+
+
+def prepare_loop_body(
+    context: 'Context',
+    hook_call: HookCall,
+    Hook: CompiledHookType,
+    output: list | None,
+) -> LoopBody | None:
+    """
+    Prepare the body of a loop from the hook call. Returns None when the items need to
+     be parsed individually, ie when extra kwargs are mapped to a `kwargs` field.
+    """
+    if hook_call.kwargs is not None:
+        return None
+    key_render_policies = get_hook_plan(context, Hook).key_render_policies
+
+    static_values = {}
+    rendered_values = []
+    for k, v in hook_call.model_extra.items():
+        render_policy = key_render_policies.get(k)
+        if render_policy is None:
+            return None
+        elif render_policy == RENDER_BY_DEFAULT:
+            rendered_values.append((k, wrap_jinja_braces(v)))
+        elif render_policy == RENDER and not is_static_value(v):
+            rendered_values.append((k, v))
+        else:
+            static_values[k] = v
+
+    # Same as `evaluate_if` where `when` takes precedence
+    if hook_call.when is not None:
+        condition, condition_method = wrap_jinja_braces(hook_call.when), 'when'
+    elif hook_call.if_ is not None:
+        condition, condition_method = wrap_jinja_braces(hook_call.if_), 'if'
+    else:
+        condition, condition_method = None, None
+
+    if (
+        hook_call.merge
+        or Hook.model_fields['skip_output'].default
+        or len(context.key_path_block) != 0
+    ):
+        # Output needs to be merged / is written by the hook / is referenced in a block
+        output = None
+
+    return LoopBody(
+        hook_call=hook_call,
+        condition=condition,
+        condition_method=condition_method,
+        static_values=static_values,
+        rendered_values=tuple(rendered_values),
+        output=output,
+    )
+
+
+def run_loop_item(context: 'Context', loop_body: LoopBody, Hook: CompiledHookType):
+    """Run an item of a loop whose variables have been set, same as `parse_hook`."""
+    hook_call = loop_body.hook_call
+    if loop_body.condition is not None:
+        condition = render_variable(context, loop_body.condition)
+        if not isinstance(condition, bool):
+            raise exceptions.UnknownArgumentException(
+                f"The result of evaluating method='{loop_body.condition_method}' "
+                f"resulted in the value='{condition}' and is not a boolean. Exiting...",
+                context=context,
+            )
+        if not condition:
+            if hook_call.else_ is not None:
+                parse_sub_context(context=context, hook_target=hook_call.else_)
+            return
+
+    hook_values = loop_body.static_values.copy()
+    for k, v in loop_body.rendered_values:
+        hook_values[k] = render_variable(context, v)
+    execute_hook(
+        context=context,
+        hook_call=hook_call.replace_model_extra(hook_values),
+        Hook=Hook,
+        append_hook_value=True,
+        output=loop_body.output,
+    )
+
+
 def evaluate_for(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     Hook: CompiledHookType,
 ):
-    """Run the parse_hook function in a loop with temporary variables."""
+    """
+    Run the hook in a loop with temporary variables. The parts of the hook call which
+     don't change between items are prepared once (see `prepare_loop_body`) so that
+     each item only renders its templated values, validates, and runs the hook.
+    """
     variables = get_for_loop_variable_names(context=context, hook_call=hook_call)
     hook_call.for_ = None
 
@@ -744,73 +794,49 @@ def evaluate_for(
         #     set_key(context=context, value=[])
         # TODO: Wtf is going on here?
         if not hook_call.merge:
-            set_key(context=context, value=[])
-        for i, l in (
-            enumerate(variables.loop_targets)
-            if not render_variable(context, hook_call.reverse)
-            else reversed(list(enumerate(variables.loop_targets)))
-        ):
-            # Create temporary variables in the context to be used in the loop.
-            context.data.existing.update(
-                {
-                    variables.index_name: i,
-                    variables.value_name: l,
-                }
-            )
-            # Append the index to the keypath
-            context.key_path.append(encode_list_index(i))
-            # Reparse the hook with the new temp vars in place
-            parse_hook(
-                context=context,
-                hook_call=hook_call.__copy__(),
-                Hook=Hook,
-                append_hook_value=True,
-            )
-            context.key_path.pop()
-
+            output = []
+            set_key(context=context, value=output)
+        else:
+            output = None
+        loop_items = list(enumerate(variables.loop_targets))
     elif isinstance(variables.loop_targets, dict):
-        if hook_call.merge:
-            # To merge into a list
-            set_key(context=context, value=[])
-        elif not hook_call.merge:
-            set_key(context=context, value=[])
-        for i, (k, v) in (
-            enumerate(variables.loop_targets.items())
-            if not render_variable(context, hook_call.reverse)
-            else reversed(list(enumerate(variables.loop_targets)))
-        ):
-            # Create temporary variables in the context to be used in the loop.
-            context.data.existing.update(
-                {
-                    variables.index_name: i,
-                    variables.value_name: v,
-                    variables.key_name: k,
-                }
-            )
-            # Append the index to the keypath
-            context.key_path.append(encode_list_index(i))
-            # Reparse the hook with the new temp vars in place
-            parse_hook(
-                context=context,
-                hook_call=hook_call.__copy__(),
-                Hook=Hook,
-                append_hook_value=True,
-            )
-            context.key_path.pop()
+        # Merging into a list or not, the output is a list
+        output = []
+        set_key(context=context, value=output)
+        loop_items = list(enumerate(variables.loop_targets.items()))
     else:
         raise Exception("Should never happen...")
 
-    # Remove temp variables
-    for i in [variables.key_name, variables.value_name, variables.index_name]:
-        try:
-            context.data.existing.pop(i)
-        except KeyError:
-            pass
+    if render_variable(context, hook_call.reverse):
+        loop_items.reverse()
+
+    loop_body = prepare_loop_body(context, hook_call, Hook, output)
+    # The loop variables are in their own frame which is updated for each item
+    with scope_frame(context.data) as frame:
+        for i, value in loop_items:
+            frame[variables.index_name] = i
+            if variables.key_name is None:
+                frame[variables.value_name] = value
+            else:
+                frame[variables.key_name], frame[variables.value_name] = value
+            # Append the index to the keypath
+            push_key(context, encode_list_index(i))
+            if loop_body is None:
+                # Reparse the hook with the new temp vars in place
+                parse_hook(
+                    context=context,
+                    hook_call=hook_call.__copy__(),
+                    Hook=Hook,
+                    append_hook_value=True,
+                )
+            else:
+                run_loop_item(context, loop_body=loop_body, Hook=Hook)
+            pop_key(context)
 
 
 def parse_hook_loop(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     Hook: CompiledHookType,
     append_hook_value: bool = None,
 ):
@@ -830,7 +856,7 @@ def parse_hook_loop(
 
 def evaluate_if(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     append_hook_value: bool,
 ) -> bool:
     """
@@ -873,7 +899,7 @@ def evaluate_if(
 
 def parse_hook(
     context: 'Context',
-    hook_call: HookCallInput,
+    hook_call: HookCall,
     Hook: CompiledHookType,
     append_hook_value: bool = None,
 ):
@@ -913,6 +939,8 @@ def evaluate_args(
 
      TODO: Fix for all cases args of type list then string - ie a lookahead
     """
+    hook_plan = get_hook_plan(context, Hook)
+    hook_args = hook_plan.args
     # Flag to inform if we are at end of args and need to pop the rest
     pop_all: bool = False
     # Keep track of the number of args popped to maintain the right index
@@ -922,28 +950,28 @@ def evaluate_args(
         # Build a new index based on the number of args popped
         i = index - num_popped
 
-        if len(Hook.model_fields['args'].default) - 1 < index:
+        if len(hook_args) - 1 < index:
             raise exceptions.UnknownHookInputArgumentException(
                 f"The input_arg=`{args[i]}` is not known. Exiting...",
                 context=context,
                 hook_name=Hook.hook_name,
             )
 
-        hook_arg = Hook.model_fields['args'].default[index]
-        if index == len(Hook.model_fields['args'].default) - 1:
+        hook_arg = hook_args[index]
+        if index == len(hook_args) - 1:
             # We are at the last argument mapping, so we need to join the remaining
             # arguments as a single string if it is not a list of another map.
             if not isinstance(args[i], (str, float)):
                 # Catch list dict and ints - strings floats and bytes caught later
                 value = args[i]
-            elif Hook.model_fields[hook_arg].annotation == str:
+            elif hook_plan.last_arg_annotation == str:
                 # Was parsed on spaces so reconstructed.
                 value = ' '.join(args[i:])
                 pop_all = True
-            elif Hook.model_fields[hook_arg].annotation in (bool, float, int):
+            elif hook_plan.last_arg_annotation in (bool, float, int):
                 # TODO: Check if there are any additional args and throw error?
                 value = args[i]
-            elif Hook.model_fields[hook_arg].annotation == list:
+            elif hook_plan.last_arg_annotation == list:
                 # If list then return all the remaining items as list
                 value = args[i:]
                 pop_all = True
@@ -981,7 +1009,7 @@ def evaluate_args(
                 hook_dict[hook_arg] = args.pop(0)
                 num_popped += 1
             except IndexError:
-                if len(Hook.model_fields['args'].default) == 0:
+                if len(hook_args) == 0:
                     # TODO: Give more info on possible methods
                     hook_name = Hook.model_fields['hook_name']
                     if hook_name == DEFAULT_HOOK_NAME:
@@ -994,12 +1022,27 @@ def evaluate_args(
                 else:
                     raise exceptions.UnknownArgumentException(
                         f"The hook {hook_dict['hook_name']} takes the following indexed"
-                        f"arguments -> {Hook.model_fields['args'].default} which does "
+                        f"arguments -> {list(hook_args)} which does "
                         f"not map to the arg {v}.",
                         context=context,
                     ) from None
 
 
+@lru_cache(maxsize=2048)
+def parse_hook_string(hook_str: str) -> ArgsKwargsFlags:
+    """
+    Parse the string of a hook call (ie `key->: hook arg --kwarg thing --flag`) into
+     its args, kwargs, and flags, rewriting renderable first args as var hooks. Cached
+     as the same strings are parsed on every loop iteration / declarative hook call.
+    """
+    args, kwargs, flags = unpack_args_kwargs_string(input_string=hook_str)
+    return ArgsKwargsFlags(
+        args=tuple(var_hook_macro(args)),
+        kwargs=tuple(kwargs.items()),
+        flags=tuple(flags),
+    )
+
+
 def run_hook_at_key_path(
     context: 'Context',
     hook_dict: dict,
@@ -1013,8 +1056,7 @@ def run_hook_at_key_path(
      hook kwargs. Also interprets special cases where you have a string or list input
      of renderable variables.
     """
-    args, kwargs, flags = unpack_args_kwargs_string(input_string=hook_str)
-    args = var_hook_macro(args)
+    args, kwargs, flags = parse_hook_string(str(hook_str)).unpack()
 
     # Look up the hook from the imported providers
     first_arg = args.pop(0)
@@ -1054,7 +1096,7 @@ def run_hook_at_key_path(
                     hook_dict[i] = False
 
     try:
-        hook_call = HookCallInput(**hook_dict)
+        hook_call = HookCall.validate(hook_dict)
     except ValidationError as e:
         raise exceptions.UnknownHookInputArgumentException(
             e.__str__(),
@@ -1079,7 +1121,7 @@ def run_hook_with_key(context: 'Context', value: DocumentValueType, arrow: str):
         raise exceptions.TopLevelMergeException(
             "Can't run hooks at the top level (ie '->: print foo').", context=context
         )
-    context.key_path.append(arrow)
+    push_key(context, arrow)
     # We need to copy this value because it could be reused in a loop
     v = value.copy()
     hook_str = v.pop(arrow)
@@ -1092,7 +1134,7 @@ def run_hook_with_key(context: 'Context', value: DocumentValueType, arrow: str):
         hook_dict=v,
         hook_str=hook_str,
     )
-    context.key_path.pop()
+    pop_key(context)
 
 
 def walk_document(context: 'Context', value: DocumentValueType):
@@ -1113,9 +1155,9 @@ def walk_document(context: 'Context', value: DocumentValueType):
         # Iterate through all the keys now of a dict since we know it is not a hook
         for k, v in value.copy().items():
             key, value = key_macro(context, key=k, value=v)
-            context.key_path.append(key)
+            push_key(context, key)
             walk_document(context=context, value=value)  # recurse
-            context.key_path.pop()
+            pop_key(context)
             if context.break_:
                 return
 
@@ -1130,9 +1172,9 @@ def walk_document(context: 'Context', value: DocumentValueType):
                 # conditionals and would rather have an empty list than missing key
                 set_key(context, [])
             for i, v in enumerate(value.copy()):
-                context.key_path.append(encode_list_index(i))
+                push_key(context, encode_list_index(i))
                 walk_document(context, v)
-                context.key_path.pop()
+                pop_key(context)
     else:
         # Nothing left to do but set value
         set_key(context=context, value=value)
@@ -1194,6 +1236,7 @@ def update_declarative_hook_methods(
             # TODO: Change this when we make tackle hook fields methods instead of
             #  callable fields with the default factory.
             setattr(Hook, 'exec', hook_method)
+            clear_hook_plan(Hook)
             context.input.args.pop(0)
             continue
 
@@ -1416,6 +1459,23 @@ def is_dcl_hook(key: str) -> bool:
     # )
 
 
+def add_dcl_hook_to_context(context: 'Context', dcl_hook: LazyBaseHook):
+    """Add a declarative hook definition to the default, public or private hooks."""
+    if dcl_hook.hook_name == DEFAULT_HOOK_NAME:
+        # dcl_hook is the default hook
+        context.hooks.default = dcl_hook
+        return
+    hook_space = context.hooks.public if dcl_hook.is_public else context.hooks.private
+    existing_hook = hook_space.get(dcl_hook.hook_name)
+    if (
+        not isinstance(existing_hook, LazyBaseHook)
+        or existing_hook.input_raw != dcl_hook.input_raw
+    ):
+        # The hook is (re)defined and could be the base / type of compiled hooks
+        context.hooks.compiled.clear()
+    hook_space[dcl_hook.hook_name] = dcl_hook
+
+
 def split_input_data(context: 'Context'):
     """
     Split the raw_input from a tackle file into pre/post_input objects along with
@@ -1440,6 +1500,19 @@ def split_input_data(context: 'Context'):
 
         return
 
+    cached_file = context.data.cached_file
+    if cached_file is not None and cached_file.raw_input is not context.data.raw_input:
+        # The raw_input was swapped out after reading the file
+        cached_file = None
+    if cached_file is not None and cached_file.hooks is not None:
+        # The split was read from the file cache
+        context.data.pre_input = cached_file.pre_input
+        context.data.post_input = cached_file.post_input
+        for dcl_hook in cached_file.hooks:
+            add_dcl_hook_to_context(context=context, dcl_hook=dcl_hook)
+        return
+
+    dcl_hooks = []
     pre_data_flag = True
     for k, v in context.data.raw_input.items():
         hook_key = k[:-2]
@@ -1467,18 +1540,18 @@ def split_input_data(context: 'Context'):
                         context=context,
                         hook_name=hook_key,
                     )
-                if hook_name == DEFAULT_HOOK_NAME:
-                    # dcl_hook is the default hook
-                    context.hooks.default = dcl_hook
-                elif arrow == '<-':  # public hook
-                    context.hooks.public[hook_name] = dcl_hook
-                elif arrow == '<_':  # private hook
-                    context.hooks.private[hook_name] = dcl_hook
-                else:
-                    raise Exception("This should never happen")
+                dcl_hooks.append(dcl_hook)
+                add_dcl_hook_to_context(context=context, dcl_hook=dcl_hook)
         else:
             context.data.post_input.update({k: v})
 
+    if cached_file is not None:
+        # Write the split before the input is parsed as parsing can modify the input
+        cached_file.pre_input = context.data.pre_input
+        cached_file.post_input = context.data.post_input
+        cached_file.hooks = dcl_hooks
+        write_cached_tackle_file(cached_file=cached_file)
+
 
 def parse_context(context: 'Context', call_hooks: bool = True):
     """
@@ -0,0 +1,99 @@
+import os
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from xdg import xdg_cache_home, xdg_config_home  # When adding replay -> xdg_state_home
+
+xdg_config_home = xdg_config_home()
+xdg_cache_home = xdg_cache_home()
+
+
+class Settings(BaseSettings):
+    """Base settings that are immutable during main runtime."""
+
+    tackle_dir: str = Field(
+        os.path.join(xdg_config_home, 'tackle'),
+        description="Directory where tackle config is",
+    )
+    config_path: str = Field(
+        os.path.join(xdg_config_home, 'tackle', 'config.yaml'),
+        description="File path to where tackle config is",
+    )
+    providers_dir: str = Field(
+        os.path.join(xdg_config_home, 'tackle', 'providers'),
+        description="Directory where tackle providers are",
+    )
+    cache_dir: str = Field(
+        os.path.join(xdg_cache_home, 'tackle'),
+        description="Directory where parsed tackle files are cached.",
+    )
+    file_cache: bool = Field(
+        True,
+        description="Cache parsed tackle files in the `cache_dir`, bypassed with the "
+        "`--no-cache` flag.",
+    )
+    file_cache_size: int = Field(
+        1000,
+        description="Maximum number of parsed tackle files kept in the cache. The least "
+        "recently used are removed first.",
+    )
+    daemon_socket: str = Field(
+        os.path.join(xdg_config_home, 'tackle', 'daemon.sock'),
+        description="Unix socket the daemon listens on, see `tackle --daemon`. Calls "
+        "are only forwarded to it when set with the `TACKLE_DAEMON_SOCKET` env var.",
+    )
+    provider_lock_file: str | None = Field(
+        None,
+        description="Lock file pinning remote providers to commits, defaults to "
+        "`tackle.lock` in the `providers_dir`.",
+    )
+    provider_lock_ttl: int = Field(
+        86400,
+        description="Seconds a remote provider is resolved from its local clone based "
+        "on the lock file before being refreshed from the remote. The `--latest` flag "
+        "always refreshes.",
+    )
+    provider_lock_timeout: float = Field(
+        300,
+        description="Seconds to wait for another run fetching the same remote provider "
+        "before failing.",
+    )
+    fetch_workers: int = Field(
+        8,
+        description="Number of remote providers fetched in parallel, ie when importing "
+        "a list of providers or with `--fetch`.",
+    )
+    prompt_for_installs: bool = Field(
+        True,
+        description="Prompt when a provider wants to install a requirement.",
+    )
+
+    local_install: bool = Field(
+        True,
+        description="Boolean to create entrypoint as `tkl` and recompile all the"
+        " providers one each run.",
+    )
+    import_all_native_providers: bool = Field(
+        False,
+        description="Import all the native providers on each run instead of lazily"
+        " importing them from the native hooks index. Useful when developing native"
+        " providers without regenerating the index.",
+    )
+    # # TODO: RM or use
+    # extra_providers: Optional[list] = Field(
+    #     [],
+    #     description="Extra providers to import into each context.",
+    # )
+    # # TODO: RM or use
+    # default_tackle_file: Optional[str] = Field(
+    #     None,
+    #     description="If set, this will be the file if no argument is provided.",
+    # )
+
+    model_config = SettingsConfigDict(
+        env_prefix='TACKLE_',
+        env_file_encoding='utf-8',
+        case_sensitive=False,
+        extra="ignore",
+        validate_assignment=True,
+    )
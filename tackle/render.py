@@ -1,12 +1,17 @@
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from inspect import signature
-from typing import TYPE_CHECKING, Any, Type
+from typing import TYPE_CHECKING, Any, NamedTuple, Type
 
-from jinja2 import StrictUndefined, Undefined, meta
+from jinja2 import Environment, StrictUndefined, Template, Undefined, meta
 from jinja2.exceptions import TemplateSyntaxError, UndefinedError
+from jinja2.nativetypes import NativeEnvironment, native_concat
 from pydantic import ValidationError
 
 from tackle import exceptions
+from tackle.scopes import MISSING, get_scope_variable
 from tackle.special_vars import special_variables
 
 if TYPE_CHECKING:
@@ -14,6 +19,73 @@ if TYPE_CHECKING:
     from tackle.models import BaseHook
 
 
+class CompiledTemplate(NamedTuple):
+    template: Template
+    # Undeclared variables in the template
+    variables: frozenset[str]
+
+
+class TemplateCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TemplateCache:
+    """
+    Bounded LRU cache of compiled templates and their undeclared variables keyed by the
+     raw string and the environment it was compiled with. Shared across threads so all
+     access is behind a lock.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[tuple[int, str], CompiledTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, env: Environment, raw: str) -> CompiledTemplate:
+        """Get a compiled template, compiling it if it is not in the cache."""
+        key = (id(env), raw)
+        with self._lock:
+            compiled = self._templates.get(key)
+            # Check the environment in case the id was reused by a new one
+            if compiled is not None and compiled.template.environment is env:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        # Compile outside the lock as it is slow, worst case it is compiled twice
+        parsed = env.parse(raw)
+        compiled = CompiledTemplate(
+            template=env.from_string(parsed),
+            variables=frozenset(meta.find_undeclared_variables(parsed)),
+        )
+        with self._lock:
+            self._templates[key] = compiled
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return compiled
+
+    def info(self) -> TemplateCacheInfo:
+        with self._lock:
+            return TemplateCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._templates)
+            )
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+            self.hits = self.misses = 0
+
+
+template_cache = TemplateCache()
+
+
 def render_variable(context: 'Context', raw: Any):
     """
     Render the raw input. Does recursion with dict and list inputs, otherwise renders
@@ -34,6 +106,30 @@ def render_variable(context: 'Context', raw: Any):
         return raw
 
 
+def get_render_variable(context: 'Context', name: str) -> Any:
+    """
+    Get a variable for rendering from the data by descending priorities = frames,
+     public, private, existing, special_variables. Returns `MISSING` if not found.
+    """
+    value = get_scope_variable(context.data, name)
+    if value is not MISSING:
+        return value
+    elif name in special_variables:
+        # If it is a special variable we need to check if the call requires
+        # arguments, only context supported now.
+        argments = list(signature(special_variables[name]).parameters)
+        if len(argments) == 0:
+            return special_variables[name]()
+        elif 'context' in argments:
+            return special_variables[name](context)
+        elif 'kwargs' in argments:
+            # TODO: This should support callable special vars
+            raise NotImplementedError
+        else:
+            raise Exception("This should never happen...")
+    return MISSING
+
+
 def create_render_context(
     context: 'Context',
     variables: set[str],
@@ -41,38 +137,97 @@ def create_render_context(
     """
     Take the unknown variables and build a dict used for rendering these variables by
      checking in the various data objects for keys that can be used for rendering.
-     Descending priorities = temporary, public, private, existing, special_variables
+     Descending priorities = frames, public, private, existing, special_variables
     """
     render_context = {}
     unknown_variables = []
     for v in variables:
-        # Variables in the current public_context take precedence
-        if context.data.temporary and v in context.data.temporary:
-            render_context.update({v: context.data.temporary[v]})
-        elif context.data.public and v in context.data.public:
-            render_context.update({v: context.data.public[v]})
-        elif context.data.private and v in context.data.private:
-            render_context.update({v: context.data.private[v]})
-        elif context.data.existing and v in context.data.existing:
-            render_context.update({v: context.data.existing[v]})
-        elif v in special_variables:
-            # If it is a special variable we need to check if the call requires
-            # arguments, only context supported now.
-            argments = list(signature(special_variables[v]).parameters)
-            if len(argments) == 0:
-                render_context.update({v: special_variables[v]()})
-            elif 'context' in argments:
-                render_context.update({v: special_variables[v](context)})
-            elif 'kwargs' in argments:
-                # TODO: This should support callable special vars
-                raise NotImplementedError
-            else:
-                raise Exception("This should never happen...")
-        else:
+        value = get_render_variable(context, v)
+        if value is MISSING:
             unknown_variables.append(v)
+        else:
+            render_context[v] = value
     return render_context, variables
 
 
+# Templates that are only a variable with attribute / index lookups which can be
+#  resolved without jinja -> ie `{{ foo }}`, `{{ foo.bar }}`, `{{ foo[0]['bar'] }}`
+VARIABLE_PATH_REGEX = re.compile(
+    r"""^\{\{\s*([A-Za-z_]\w*)((?:\.[A-Za-z_]\w*|\[\s*(?:-?\d+|'[^'\\]*'|"[^"\\]*")\s*\])*)\s*\}\}\Z""",  # noqa
+    re.ASCII,
+)
+# Names jinja parses as constants / operators instead of variables
+JINJA_RESERVED_NAMES = {
+    'true', 'false', 'none', 'True', 'False', 'None',
+    'and', 'or', 'not', 'in', 'is', 'if', 'else',
+}  # fmt: skip
+VARIABLE_ACCESSOR_REGEX = re.compile(
+    r"""\.([A-Za-z_]\w*)|\[\s*(-?\d+|'[^'\\]*'|"[^"\\]*")\s*\]""",
+    re.ASCII,
+)
+
+
+@lru_cache(maxsize=2048)
+def parse_variable_path(raw: str) -> tuple[str, tuple[tuple[bool, Any], ...]] | None:
+    """
+    Parse a template which is only a variable path into the variable's name and a tuple
+     of (is_attribute, key) lookups. Returns None for anything else (ie expressions,
+     filters, hook calls) which need to be rendered with jinja.
+    """
+    match = VARIABLE_PATH_REGEX.match(raw)
+    if match is None or match.group(1) in JINJA_RESERVED_NAMES:
+        return None
+    accessors = []
+    for attribute, item in VARIABLE_ACCESSOR_REGEX.findall(match.group(2)):
+        if attribute:
+            accessors.append((True, attribute))
+        elif item[0] in '\'"':
+            accessors.append((False, item[1:-1]))
+        else:
+            accessors.append((False, int(item)))
+    return match.group(1), tuple(accessors)
+
+
+def render_variable_path(
+    context: 'Context',
+    name: str,
+    accessors: tuple[tuple[bool, Any], ...],
+) -> Any:
+    """
+    Resolve a variable path directly from the data, returning the same as rendering it
+     with the native jinja environment would. Returns `MISSING` when it needs to be
+     rendered with jinja instead, ie it is not found so that the same errors are raised
+     or it collides with a jinja global / hook.
+    """
+    env = context.env_
+    if not isinstance(env, NativeEnvironment) or name in env.globals:
+        return MISSING
+    if name == '_default' or any(
+        i is not None and name in i
+        for i in (context.hooks.public, context.hooks.private, context.hooks.native)
+    ):
+        return MISSING
+    base = get_render_variable(context, name)
+    if base is MISSING:
+        return MISSING
+    value = base
+    for is_attribute, key in accessors:
+        if is_attribute:
+            value = env.getattr(value, key)
+        else:
+            value = env.getitem(value, key)
+        if isinstance(value, Undefined):
+            return MISSING
+    # Same as the native environment which literal evals strings
+    value = native_concat([value])
+    value = handle_ambiguous_keys(context, value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Same as `render_template` which keeps string variables as strings
+        if isinstance(base, str):
+            value = str(value)
+    return value
+
+
 class JinjaHook:
     """
     Object to temporarily place inside jinja.globals that can be called when rendering.
@@ -164,14 +319,9 @@ def handle_ambiguous_keys(
     """
 
     def lookup_ambigous_key(context: 'Context', ambiguous_key: Any):
-        if context.data.temporary and ambiguous_key in context.data.temporary:
-            return context.data.temporary[ambiguous_key]
-        elif ambiguous_key in context.data.public:
-            return context.data.public[ambiguous_key]
-        elif context.data.private and ambiguous_key in context.data.private:
-            return context.data.private[ambiguous_key]
-        elif context.data.existing and ambiguous_key in context.data.existing:
-            return context.data.existing[ambiguous_key]
+        value = get_scope_variable(context.data, ambiguous_key)
+        if value is not MISSING:
+            return value
         else:
             raise exceptions.UnknownTemplateVariableException(
                 f"Unknown ambiguous key {ambiguous_key}. Tracking issue at "
@@ -256,19 +406,28 @@ def render_string(context: 'Context', raw: str) -> Any:
         # Just check if there are any jinja markers and if not return
         return raw
 
+    # Fast path for templates which are only a variable (ie `{{ foo.bar }}`)
+    variable_path = parse_variable_path(raw)
+    if variable_path is not None:
+        rendered_template = render_variable_path(context, *variable_path)
+        if rendered_template is not MISSING:
+            return rendered_template
+
+    return render_template(context=context, raw=raw)
+
+
+def render_template(context: 'Context', raw: str) -> Any:
+    """Render a string with jinja. See `render_string`."""
     try:
         # TODO: Parse out filters based on `|`, check if the filter exists in the env,
         #  if not, then compile the hook so that it is callable.
         #  https://github.com/sudoblockio/tackle/issues/85
-        template = context.env_.from_string(raw)
+        template, variables = template_cache.get(context.env_, raw)
     except TemplateSyntaxError as e:
         raise exceptions.MalformedTemplateVariableException(
             str(e).capitalize() + f" in {raw}", context=context
         ) from None
 
-    # Extract variables
-    variables = meta.find_undeclared_variables(context.env_.parse(raw))
-
     # Create a render_context (dict) from variables and return any unknown_variables
     # which will be hooks. Any left over variables will throw error in rendering
     render_context, unknown_variables = create_render_context(context, variables)
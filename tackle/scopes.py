@@ -0,0 +1,76 @@
+"""
+Layered lookup of the variables available for rendering. Variables are looked up in
+ the frames pushed while parsing with the last pushed first, then the data namespaces
+ in descending priority - public, private, and existing. Frames are pushed for loops
+ (ie the loop variables) and blocks (ie references to the values set within the block
+ so far - see `set_block_frame_key`) and popped once they are parsed instead of
+ writing copies into (and then cleaning up) the other namespaces so that no data is
+ copied and nothing is clobbered. Data handed to another context (ie a nested tackle
+ call) is layered in an overlay for the same reason.
+
+See memory management docs for more details on the various namespaces for data.
+https://sudoblockio.github.io/tackle/memory-management/
+"""
+from collections import ChainMap
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
+
+if TYPE_CHECKING:
+    from tackle.context import Data
+
+# Returned when a variable is not in any of the scopes
+MISSING = object()
+
+
+def get_scope_variable(data: 'Data', name: Any) -> Any:
+    """Get a variable from the highest priority scope that has it or `MISSING`."""
+    frames = data.frames
+    for i in range(len(frames) - 1, -1, -1):
+        if name in frames[i]:
+            return frames[i][name]
+    if data.public and name in data.public:
+        return data.public[name]
+    elif data.private and name in data.private:
+        return data.private[name]
+    elif data.existing and name in data.existing:
+        return data.existing[name]
+    return MISSING
+
+
+def merge_frames(data: 'Data') -> dict:
+    """Merge the frames into a single dict, ie to pass them on as existing data."""
+    output = {}
+    for i in data.frames:
+        output.update(i)
+    return output
+
+
+def push_frame(data: 'Data', frame: dict | None = None) -> dict:
+    """Push a frame onto the scopes, returning it so that it can be updated in place."""
+    if frame is None:
+        frame = {}
+    data.frames.append(frame)
+    return frame
+
+
+def pop_frame(data: 'Data') -> dict:
+    return data.frames.pop()
+
+
+@contextmanager
+def scope_frame(data: 'Data', frame: dict | None = None) -> Iterator[dict]:
+    """Push a frame for the duration of a `with` block."""
+    frame = push_frame(data, frame)
+    try:
+        yield frame
+    finally:
+        pop_frame(data)
+
+
+def new_overlay(*layers: Mapping | None) -> ChainMap:
+    """
+    Layer the mappings (highest priority first) into a copy-on-write overlay which reads
+     them by reference and writes to its own dict so the layers are never modified.
+     Anything that is not a mapping (ie a list of public data) is skipped.
+    """
+    return ChainMap({}, *(i for i in layers if isinstance(i, Mapping)))
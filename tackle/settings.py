@@ -1,88 +1,94 @@
+"""
+Settings for tackle which are resolved lazily (see `LazySettings`) so that importing
+ tackle stays cheap. The pydantic model is in `tackle.pydantic.settings`.
+"""
 import logging
 import os
-import pathlib
+import threading
+from typing import TYPE_CHECKING
 
-from pydantic import Field, ValidationError
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from ruyaml import YAML
-from xdg import xdg_config_home  # When adding replay functionality -> xdg_state_home
-
-from tackle.utils.files import read_config_file
+if TYPE_CHECKING:
+    from tackle.pydantic.settings import Settings
 
 logger = logging.getLogger(__name__)
 
-xdg_config_home = xdg_config_home()
-
-
-class Settings(BaseSettings):
-    """Base settings that are immutable during main runtime."""
-
-    tackle_dir: str = Field(
-        os.path.join(xdg_config_home, 'tackle'),
-        description="Directory where tackle config is",
-    )
-    config_path: str = Field(
-        os.path.join(xdg_config_home, 'tackle', 'config.yaml'),
-        description="File path to where tackle config is",
-    )
-    providers_dir: str = Field(
-        os.path.join(xdg_config_home, 'tackle', 'providers'),
-        description="Directory where tackle providers are",
-    )
-    prompt_for_installs: bool = Field(
-        True,
-        description="Prompt when a provider wants to install a requirement.",
-    )
-
-    # TODO: WIP - Using cache for native providers
-    local_install: bool = Field(
-        True,
-        description="Boolean to create entrypoint as `tkl` and recompile all the"
-        " providers one each run.",
-    )
-    # # TODO: RM or use
-    # extra_providers: Optional[list] = Field(
-    #     [],
-    #     description="Extra providers to import into each context.",
-    # )
-    # # TODO: RM or use
-    # default_tackle_file: Optional[str] = Field(
-    #     None,
-    #     description="If set, this will be the file if no argument is provided.",
-    # )
-
-    model_config = SettingsConfigDict(
-        env_prefix='TACKLE_',
-        env_file_encoding='utf-8',
-        case_sensitive=False,
-        extra="ignore",
-        validate_assignment=True,
-    )
-
-
-def update_settings(settings: Settings):  # noqa
-    if not os.path.isdir(settings.providers_dir):
-        pathlib.Path(settings.providers_dir).mkdir(parents=True, exist_ok=True)
-
-    if not os.path.isfile(settings.config_path):
-        # Create a config.yaml file if it doesn't exist
-        yaml = YAML()
-        with open(settings.config_path, 'w') as f:
-            yaml.default_flow_style = False
-            yaml.dump(settings.model_dump(exclude={'config_path'}), f)
-
-    if os.path.exists(settings.config_path):
-        global_settings = read_config_file(settings.config_path)
-        if global_settings is None or not isinstance(global_settings, dict):
-            return
-        for k, v in global_settings.items():
-            try:
-                setattr(settings, k, v)
-            except ValidationError as e:
-                logger.info(f"Error setting config key={k} with value={v}\n{e}.")
-
-
-settings = Settings()
-update_settings(settings=settings)
-
-pass
+
+def __getattr__(name: str):
+    # Keep `from tackle.settings import Settings` working without importing pydantic
+    if name == 'Settings':
+        from tackle.pydantic.settings import Settings
+
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Parsed config files keyed by path along with the mtime when they were read
+_config_files: dict[str, tuple[int, dict | None]] = {}
+
+
+def read_settings_config_file(config_path: str) -> dict | None:
+    """Read the config file, only re-parsing it when its mtime changes."""
+    from tackle.utils.files import read_config_file
+
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _config_files.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    config = read_config_file(config_path)
+    _config_files[config_path] = (mtime, config)
+    return config
+
+
+def update_settings(settings: 'Settings'):  # noqa
+    """Update the settings with the values from the config file if there is one."""
+    from pydantic import ValidationError
+
+    global_settings = read_settings_config_file(settings.config_path)
+    if global_settings is None or not isinstance(global_settings, dict):
+        return
+    for k, v in global_settings.items():
+        try:
+            setattr(settings, k, v)
+        except ValidationError as e:
+            logger.info(f"Error setting config key={k} with value={v}\n{e}.")
+
+
+class LazySettings:
+    """
+    Proxy to the settings which are only resolved from the env and config file on first
+     attribute access so that importing tackle does not do any I/O. Directories in the
+     settings are created by the code that uses them.
+    """
+
+    def __init__(self):
+        object.__setattr__(self, '_settings', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _setup(self) -> 'Settings':
+        from tackle.pydantic.settings import Settings
+
+        with self._lock:
+            if self._settings is None:
+                settings = Settings()
+                update_settings(settings=settings)
+                object.__setattr__(self, '_settings', settings)
+        return self._settings
+
+    def __getattr__(self, name: str):
+        if self._settings is None:
+            self._setup()
+        return getattr(self._settings, name)
+
+    def __setattr__(self, name: str, value):
+        if self._settings is None:
+            self._setup()
+        setattr(self._settings, name, value)
+
+    def __repr__(self):
+        return repr(self._setup())
+
+
+settings = LazySettings()
@@ -1,6 +1,7 @@
 import csv
 import os
 import platform
+from collections import ChainMap
 from typing import TYPE_CHECKING
 
 from xdg import (
@@ -13,6 +14,7 @@ from xdg import (
     xdg_state_home,
 )
 
+from tackle.scopes import merge_frames
 from tackle.settings import settings
 
 if TYPE_CHECKING:
@@ -114,10 +116,13 @@ def _private_data(context: 'Context'):
 
 
 def _temporary_data(context: 'Context'):
-    return context.data.temporary
+    return merge_frames(context.data)
 
 
 def _existing_data(context: 'Context'):
+    if isinstance(context.data.existing, ChainMap):
+        # Declarative hooks read the caller's data through an overlay
+        return dict(context.data.existing)
     return context.data.existing
 
 
@@ -5,10 +5,15 @@ to unpack input args/kwargs and in parser to unpack hook calls -
 i.e. key->: hook arg --kwarg thing --flag
 Parsed into args=['arg'], kwargs={'kwarg':'thing'}, flags=['flag']
 
-NOTE: This is dirty code but works. Should be replaced by PEG parser. See proposals
+Strings are split into tokens in a single pass on spaces outside of quotes and
+ brackets so that literals (ie `{"foo": "bar baz"}`) and templates (ie `{{ foo }}`) are
+ kept whole. Each token is then interpreted as a literal.
 """
 import ast
+import copy
 import re
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from tackle.types import DocumentValueType
 
@@ -55,89 +60,140 @@ def literal_eval(input_value):
                 return input_value
 
 
-# Inspired from https://stackoverflow.com/a/524796/12642712
-# Split on whitespace or `=`
-# When quotes are preceded by `,:{[(=`, ignore
-# Don't split between quotes with `,:]})`
-# Otherwise split on quotes
-# Repeated for single quotes
-SPLIT_PATTERN = re.compile(
-    "( |(?<!,|\:|\(|\{|\[|=)\\\"(?!\,|\:|\)|\}|\]).*?\\\"(?!\}|\])|(?<!\,|\:|\(|\{|\[|=)'(?!,|\:|\)|\}|\]).*?'(?!\}|\]))"  # noqa
-)
+BRACKETS = {'(': ')', '[': ']', '{': '}'}
+FLAG_REGEX = re.compile(r"^[\-|\-\-]+[a-zA-Z0-9]")
+# Characters which can start / end a token or change the nesting
+SPECIAL_CHARS_REGEX = re.compile(r"""[ "'()\[\]{}]""")
+QUOTED_REGEXES = {
+    '"': re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL),
+    "'": re.compile(r"'(?:[^'\\]|\\.)*'", re.DOTALL),
+}
 
 
-def split_input_string(input_string: str) -> list:
+def _split_tokens(input_string: str, brackets: bool) -> list[str] | None:
     """
-    Split first on whitespace then regex each item to qualify if it needs to be
-     interpreted as literal.
+    Split the string on spaces outside of quotes and (when `brackets` is set) brackets.
+     Returns None if a bracket is never closed.
     """
-    input_list = [
-        i
-        for i in re.split(
-            SPLIT_PATTERN,
-            str(input_string),
-        )
-        if i.strip()
-    ]
+    tokens = []
+    closers = []
+    # Quotes that have no closing quote after the current position, ie an apostrophe
+    unclosed_quotes = set()
+    token_start = 0
+    i = 0
+    while True:
+        # Jump to the next character that matters
+        match = SPECIAL_CHARS_REGEX.search(input_string, i)
+        if match is None:
+            break
+        i = match.start()
+        c = input_string[i]
+        if c == ' ':
+            if not closers:
+                if token_start < i:
+                    tokens.append(input_string[token_start:i])
+                token_start = i + 1
+        elif c in QUOTED_REGEXES:
+            if c not in unclosed_quotes:
+                quoted = QUOTED_REGEXES[c].match(input_string, i)
+                if quoted is not None:
+                    i = quoted.end()
+                    continue
+                unclosed_quotes.add(c)
+        elif brackets:
+            if c in BRACKETS:
+                closers.append(BRACKETS[c])
+            elif closers and c == closers[-1]:
+                closers.pop()
+        i += 1
+    if closers:
+        return None
+    if token_start < len(input_string):
+        tokens.append(input_string[token_start:])
+    return tokens
+
 
+def split_input_tokens(input_string: str) -> list[str]:
+    """
+    Split the input string into the raw strings of each token in a single pass. Tokens
+     are separated by spaces (not newlines so multi-line strings are preserved) which
+     are not within quotes or brackets. If there are unbalanced brackets, only quotes
+     are considered.
+    """
+    input_string = str(input_string)
+    tokens = _split_tokens(input_string, brackets=True)
+    if tokens is None:
+        tokens = _split_tokens(input_string, brackets=False)
     # Remove the '=' that are split out into their own item
-    input_list = [i for i in input_list if i != '=']
+    return [i for i in tokens if i.strip() and i != '=']
 
-    output = []
-    for i in input_list:
-        output.append(literal_eval(i))
-    return output
 
+def split_input_string(input_string: str) -> list:
+    """Split the input string into tokens which are interpreted as literals."""
+    return [literal_eval(i) for i in split_input_tokens(input_string)]
 
-def unpack_args_kwargs_string(input_string: str) -> (list, dict, list):
-    """Split up based on whitespace input args and pass to unpack_args_kwargs_list."""
-    input_list = split_input_string(input_string)
 
-    args, kwargs, flags = unpack_args_kwargs_list(input_list)
+class ArgsKwargsFlags(NamedTuple):
+    """Frozen args / kwargs / flags parsed from a string so that it can be cached."""
 
-    clean_kwargs = {k.replace('-', '_'): v for k, v in kwargs.items()}
-    clean_flags = [i.replace('-', '_') for i in flags]
+    args: tuple[Any, ...]
+    kwargs: tuple[tuple[str, Any], ...]
+    flags: tuple[str, ...]
 
-    return args, clean_kwargs, clean_flags
-    # return unpack_args_kwargs_list(input_list)
+    def unpack(self) -> (list, dict, list):
+        """Return fresh copies that callers are free to modify."""
+        return (
+            [copy_value(i) for i in self.args],
+            {k: copy_value(v) for k, v in self.kwargs},
+            list(self.flags),
+        )
 
 
-def assert_if_flag(arg: str):
-    FLAG_REGEX = re.compile(
-        r"""^[\-|\-\-]+[a-zA-Z0-9]""",
-        re.VERBOSE,
-    )
-    return bool(FLAG_REGEX.match(str(arg)))
+def copy_value(value: Any) -> Any:
+    """Copy literals that can be mutated (ie lists / dicts), others are immutable."""
+    if isinstance(value, (list, dict, set)):
+        return copy.deepcopy(value)
+    return value
 
 
-def get_kwargs_till_flag(
-    input_list: list, i: int, input_list_length: int
-) -> (list, int):
+@lru_cache(maxsize=4096)
+def parse_args_kwargs_string(input_string: str) -> ArgsKwargsFlags:
     """
-    Get the remaining kwargs till we hit another flag (ie kwarg or flag - something
-     with `--` in it). Need this so that we can join the kwarg in order into a single
-     string.
+    Split up based on whitespace input args and unpack them into args, kwargs, and
+     flags. The result is cached per string so it is frozen - use `unpack` to modify it.
     """
-    kwargs = []
-    i += 1
-    while i < input_list_length:
-        raw_arg = input_list[i]
-        if assert_if_flag(raw_arg):
-            return ' '.join(kwargs), i - 1
-
-        # Look ahead for if the last item is a flag
-        if i + 1 > input_list_length:
-            next_raw_arg = input_list[i + 1]
-            if assert_if_flag(next_raw_arg):
-                return ' '.join(kwargs), i
-        else:
-            kwargs.append(str(raw_arg))
-            i += 1
-    return ' '.join(kwargs), i
+    raw_list = split_input_tokens(input_string)
+    input_list = [literal_eval(i) for i in raw_list]
 
+    args, kwargs, flags = _unpack_args_kwargs(input_list, raw_list)
 
-def unpack_args_kwargs_list(input_list: list) -> (list[DocumentValueType], dict, list):
-    """Take the input_list of strings and unpack the args, kwargs, and flags."""
+    return ArgsKwargsFlags(
+        args=tuple(args),
+        kwargs=tuple((k.replace('-', '_'), v) for k, v in kwargs.items()),
+        flags=tuple(i.replace('-', '_') for i in flags),
+    )
+
+
+def unpack_args_kwargs_string(input_string: str) -> (list, dict, list):
+    """Split up based on whitespace input args and pass to unpack_args_kwargs_list."""
+    # Input is split on its string representation anyways
+    return parse_args_kwargs_string(str(input_string)).unpack()
+
+
+def assert_if_flag(arg: str) -> bool:
+    return bool(FLAG_REGEX.match(str(arg)))
+
+
+def _unpack_args_kwargs(
+    input_list: list,
+    raw_list: list[str] | None = None,
+) -> (list[DocumentValueType], dict, list):
+    """
+    Unpack the args, kwargs, and flags in a single pass. A flag followed by another flag
+     (or nothing) is a flag, otherwise it is a kwarg taking either the next non-string
+     value or all the strings up until the next flag. Those are joined from the raw
+     tokens in `raw_list` when given so that quotes within them are preserved.
+    """
     input_list_length = len(input_list)
     args = []
     kwargs = {}
@@ -146,42 +202,41 @@ def unpack_args_kwargs_list(input_list: list) -> (list[DocumentValueType], dict,
     i = 0
     while i < input_list_length:
         raw_arg = input_list[i]
-
-        # Look ahead for if the last item is a flag
-        if i + 1 < input_list_length:
-            next_raw_arg = input_list[i + 1]
-        else:
-            # Hack for asserting if a flag - two items starting with a dash or last item
-            next_raw_arg = "--hack"
-
-        if isinstance(raw_arg, str):
-            # if raw_arg.startswith('-'):
-            if assert_if_flag(raw_arg):
-                if isinstance(next_raw_arg, str):
-                    # if next_raw_arg.startswith('-'):
-                    if assert_if_flag(next_raw_arg):
-                        # Field is a flag
-                        flags.append(strip_dashes(raw_arg))
-                    else:
-                        # Field is a kwarg
-                        new_kwarg, new_index = get_kwargs_till_flag(
-                            input_list=input_list,
-                            i=i,
-                            input_list_length=input_list_length,
-                        )
-                        kwargs.update({strip_dashes(raw_arg): new_kwarg})
-                        i = new_index
-                else:
-                    # Field is a kwarg
-                    # TODO: Should this be part of joining logic?
-                    kwargs.update({strip_dashes(raw_arg): input_list[i + 1]})
-                    i += 1
-            else:
-                # Field is an argument
-                args.append(raw_arg)
-        else:
+        if not isinstance(raw_arg, str) or not assert_if_flag(raw_arg):
             # Field is an argument
             args.append(raw_arg)
+            i += 1
+            continue
 
-        i += 1
+        key = strip_dashes(raw_arg)
+        if i + 1 == input_list_length:
+            # Field is a flag as it is the last item
+            flags.append(key)
+            i += 1
+            continue
+
+        next_raw_arg = input_list[i + 1]
+        if not isinstance(next_raw_arg, str):
+            # Field is a kwarg
+            kwargs[key] = next_raw_arg
+            i += 2
+        elif assert_if_flag(next_raw_arg):
+            # Field is a flag
+            flags.append(key)
+            i += 1
+        else:
+            # Field is a kwarg with all the values till the next flag
+            end = i + 2
+            while end < input_list_length and not assert_if_flag(input_list[end]):
+                end += 1
+            if raw_list is None or end == i + 2:
+                kwargs[key] = ' '.join(str(j) for j in input_list[i + 1 : end])
+            else:
+                kwargs[key] = ' '.join(raw_list[i + 1 : end])
+            i = end
     return args, kwargs, flags
+
+
+def unpack_args_kwargs_list(input_list: list) -> (list[DocumentValueType], dict, list):
+    """Take the input_list of strings and unpack the args, kwargs, and flags."""
+    return _unpack_args_kwargs(input_list)
@@ -1,7 +1,8 @@
 """
 Utils for modifying complex dictionaries generally based on an encoded key_path which is
-a list of strings for key value lookups and byte encoded integers for items in a list.
+a list of strings for key value lookups and `ListIndex` ints for items in a list.
 """
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Union
 
 from ruyaml.comments import CommentedKeyMap
@@ -9,43 +10,75 @@ from ruyaml.comments import CommentedKeyMap
 from tackle import exceptions
 
 if TYPE_CHECKING:
-    from tackle.context import Context
+    from tackle.context import Context, Data
 
 
-def encode_list_index(list_index: int) -> bytes:
-    """Encode an index for lists in a key path to bytes."""
-    return list_index.to_bytes(2, byteorder='big')
+class ListIndex(int):
+    """
+    Index of an item in a list within a key path. Is a distinct type so that it is not
+     confused with int keys in dicts and, being an int, is used to index lists as is.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f'ListIndex({int(self)})'
+
+    def __str__(self) -> str:
+        return int.__repr__(self)
+
+
+# Key paths used to encode list indexes in bytes which are still accepted
+LIST_INDEX_TYPES = (ListIndex, bytes)
+# Indexes are pushed onto the key path for every item in a loop so small ones are reused
+LIST_INDEXES = tuple(ListIndex(i) for i in range(1024))
+
+
+def encode_list_index(list_index: int) -> ListIndex:
+    """Encode an index for lists in a key path."""
+    if 0 <= list_index < 1024:
+        return LIST_INDEXES[list_index]
+    return ListIndex(list_index)
 
 
-def decode_list_index(list_index: bytes) -> int:
-    """Decode an index for lists in a key path from bytes."""
-    return int.from_bytes(list_index, byteorder='big')
+def decode_list_index(list_index: ListIndex | bytes) -> int:
+    """Decode an index for lists in a key path, including legacy bytes encoded ones."""
+    if isinstance(list_index, bytes):
+        return int.from_bytes(list_index, byteorder='big')
+    return list_index
+
+
+@lru_cache(maxsize=1024)
+def parse_key_path_string(path: str, sep: str) -> tuple:
+    """Split a string key path (ie path/to/0/key) into its keys and list indexes."""
+    keys = []
+    for i in path.split(sep):
+        try:
+            keys.append(encode_list_index(int(i)))
+        except ValueError:
+            keys.append(i)
+    return tuple(keys)
 
 
 def encode_key_path(path: Union[list, str], sep: str = "/") -> list:
     """
-    Take a list or string key_path and encode it with bytes for items in a list. Strings
+    Take a list or string key_path and encode the ints in it as list indexes. Strings
      are split up based on a separator, ie path/to/key.
     """
     if isinstance(path, str):
-        path = path.split(sep)
-        for i, v in enumerate(path):
-            try:
-                # Try to convert strings to ints
-                path[i] = int(v)
-            except ValueError:
-                pass
-        path = [i if not isinstance(i, int) else encode_list_index(i) for i in path]
-
-    # Need to encode keys into bytes as that is how internally the parser works so
-    # it doesn't jam up on any integer key. This hook will fail if the key is an
-    # int.
-    path = [i if not isinstance(i, int) else encode_list_index(i) for i in path]
+        return list(parse_key_path_string(path, sep))
+
     if isinstance(path, dict):
         # Could have key path expressed as dict?
         raise NotImplementedError
 
-    return path
+    # Need to encode ints as list indexes as that is how internally the parser works so
+    # it doesn't jam up on any integer key. This hook will fail if the key is an
+    # int.
+    return [
+        encode_list_index(decode_list_index(i)) if isinstance(i, (int, bytes)) else i
+        for i in path
+    ]
 
 
 def get_key_from_key_path(key_path: list) -> str:
@@ -62,14 +95,14 @@ def get_readable_key_path(key_path: list) -> str:
     """Take key_path and return the nearest key from end removing arrows."""
     readable_key_path = []
     for i in key_path:
-        if i in ('->', '_>'):
+        if isinstance(i, LIST_INDEX_TYPES):
+            readable_key_path.append(str(decode_list_index(i)))
+        elif i in ('->', '_>'):
             continue
             # return '.'.join(readable_key_path)
         elif i[-2:] in ('->', '_>'):
             readable_key_path.append(i[:-2])
             continue
-        if isinstance(i, bytes):
-            readable_key_path.append(str(decode_list_index(i)))
         else:
             readable_key_path.append(i)
     return '.'.join(readable_key_path)
@@ -78,12 +111,12 @@ def get_readable_key_path(key_path: list) -> str:
 def nested_delete(element: Union[dict, list], keys: list):
     """
     Delete items in a generic element (list / dict) based on a key path in the form of
-     a list with strings for keys and byte encoded integers for indexes in a list.
+     a list with strings for keys and list indexes for indexes in a list.
     """
     num_elements = len(keys)
 
     if num_elements == 1:
-        if isinstance(keys[0], bytes):
+        if isinstance(keys[0], LIST_INDEX_TYPES):
             element.pop(decode_list_index(keys[0]))
             return element
 
@@ -92,7 +125,7 @@ def nested_delete(element: Union[dict, list], keys: list):
             return
 
     elif num_elements == 2:
-        if isinstance(keys[0], bytes) and isinstance(keys[1], str):
+        if isinstance(keys[0], LIST_INDEX_TYPES) and isinstance(keys[1], str):
             # Case for when we have an embedded item in a list but don't know if it is
             # a map with multiple keys that needs to have a single key removed or the
             # whole item itself
@@ -104,7 +137,7 @@ def nested_delete(element: Union[dict, list], keys: list):
                     return
 
                 return nested_delete(element[decode_list_index(keys[0])], keys[1:])
-        elif isinstance(keys[0], str) and isinstance(keys[1], bytes):
+        elif isinstance(keys[0], str) and isinstance(keys[1], LIST_INDEX_TYPES):
             return nested_delete(element[keys[0]], keys[1:])
 
         elif isinstance(keys[0], str) and isinstance(keys[1], str):
@@ -115,7 +148,7 @@ def nested_delete(element: Union[dict, list], keys: list):
                 element[keys[0]] = None
                 return
 
-    if isinstance(keys[0], bytes):
+    if isinstance(keys[0], LIST_INDEX_TYPES):
         return nested_delete(element[decode_list_index(keys[0])], keys[1:])
 
     return nested_delete(element[keys[0]], keys[1:])
@@ -126,63 +159,64 @@ def nested_get(element: Union[dict, list], keys: list):
     Getter for dictionary / list elements based on a key_path.
 
     :param element: A generic dictionary or list
-    :param keys: A list of string and byte encoded integers.
+    :param keys: A list of strings and list indexes.
     :return: The value from the key_path
     """
-    num_elements = len(keys)
+    for key in keys:
+        if isinstance(key, LIST_INDEX_TYPES):
+            element = element[decode_list_index(key)]
+        else:
+            element = element[key]
+    return element
 
-    if num_elements == 0:
-        return element
 
-    if num_elements == 1:
-        if isinstance(keys[0], bytes):
-            return element[decode_list_index(keys[0])]
-        return element[keys[0]]
+def get_child_container(element: Union[dict, list], key: Any, next_key: Any):
+    """
+    Get the container at `key` within the element, creating it if it doesn't exist as
+     either a list or a dict depending on whether the next key is a list index.
+    """
+    if isinstance(element, dict):
+        # Look ahead if the next item is a list
+        if isinstance(next_key, LIST_INDEX_TYPES):
+            return element.setdefault(key, [])
+        return element.setdefault(key, {})
 
-    if isinstance(keys[0], bytes):
-        return nested_get(element[decode_list_index(keys[0])], keys[1:])
-    return nested_get(element[keys[0]], keys[1:])
+    # element must be list
+    # Check if we are updating an existing element
+    list_index = decode_list_index(key)
+    if len(element) <= list_index:
+        element.insert(list_index, [] if isinstance(next_key, LIST_INDEX_TYPES) else {})
+    return element[list_index]
+
+
+def set_item(element: Union[dict, list], key: Any, value: Any):
+    """Set the value of a key in a dict or insert it at a list index in a list."""
+    if isinstance(key, LIST_INDEX_TYPES):
+        element.insert(decode_list_index(key), value)
+    else:
+        element[key] = value
 
 
 def nested_set(element: Union[dict, list], keys: list, value: Any, index: int = 0):
     """
     Set the value of an arbitrary object based on a key_path in the form of a list
-     with strings for keys and byte encoded integers for indexes in a list. This
-     function recurses through the element until it is at the end of the keys where it
+     with strings for keys and list indexes for indexes in a list. This
+     function walks through the element until it is at the end of the keys where it
      sets it.
 
     :param element: A generic dictionary or list
-    :param keys: A list of string and byte encoded integers.
+    :param keys: A list of strings and list indexes.
     :param value: The value to set
-    :param index: Index is only used when called recursively, not initially
+    :param index: The index in the keys to start from
     """
-    num_elements = len(keys)
-    # Check if we are at the last element of the list to insert the value
-    if index == num_elements - 1:
-        if isinstance(keys[-1], bytes):
-            element.insert(decode_list_index(keys[-1]), value)
-        else:
-            element[keys[-1]] = value
-        return
+    for i in range(index, len(keys) - 1):
+        element = get_child_container(element, keys[i], keys[i + 1])
+    set_item(element, keys[-1], value)
 
-    if isinstance(element, dict):
-        # Look ahead if the next item is a list
-        if isinstance(keys[index + 1], bytes):
-            element = element.setdefault(keys[index], [])
-        else:
-            element = element.setdefault(keys[index], {})
 
-    # element must be list
-    # Check if we are updating an existing element
-    elif len(element) > decode_list_index(keys[index]):
-        element = element[decode_list_index(keys[index])]
-    else:
-        if isinstance(keys[index + 1], bytes):
-            element.insert(decode_list_index(keys[index]), [])
-        else:
-            element.insert(decode_list_index(keys[index]), {})
-        element = element[decode_list_index(keys[index])]
-    nested_set(element=element, keys=keys, value=value, index=index + 1)
+def new_root(first_key: Any) -> Union[dict, list]:
+    """Create the root of the public / private data based on the first key written."""
+    return [] if isinstance(first_key, LIST_INDEX_TYPES) else {}
 
 
 def get_target_and_key(
@@ -209,11 +243,11 @@ def get_target_and_key(
         # We check if we are writing to a list or a dict first as dicts are default
         # but need to change the type here if we are writing to a list
         if not context.data.public:
-            context.data.public = [] if isinstance(output_key_path[0], bytes) else {}
+            context.data.public = new_root(output_key_path[0])
         target_context = context.data.public
     else:
         if not context.data.private:
-            context.data.private = [] if isinstance(output_key_path[0], bytes) else {}
+            context.data.private = new_root(output_key_path[0])
         target_context = context.data.private
 
     return target_context, output_key_path
@@ -228,55 +262,139 @@ def remove_arrows_from_key_path(key_path: list) -> list:
     return output
 
 
-def set_temporary_context(
-    context: 'Context',
-    value: Any,
-    key_path: list,
-) -> None:
+def set_block_frame_key(context: 'Context', key_path: list, value: Any) -> None:
     """
-    When setting data within a block, we need to not only set the public/private data
-     but also temporary data which is indexed based on the nearest keys to the block.
+    When setting data within a block, reference it in the block's frame by the key
+     nearest to the block so that it can be rendered by the items after it. For
+     instance - key_path = ['foo', '->', 'bar'] + key_path_block = ['foo', '->'] is
+     referenced by `bar`. Values set deeper (ie at `bar.baz`) are referenced by the
+     container they are set in so that nothing is copied.
     """
-    # Remove as many items off the key_path as we are indexed into a block
-    # For instance - key_path = ['foo', 'bar'] + key_path_block = ['foo'] then
-    # tmp_key_path = ['bar']
-    tmp_key_path = key_path[len(context.key_path_block) :]
-
-    if len(tmp_key_path) == 0:
-        # Nothing to set in tmp context
+    keys = [i for i in key_path[len(context.key_path_block) :] if i not in ('->', '_>')]
+    if len(keys) == 0 or isinstance(keys[0], LIST_INDEX_TYPES):
+        # Nothing to reference / items in a list are not referenced by name
+        return
+    if len(keys) == 1:
+        context.block_frame[keys[0]] = value
         return
+    target_context, set_key_path = get_target_and_key(context, key_path=key_path)
+    depth = len(set_key_path) - len(keys) + 1
+    context.block_frame[keys[0]] = nested_get(target_context, set_key_path[:depth])
 
-    # Check if temp data is None and create an empty dict otherwise
-    if context.data.temporary is None or len(context.data.temporary) == 0:
-        if isinstance(tmp_key_path[0], bytes):
-            # We don't need to worry about tmp data when we are inside a list
-            return
-        context.data.temporary = {}
-    # Clean the key path of arrows
-    tmp_key_path = [i for i in tmp_key_path if i not in ('->', '_>')]
 
-    if len(tmp_key_path) == 0:
-        # Nothing to set in tmp context
+def set_block_frame_output(context: 'Context') -> None:
+    """
+    Used after hooks with indented contexts (ie block/match) which write their output
+     to the public / private data themselves, it references that output in the block's
+     frame so that it can be used for rendering.
+    """
+    target_context, set_key_path = get_target_and_key(context, context.key_path)
+    try:
+        value = nested_get(element=target_context, keys=set_key_path)
+    except (KeyError, IndexError, TypeError):
+        # The hook did not write anything
         return
+    set_block_frame_key(context=context, key_path=context.key_path, value=value)
 
-    nested_set(element=context.data.temporary, keys=tmp_key_path, value=value)
 
-
-def get_set_temporary_context(
-    context: 'Context',
-) -> None:
+class WriteCursor:
     """
-    Used in hooks with indented contexts (ie block/match), it gets the output of the
-     target context (public / private) sets that value within the temporary context
-     so that it can be used for rendering.
+    Keeps references to the containers along the current key path in both the public
+     and private data so that setting a value at the key path is a single assignment
+     instead of a walk down from the root. Keys are pushed / popped along with the key
+     path (see `push_key` / `pop_key`) and containers are resolved on the first write
+     beneath them. Hooks can modify the data arbitrarily so the cursor is dropped after
+     any hook that has the context injected and is rebuilt from the key path on the
+     next write.
     """
-    target_context, set_key_path = get_target_and_key(context, context.key_path)
-    value = nested_get(element=target_context, keys=set_key_path)
-    set_temporary_context(
-        context=context,
-        value=value,
-        key_path=context.key_path,
-    )
+
+    __slots__ = ('key_path', 'keys', 'is_private', 'containers')
+
+    def __init__(self, key_path: list):
+        # A copy of the key path to check it is in sync with the context's
+        self.key_path = []
+        # The key path without arrows which is the same in the public / private data
+        self.keys = []
+        # Whether each key is written to the private data based on the last arrow
+        self.is_private = [False]
+        # The containers along the keys in the public / private data with the root
+        #  first - ie `containers[0][i]` is the public container at `keys[:i]`
+        self.containers = ([], [])
+        for i in key_path:
+            self.push(i)
+
+    def push(self, key: Any):
+        self.key_path.append(key)
+        if key in ('->', '_>'):
+            self.is_private.append(key == '_>')
+        else:
+            self.keys.append(key)
+            self.is_private.append(self.is_private[-1])
+
+    def pop(self):
+        key = self.key_path.pop()
+        self.is_private.pop()
+        if key not in ('->', '_>'):
+            self.keys.pop()
+            # The containers beneath the popped key are no longer on the key path
+            depth = len(self.keys) + 1
+            del self.containers[0][depth:]
+            del self.containers[1][depth:]
+
+    def is_synced(self, key_path: list) -> bool:
+        """Check the key path wasn't modified without going through the cursor."""
+        if len(self.key_path) != len(key_path):
+            return False
+        return not key_path or self.key_path[-1] is key_path[-1]
+
+    def set(self, data: 'Data', value: Any):
+        """Set the value at the current key path in the public or private data."""
+        keys = self.keys
+        depth = len(keys)
+        is_private = self.is_private[-1]
+        if is_private:
+            if not data.private:
+                data.private = new_root(keys[0])
+            root = data.private
+        else:
+            if not data.public:
+                data.public = new_root(keys[0])
+            root = data.public
+
+        containers = self.containers[is_private]
+        if not containers or containers[0] is not root:
+            containers.clear()
+            containers.append(root)
+        else:
+            # The container at the current key (if any) is being overwritten
+            del containers[depth:]
+        element = containers[-1]
+        for i in range(len(containers) - 1, depth - 1):
+            element = get_child_container(element, keys[i], keys[i + 1])
+            containers.append(element)
+        set_item(element, keys[-1], value)
+
+
+def get_write_cursor(context: 'Context') -> WriteCursor:
+    """Get the context's write cursor, rebuilding it if it is missing / out of sync."""
+    write_cursor = context.write_cursor
+    if write_cursor is None or not write_cursor.is_synced(context.key_path):
+        write_cursor = context.write_cursor = WriteCursor(context.key_path)
+    return write_cursor
+
+
+def push_key(context: 'Context', key: Any):
+    """Append a key to the key path, keeping the write cursor in sync."""
+    context.key_path.append(key)
+    if context.write_cursor is not None:
+        context.write_cursor.push(key)
+
+
+def pop_key(context: 'Context'):
+    """Pop the last key off the key path, keeping the write cursor in sync."""
+    context.key_path.pop()
+    if context.write_cursor is not None:
+        context.write_cursor.pop()
 
 
 def set_key(
@@ -285,34 +403,40 @@ def set_key(
     key_path: list = None,
 ):
     """
-    Wrap nested_set to set keys for both public and private hook calls.
+    Set keys for both public and private hook calls.
 
     For public hook calls, qualifies if the hook is compact form (ie key->) or expanded
      (ie key: {->:..}) before setting the output. For private hook calls, the key and
      all parent keys without additional objects are deleted later as they might be
      used in rendering so they are added as well but their key paths are tracked for
-     later deletion.
+     later deletion. Values at the current key path are set through the context's
+     write cursor while other key paths (ie merges) are walked from the root.
     """
     if key_path is None:
         key_path = context.key_path
-
-    target_context, set_key_path = get_target_and_key(context, key_path=key_path)
+        write_cursor = get_write_cursor(context)
+    else:
+        # Writes outside of the key path could replace the cursor's containers
+        write_cursor = context.write_cursor = None
 
     try:
-        nested_set(target_context, set_key_path, value)
+        if write_cursor is not None and write_cursor.keys:
+            write_cursor.set(context.data, value)
+        else:
+            target_context, set_key_path = get_target_and_key(
+                context, key_path=key_path
+            )
+            nested_set(target_context, set_key_path, value)
     except TypeError as e:
+        target_context, _ = get_target_and_key(context, key_path=key_path)
         raise exceptions.GeneralException(
-            f"Error setting key at key=`{get_readable_key_path(set_key_path)}`\n{e}\n"
+            f"Error setting key at key=`{get_readable_key_path(key_path)}`\n{e}\n"
             f"target type=`{type(target_context).__name__}`.",
         )
 
-    if len(context.key_path_block) != 0:
+    if context.block_frame is not None:
         # When inside a block
-        if isinstance(value, (list, dict)):
-            # Whenever we are writing to temporary data we want to copy that
-            value = value.copy()
-        # Write to temporary data
-        set_temporary_context(context=context, value=value, key_path=key_path)
+        set_block_frame_key(context=context, key_path=key_path, value=value)
 
 
 def _clean_item(element: Union[dict, list], item: Union[int, str], value: Any):
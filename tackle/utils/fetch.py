@@ -0,0 +1,104 @@
+"""
+Resolve remote providers (see `tackle.utils.vcs`) in parallel, ie all the sources of
+ the `import` hook calls in a document, so that importing them afterwards in order is
+ served from the local worktrees.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+from tackle.settings import settings
+from tackle.utils.command import unpack_args_kwargs_string
+from tackle.utils.paths import is_repo_url
+from tackle.utils.vcs import get_repo_source
+
+HOOK_CALL_ARROWS = ('->', '_>')
+
+
+class RemoteSource(NamedTuple):
+    src: str
+    version: str | None = None
+    latest: bool | None = None
+
+
+def fetch_remote_sources(
+    sources: list[RemoteSource],
+    max_workers: int = None,
+) -> dict[RemoteSource, str]:
+    """
+    Resolve the remote sources with a bounded thread pool, returning the directories
+     of the sources in the order they were given. Sources that are not remote (ie
+     local directories) are skipped. Errors are raised in the order of the sources.
+    """
+    remote_sources = list(dict.fromkeys(i for i in sources if is_repo_url(i.src)))
+    if len(remote_sources) == 0:
+        return {}
+    if max_workers is None:
+        max_workers = settings.fetch_workers
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(remote_sources))),
+        thread_name_prefix='tackle-fetch',
+    ) as executor:
+        futures = [
+            executor.submit(get_repo_source, i.src, i.version, i.latest)
+            for i in remote_sources
+        ]
+    return {k: v.result() for k, v in zip(remote_sources, futures)}
+
+
+def _get_sources_from_import_args(value: Any) -> list[RemoteSource]:
+    """Get the sources from the input of an `import` hook call."""
+    if isinstance(value, str):
+        # ie `robcxyz/tackle-demos --version v0.1.0`
+        args, kwargs, flags = unpack_args_kwargs_string(input_string=value)
+        if len(args) != 1 or not isinstance(args[0], str):
+            return []
+        latest = True if 'latest' in flags else None
+        return [RemoteSource(args[0], kwargs.get('version'), latest)]
+    elif isinstance(value, list):
+        return [j for i in value for j in _get_sources_from_import_args(i)]
+    elif isinstance(value, dict):
+        src = value.get('src')
+        if isinstance(src, list):
+            return _get_sources_from_import_args(src)
+        elif isinstance(src, str):
+            return [RemoteSource(src, value.get('version'), value.get('latest'))]
+    return []
+
+
+def _get_import_args(hook_call: Any) -> str | None:
+    """Get the args from a hook call string if it calls the `import` hook."""
+    if isinstance(hook_call, str):
+        hook_name, _, args = hook_call.strip().partition(' ')
+        if hook_name == 'import':
+            return args
+    return None
+
+
+def get_import_sources(document: Any) -> list[RemoteSource]:
+    """
+    Find the sources of all the `import` hook calls in a document (ie the raw input of a
+     tackle file) in the order they are defined. Templated sources are skipped.
+    """
+    sources = []
+    if isinstance(document, list):
+        for i in document:
+            sources += get_import_sources(i)
+    elif isinstance(document, dict):
+        for arrow in HOOK_CALL_ARROWS:
+            # Expanded hook call -> ie `{'->': 'import', 'src': ...}`
+            args = _get_import_args(document.get(arrow))
+            if args is not None:
+                return _get_sources_from_import_args(args or document)
+        for k, v in document.items():
+            if isinstance(k, str) and k[-2:] in HOOK_CALL_ARROWS:
+                if k[:-2] == 'import':
+                    # ie `import->: robcxyz/tackle-demos`
+                    sources += _get_sources_from_import_args(v)
+                    continue
+                args = _get_import_args(v)
+                if args is not None:
+                    # ie `key->: import robcxyz/tackle-demos`
+                    sources += _get_sources_from_import_args(args)
+                    continue
+            sources += get_import_sources(v)
+    return [i for i in sources if '{{' not in i.src]
@@ -0,0 +1,166 @@
+"""
+On disk cache of parsed tackle files. Stores the parsed document along with its split
+ into pre / post input and declarative hook definitions (see
+ `tackle.parser.split_input_data`) so that subsequent runs on an unchanged file skip
+ both the yaml parsing and the macro expansion. Entries are keyed by the file's path,
+ mtime, and size so that hits don't need to read the file, and hold its content hash
+ to check files modified within the mtime resolution of the entry being written.
+ Reading an entry updates its mtime so that once there are more than
+ `settings.file_cache_size` entries, the least recently used ones are removed.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from tackle import __version__
+from tackle.models import LazyBaseHook
+from tackle.settings import settings
+from tackle.types import DocumentType
+
+logger = logging.getLogger(__name__)
+
+TACKLE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Files modified this close to an entry being written could have been modified again
+#  without changing their mtime (ie coarse mtimes) so their content hash is checked
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class CachedTackleFile:
+    key: str
+    raw_input: DocumentType
+    content_hash: str | None = None
+    cached_at_ns: int = field(default_factory=time.time_ns)
+    pre_input: DocumentType | None = None
+    post_input: DocumentType | None = None
+    # Declarative hooks in the order they were defined. None until the file is split.
+    hooks: list[LazyBaseHook] | None = None
+
+
+def get_cache_files_dir() -> str:
+    return os.path.join(settings.cache_dir, 'files')
+
+
+@lru_cache
+def get_tackle_source_fingerprint() -> str:
+    """
+    Fingerprint of tackle's own source so that entries are not reused when the parser /
+     macros change without a version bump (ie in a `local_install` checkout).
+    """
+    stats = []
+    for root, dirs, files in os.walk(TACKLE_DIRECTORY):
+        dirs[:] = sorted(i for i in dirs if i != '__pycache__')
+        for i in sorted(files):
+            if i.endswith('.py'):
+                stat = os.stat(os.path.join(root, i))
+                stats.append(f"{root}/{i}:{stat.st_mtime_ns}:{stat.st_size}")
+    return hashlib.sha256('\n'.join(stats).encode()).hexdigest()
+
+
+def get_tackle_file_cache_key(file: str, stat: os.stat_result | None = None) -> str:
+    """
+    Key from the file's path, mtime, and size plus tackle's version / source. The
+     `stat` can be given when the file was already stat'ed.
+    """
+    file = os.path.abspath(file)
+    if stat is None:
+        stat = os.stat(file)
+    key = (
+        f"{file}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{__version__}:{get_tackle_source_fingerprint()}:"
+        f"{sys.version_info.major}.{sys.version_info.minor}"
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def is_racy_cached_file(cached_file: CachedTackleFile, stat: os.stat_result) -> bool:
+    """
+    Check if the file was modified too close to the entry being written to trust its
+     mtime / size (see git's racy clean) in which case its content hash is checked.
+    """
+    return stat.st_mtime_ns >= cached_file.cached_at_ns - RACY_MTIME_WINDOW_NS
+
+
+def read_cached_tackle_file(key: str) -> CachedTackleFile | None:
+    """Read a cached tackle file returning None if it is missing or unreadable."""
+    path = os.path.join(get_cache_files_dir(), key + '.pickle')
+    try:
+        with open(path, 'rb') as f:
+            cached_file = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # noqa - Corrupt / incompatible entries are just misses
+        logger.debug(f"Ignoring unreadable cache entry {path} - {e}")
+        return None
+    if not isinstance(cached_file, CachedTackleFile) or cached_file.hooks is None:
+        return None
+    try:
+        # Mark the entry as recently used so that it is pruned last
+        os.utime(path)
+    except OSError:
+        pass
+    return cached_file
+
+
+def write_cached_tackle_file(cached_file: CachedTackleFile):
+    """Atomically write a cached tackle file so concurrent runs never read partials."""
+    cache_dir = get_cache_files_dir()
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(cached_file, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(cache_dir, cached_file.key + '.pickle'))
+    except (OSError, pickle.PicklingError) as e:
+        # Caching is best effort
+        logger.debug(f"Could not write cache entry for {cached_file.key} - {e}")
+        return
+    prune_tackle_file_cache(max_entries=settings.file_cache_size)
+
+
+def refresh_cached_tackle_file(cached_file: CachedTackleFile):
+    """Rewrite an entry whose content hash was checked so its mtime can be trusted."""
+    cached_file.cached_at_ns = time.time_ns()
+    write_cached_tackle_file(cached_file)
+
+
+def _get_mtime(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat().st_mtime_ns
+    except OSError:
+        # Removed by another run
+        return 0
+
+
+def prune_tackle_file_cache(max_entries: int):
+    """Remove the least recently used cached tackle files over the max entries."""
+    try:
+        entries = [
+            i for i in os.scandir(get_cache_files_dir()) if i.name.endswith('.pickle')
+        ]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=_get_mtime)
+    for entry in entries[: len(entries) - max_entries]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def clear_tackle_file_cache():
+    """Remove all the cached tackle files."""
+    shutil.rmtree(get_cache_files_dir(), ignore_errors=True)
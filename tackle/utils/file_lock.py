@@ -0,0 +1,85 @@
+"""
+Exclusive locks on files shared across processes, ie to coordinate concurrent runs
+ fetching the same provider. Uses `fcntl.flock` on unix and `msvcrt.locking` on
+ windows so the lock is released by the OS if the holder dies.
+"""
+import contextlib
+import logging
+import os
+import time
+from typing import Iterator
+
+from tackle import exceptions
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _read_holder(fd: int) -> str:
+    """Read the pid written by the holder of the lock for diagnostics."""
+    try:
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, 64).decode('utf-8').strip() or 'unknown'
+    except OSError:
+        return 'unknown'
+
+
+@contextlib.contextmanager
+def file_lock(
+    path: str,
+    timeout: float | None = None,
+    poll_interval: float = 0.05,
+) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file, waiting up to `timeout` seconds (forever when
+     None) for another holder to release it. The holder's pid is written to the file.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        start = time.monotonic()
+        waiting = False
+        while not _try_lock(fd):
+            if not waiting:
+                logger.debug(f"Waiting on pid={_read_holder(fd)} for lock {path}.")
+                waiting = True
+            if timeout is not None and time.monotonic() - start >= timeout:
+                raise exceptions.FileLockTimeout(
+                    f"Timed out after {timeout}s waiting for the lock `{path}` held by "
+                    f"pid={_read_holder(fd)}."
+                )
+            time.sleep(poll_interval)
+        try:
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, f'{os.getpid()}\n'.encode('utf-8'))
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
@@ -4,12 +4,16 @@ import logging
 import os
 
 from ruyaml import YAML
-from ruyaml.composer import ComposerError
-from ruyaml.constructor import ConstructorError
-from ruyaml.parser import ParserError
 
 from tackle import exceptions
 from tackle.utils.paths import make_sure_path_exists
+from tackle.utils.yaml_loaders import (
+    YAML_CONSTRUCTOR_ERRORS,
+    YAML_DUPLICATE_KEY_ERRORS,
+    YAML_PARSER_ERRORS,
+    load_yaml_file,
+    load_yaml_string,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,12 +43,15 @@ def dump(output_dir, output_name, output_dict, dump_output='yaml'):
             yaml.dump(output_dict, f)
 
 
-def read_config_file(file, file_extension=None):
-    """Read files into objects."""
+def read_config_file(file, file_extension=None, content: str | None = None):
+    """
+    Read files into objects. The `content` of the file can be given when it was already
+     read (ie to hash it) so that it is not read again.
+    """
     if not file_extension:
         file_extension = file.split('.')[-1]
 
-    if not os.path.exists(file):
+    if content is None and not os.path.exists(file):
         raise exceptions.TackleFileNotFoundError(
             f"Can't find the file {file}."
         ) from None
@@ -56,37 +63,40 @@ def read_config_file(file, file_extension=None):
     )
     try:
         if file_extension == 'json':
+            if content is not None:
+                return json.loads(content)
             with open(file) as f:
                 config = json.load(f)
             return config
         elif file_extension in ('yaml', 'yml'):
-            # Try normal and then for documents that will output as list
-            yaml = YAML(typ="safe")
+            # Documents with multiple documents are output as a list
             try:
-                with open(file, encoding='utf-8') as f:
-                    config = yaml.load(f)
-                return config
-            except ComposerError:
-                output = []
-                with open(file, encoding='utf-8') as f:
-                    for doc in yaml.load_all(f.read()):
-                        output.append(doc)
-                return output
-            except ConstructorError as e:
+                if content is not None:
+                    return load_yaml_string(content, name=file)
+                return load_yaml_file(file)
+            except YAML_DUPLICATE_KEY_ERRORS as e:
+                raise exceptions.FileLoadingException(
+                    f"Error loading file={file}\n{e}"
+                ) from None
+            except YAML_CONSTRUCTOR_ERRORS as e:
                 raise exceptions.FileLoadingException(
                     f"Error loading file={file}\n{e}\nLikely due to unquoted template "
                     "variable.\nie var: {{foo}}} | not var: '{{foo}}'"
                 ) from None
-            except ParserError as e:
+            except YAML_PARSER_ERRORS as e:
                 raise exceptions.FileLoadingException(
                     f"Error loading file={file}\n{e}",
                 ) from None
         elif file_extension == 'toml':
             try:
                 from tomli import load as toml_load
+                from tomli import loads as toml_loads
             except ModuleNotFoundError:
                 from tomllib import load as toml_load
+                from tomllib import loads as toml_loads
             # TODO: Catch these errors
+            if content is not None:
+                return toml_loads(content)
             with open(file, 'rb') as f:
                 data = toml_load(f)
             return data
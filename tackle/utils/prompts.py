@@ -2,13 +2,14 @@
 import os
 import sys
 
-from InquirerPy import prompt
 
 from tackle.utils.paths import rmtree
 
 
 def read_user_yes_no(question, default_value):
     """Ask user yes or no for generic question."""
+    from InquirerPy import prompt
+
     question = {
         'type': 'list',
         'name': 'tmp',
@@ -21,6 +22,8 @@ def read_user_yes_no(question, default_value):
 
 def confirm_prompt(question: str, default_value: bool = True) -> bool:
     """Ask user yes or no for generic question."""
+    from InquirerPy import prompt
+
     question = {
         'type': 'confirm',
         'name': 'tmp',
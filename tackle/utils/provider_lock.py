@@ -0,0 +1,93 @@
+"""
+Lock file pinning remote providers to the commit they were resolved to. While an entry
+ is fresh (see `settings.provider_lock_ttl`), an already cloned provider is resolved
+ from the local clone without any network calls (see `tackle.utils.vcs`).
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+
+from tackle.settings import settings
+from tackle.utils.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+LOCK_FILE_VERSION = 1
+
+
+@dataclass
+class LockedSource:
+    repo_url: str
+    # The commit the source was resolved to
+    sha: str
+    # What was asked for -> a branch / tag / commit or the latest commit / release
+    version: str | None = None
+    latest: bool = False
+    updated: float = field(default_factory=time.time)
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.updated < ttl
+
+
+def get_lock_file_path() -> str:
+    if settings.provider_lock_file is not None:
+        return settings.provider_lock_file
+    return os.path.join(settings.providers_dir, 'tackle.lock')
+
+
+def get_lock_key(repo_url: str, version: str | None, latest: bool | None) -> str:
+    """Key for a source which includes what was asked for, ie `<url>@v0.1.0`."""
+    if version is not None:
+        return f'{repo_url}@{version}'
+    elif latest:
+        return f'{repo_url}#latest'
+    return f'{repo_url}#release'
+
+
+def read_lock_file(path: str = None) -> dict[str, LockedSource]:
+    """Read the locked sources, returning an empty dict if there is no valid lock."""
+    path = path or get_lock_file_path()
+    try:
+        with open(path) as f:
+            lock = json.load(f)
+        if lock.get('version') != LOCK_FILE_VERSION:
+            return {}
+        return {k: LockedSource(**v) for k, v in lock['sources'].items()}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+        logger.debug(f"Ignoring invalid lock file {path} - {e}")
+        return {}
+
+
+def write_lock_file(sources: dict[str, LockedSource], path: str = None):
+    """Atomically write the lock file so concurrent runs never read partials."""
+    path = path or get_lock_file_path()
+    lock = {
+        'version': LOCK_FILE_VERSION,
+        'sources': {k: asdict(v) for k, v in sorted(sources.items())},
+    }
+    lock_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(lock_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=lock_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(lock, f, indent=2)
+            f.write('\n')
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def update_locked_source(key: str, source: LockedSource, path: str = None):
+    """Add or replace a single source in the lock file."""
+    path = path or get_lock_file_path()
+    # Concurrent runs could otherwise drop each other's sources
+    with file_lock(f'{path}.lock', timeout=settings.provider_lock_timeout):
+        sources = read_lock_file(path)
+        sources[key] = source
+        write_lock_file(sources, path)
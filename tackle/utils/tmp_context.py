@@ -2,20 +2,12 @@ from typing import Any
 
 from tackle import Context, DocumentValueType
 from tackle.parser import walk_document
+from tackle.scopes import scope_frame
 
 
 def f(context: Context, items: DocumentValueType) -> Any:
-    tmp_context = Context(
-        verbose=context.verbose,
-        no_input=context.no_input,
-        key_path=context.key_path.copy(),
-        key_path_block=context.key_path.copy(),
-        path=context.path,
-        data=context.data,
-        hooks=context.hooks,
-        source=context.source,
-    )
-
-    walk_document(context=tmp_context, value=items)
+    with scope_frame(context.data) as block_frame:
+        tmp_context = context.fork(block_frame=block_frame)
+        walk_document(context=tmp_context, value=items)
 
     return tmp_context.data.public
@@ -1,11 +1,27 @@
+"""
+Remote providers are stored as one shallow bare repo per remote along with immutable
+ worktrees, one per commit, so multiple versions can coexist and switching between
+ them never mutates a tree that another run may be reading.
+
+    <providers_dir>/<organization>/<provider_name>/repo.git  <- bare repo
+    <providers_dir>/<organization>/<provider_name>/<sha>     <- worktree per commit
+"""
 import logging
 import os
 import subprocess
+import time
 from shutil import which
 
 from tackle import exceptions
 from tackle.settings import settings
-from tackle.utils.paths import make_sure_path_exists, work_in
+from tackle.utils.file_lock import file_lock
+from tackle.utils.paths import rmtree
+from tackle.utils.provider_lock import (
+    LockedSource,
+    get_lock_key,
+    read_lock_file,
+    update_locked_source,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -72,191 +88,335 @@ def run_command(command: str) -> subprocess.Popen:
     return p
 
 
-def git_clone(repo_url):
-    """Git clone a repo."""
-    logger.debug(f'Cloning url=`{repo_url}`')
-    cmd = f'git clone {repo_url}'
-    p = run_command(cmd)
-    stdout, stderr = p.communicate()
-    if p.returncode == 0:
-        return
-    if 'not found' in str(stderr):
+def run_git(*args: str, cwd: str = None) -> subprocess.CompletedProcess:
+    """Run a git command in a directory without changing the working directory."""
+    return subprocess.run(
+        ['git', *args],
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+
+
+def raise_git_error(p: subprocess.CompletedProcess, repo_url: str = None):
+    """Raise an exception for a failed git command."""
+    if repo_url is not None and (
+        'not found' in p.stderr or 'does not exist' in p.stderr
+    ):
         raise exceptions.RepositoryNotFound(
             f'The repository {repo_url} could not be found, have you made a typo?'
         )
-    raise exceptions.GenericGitException(f'Error running {cmd}\n{str(stderr)}')
+    raise exceptions.GenericGitException(
+        f'Error running {" ".join(p.args)}\n{p.stderr}'
+    )
 
 
-def git_checkout(version: str):
-    """Git checkout a tag."""
-    cmd = f"Checkout version={version}."
-    logger.debug(cmd)
-    p = run_command(f"git checkout {version}")
-    stdout, stderr = p.communicate()
-    if p.returncode == 0:
-        return
-    if f"Already on '{version}'" in str(stderr):
-        return
-    if stderr:
-        # Don't know how this could happen
-        raise exceptions.VersionNotFoundError(f'Error running {cmd}\n{str(stderr)}')
-
-
-def git_stash():
-    cmd = 'git stash --include-untracked'
-    p = run_command(cmd)
-    stdout, stderr = p.communicate()
-    if p.returncode != 0:
-        raise exceptions.GenericGitException(
-            f'Error running {cmd}\n{str(stderr)}\n{os.listdir()}\n{os.path.abspath(".")}'
-        )
+def is_commit_sha(version: str) -> bool:
+    """Check if a version is a full commit sha (ie immutable)."""
+    return len(version) == 40 and all(i in '0123456789abcdef' for i in version)
 
 
-def git_pull(branch: str, provider_dir: str = None):
-    cmd = f'git pull origin {branch}'
-    p = run_command(cmd)
-    stdout, stderr = p.communicate()
-    if p.returncode == 0:
-        return
-    if stderr:
-        raise exceptions.GenericGitException(
-            f'Error running {cmd}\n{str(stderr)} in {provider_dir}'
-        )
+def get_worktree_commit(worktree: str) -> str:
+    """Get the commit of a worktree returned by `get_repo_source`."""
+    return os.path.basename(worktree)
+
 
+def get_store_dir(organization: str, provider_name: str) -> str:
+    """Directory with the bare repo and the worktrees of a remote provider."""
+    return os.path.join(settings.providers_dir, organization, provider_name)
 
-def get_default_branch():
-    """Get the default branch from the local git repo."""
-    cmd = "git branch -vv"
-    p = run_command(cmd)
-    stdout, stderr = p.communicate()
+
+def init_bare_repo(repo_url: str, bare_dir: str):
+    """Create an empty bare repo with the remote as `origin`, fetching nothing."""
+    p = run_git('init', '--bare', '--quiet', bare_dir)
     if p.returncode == 0:
-        for i in stdout.decode("utf-8").strip().splitlines():
-            if 'origin/' in i:
-                return i.split('/')[1].split(':')[0].split(']')[0]
+        p = run_git('remote', 'add', 'origin', repo_url, cwd=bare_dir)
+    if p.returncode != 0:
+        rmtree(bare_dir)
+        raise_git_error(p)
+
+
+def ls_remote(
+    bare_dir: str,
+    repo_url: str,
+    *patterns: str,
+    options: tuple[str, ...] = (),
+) -> dict[str, str]:
+    """List the remote's refs and the commits they point to with tags peeled."""
+    p = run_git('ls-remote', *options, 'origin', *patterns, cwd=bare_dir)
+    if p.returncode != 0:
+        raise_git_error(p, repo_url=repo_url)
+    refs = {}
+    for line in p.stdout.splitlines():
+        sha, ref = line.split('\t')
+        if ref.endswith('^{}'):
+            # Annotated tag -> use the commit it points to
+            refs[ref[: -len('^{}')]] = sha
         else:
-            raise ValueError("No idea why this would not work....")
-    else:
-        raise exceptions.GenericGitException(f'Error running {cmd}\n{str(stderr)}')
-
-
-def get_git_tags():
-    """Run the git command to get already fetched tags - does not make remote call."""
-    p = run_command("git tag")
-    stdout, stderr = p.communicate()
-    tags = stdout.decode('utf-8').strip().split('\n')
-    if tags[0] == '':
-        # No releases
-        return []
-    return tags
-
-
-def get_latest_release_from_remote():
-    """Get the latest release from the remote."""
-    cmd = "git ls-remote --tags --exit-code --refs origin"
-    p = run_command(cmd)
-    stdout, stderr = p.communicate()
-    if p.returncode == 0:
-        # last line is the latest release
-        return stdout.strip().splitlines()[-1].decode('utf-8').split('/')[-1]
-    elif p.returncode == 2:
-        # This indicates there is no release in the remote
-        return
+            refs.setdefault(ref, sha)
+    return refs
+
+
+def get_commit(bare_dir: str, ref: str) -> str | None:
+    """Get the full sha of a commit that is already in the bare repo."""
+    p = run_git('rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}', cwd=bare_dir)
+    if p.returncode != 0:
+        return None
+    return p.stdout.strip()
+
+
+def fetch_commit(bare_dir: str, repo_url: str, ref: str, sha: str = None) -> str:
+    """
+    Shallow fetch a single ref / commit, returning the sha of the commit. Nothing is
+     fetched if the commit (ie `sha` from `ls_remote`) is already in the bare repo.
+    """
+    local_sha = get_commit(bare_dir, sha or ref)
+    if local_sha is not None:
+        return local_sha
+    p = run_git('fetch', '--quiet', '--depth', '1', 'origin', ref, cwd=bare_dir)
+    if p.returncode != 0:
+        raise_git_error(p, repo_url=repo_url)
+    return get_commit(bare_dir, 'FETCH_HEAD')
+
+
+def fetch_history(bare_dir: str, repo_url: str):
+    """Fetch the full history of the remote's branches and tags."""
+    args = ['fetch', '--quiet', '--tags']
+    if os.path.isfile(os.path.join(bare_dir, 'shallow')):
+        args.append('--unshallow')
+    p = run_git(*args, 'origin', cwd=bare_dir)
+    if p.returncode != 0:
+        raise_git_error(p, repo_url=repo_url)
 
 
-def get_repo(
+def resolve_remote_commit(
+    bare_dir: str,
     repo_url: str,
-    org_dir: str,
-    provider_dir: str,
     version: str | None,
     latest: bool | None,
-):
+) -> str:
     """
-    For new providers, we need to clone the provider and check if there is a release
-     use that release.
+    Resolve what was asked for to a commit, fetching it if needed. Versions can be a
+     tag, branch, or commit while without a version, the latest release is used unless
+     there are no releases or `latest` is set in which case the remote's HEAD is used.
     """
-    make_sure_path_exists(os.path.expanduser(org_dir))
-    with work_in(org_dir):
-        git_clone(repo_url)
-    with work_in(provider_dir):
-        if version:
-            git_checkout(version)
-        elif latest:
-            # Already on latest
-            return
-        else:
-            latest_release = get_latest_release_from_remote()
-            if latest_release is not None:
-                git_checkout(latest_release)
+    if version is not None:
+        tag, head = f'refs/tags/{version}', f'refs/heads/{version}'
+        refs = ls_remote(bare_dir, repo_url, tag, head)
+        for ref in (tag, head):
+            if ref in refs:
+                return fetch_commit(bare_dir, repo_url, ref=ref, sha=refs[ref])
+        # Otherwise should be a commit
+        try:
+            return fetch_commit(bare_dir, repo_url, ref=version)
+        except exceptions.GenericGitException as e:
+            error = e
+        # Abbreviated shas can't be fetched by themselves so look for them in the
+        #  full history instead
+        try:
+            fetch_history(bare_dir, repo_url)
+        except exceptions.GenericGitException as e:
+            error = e
+        sha = get_commit(bare_dir, version)
+        if sha is None:
+            raise exceptions.VersionNotFoundError(
+                f"The version={version} was not found in {repo_url}.\n{error}"
+            ) from None
+        return sha
+
+    if not latest:
+        tags = ls_remote(bare_dir, repo_url, options=('--tags', '--sort=v:refname'))
+        if len(tags) != 0:
+            # Sorted by version so the last is the latest release
+            ref, sha = list(tags.items())[-1]
+            return fetch_commit(bare_dir, repo_url, ref=ref, sha=sha)
+    refs = ls_remote(bare_dir, repo_url, 'HEAD')
+    return fetch_commit(bare_dir, repo_url, ref='HEAD', sha=refs['HEAD'])
 
 
-def get_version(provider_dir: str, version: str):
+def get_worktree(store_dir: str, bare_dir: str, sha: str) -> str | None:
     """
-    Do git checkout and if there is an error, do a git pull and try to checkout again,
-     this time raising an error if the version does not exist.
+    Get the worktree for a commit, creating it if the commit is in the bare repo. Never
+     modifies an existing worktree. New ones are created in a tmp dir and then moved so
+     that they are never seen half checked out.
     """
-    with work_in(provider_dir):
-        logger.debug(f"Checking out version={version}.")
-        git_stash()
-        p = run_command(f"git checkout {version}")
-        stdout, stderr = p.communicate()
-        if p.returncode == 0:
-            return
-        elif 'did not match any file(s) known to git' in str(
-            stderr
-        ) or 'Your branch is behind' in str(stdout):
-            default_branch = get_default_branch()
-            git_pull(default_branch)
-            git_checkout(version)
-
-
-def get_latest(provider_dir: str):
-    """Git pull and checkout the default branch."""
-    with work_in(provider_dir):
-        git_stash()
-        default_branch = get_default_branch()
-        git_pull(default_branch, provider_dir)
-        git_checkout(default_branch)
-
-
-def get_last_release(provider_dir: str):
-    """Git pull and then check for the most recent tag to checkout."""
-    with work_in(provider_dir):
-        git_stash()
-        default_branch = get_default_branch()
-        git_pull(default_branch)
-        tags = get_git_tags()
-        if len(tags) != 0:
-            git_checkout(tags[-1])
+    worktree = os.path.join(store_dir, sha)
+    if os.path.isdir(worktree):
+        return worktree
+    if not os.path.isdir(bare_dir) or get_commit(bare_dir, sha) is None:
+        return None
+    # Forget worktrees that were deleted by hand
+    run_git('worktree', 'prune', cwd=bare_dir)
+    tmp_worktree = f'{worktree}.tmp-{os.getpid()}'
+    p = run_git(
+        'worktree', 'add', '--detach', '--quiet', tmp_worktree, sha, cwd=bare_dir
+    )
+    if p.returncode != 0:
+        raise_git_error(p)
+    p = run_git('worktree', 'move', tmp_worktree, worktree, cwd=bare_dir)
+    if p.returncode != 0:
+        run_git('worktree', 'remove', '--force', tmp_worktree, cwd=bare_dir)
+        if not os.path.isdir(worktree):
+            raise_git_error(p)
+        # Otherwise another run created the same worktree first
+    return worktree
+
+
+def checkout_repo_source(
+    repo_url: str,
+    store_dir: str,
+    bare_dir: str,
+    lock_key: str,
+    version: str | None,
+    latest: bool | None,
+    started: float,
+) -> str:
+    """Resolve the source to a worktree, pinning it in the lock file."""
+    locked = read_lock_file().get(lock_key)
+    if locked is not None and (
+        # Another run updated the source while we were waiting for the lock
+        locked.updated >= started
+        or (not latest and locked.is_fresh(settings.provider_lock_ttl))
+    ):
+        worktree = get_worktree(store_dir, bare_dir, locked.sha)
+        if worktree is not None:
+            return worktree
+
+    if not os.path.isdir(bare_dir):
+        init_bare_repo(repo_url=repo_url, bare_dir=bare_dir)
+    try:
+        sha = resolve_remote_commit(
+            bare_dir=bare_dir,
+            repo_url=repo_url,
+            version=version,
+            latest=latest,
+        )
+    except exceptions.GenericGitException as e:
+        if locked is None:
+            raise e
+        worktree = get_worktree(store_dir, bare_dir, locked.sha)
+        if worktree is None:
+            raise e
+        logger.warning(
+            f"Could not update {repo_url}, using the locked commit={locked.sha}.\n{e}"
+        )
+        return worktree
+
+    worktree = get_worktree(store_dir, bare_dir, sha)
+    try:
+        update_locked_source(
+            key=lock_key,
+            source=LockedSource(
+                repo_url=repo_url,
+                sha=sha,
+                version=version,
+                latest=bool(latest),
+            ),
+        )
+    except OSError as e:
+        logger.debug(f"Could not write the lock for {lock_key} - {e}")
+    return worktree
+
+
+def remove_legacy_checkout(store_dir: str, bare_dir: str):
+    """
+    Remove a single checkout from older versions of tackle, keeping the bare repo and
+     worktrees which were created within it.
+    """
+    logger.info(f"Replacing the checkout in {store_dir} with a provider store.")
+    for i in os.listdir(store_dir):
+        path = os.path.join(store_dir, i)
+        if path == bare_dir or is_commit_sha(i.split('.tmp-')[0]):
+            continue
+        if os.path.isdir(path):
+            rmtree(path)
         else:
-            git_checkout(default_branch)
+            os.remove(path)
+
+
+def update_repo_source(
+    repo_url: str,
+    store_dir: str,
+    lock_key: str,
+    version: str | None,
+    latest: bool | None,
+    started: float,
+) -> str:
+    """
+    Resolve and checkout a source from the remote, pinning it in the lock file. Must be
+     called while holding the store's lock. A single checkout from older versions of
+     tackle is only replaced once a worktree has been created so that it keeps being
+     used if the remote can't be reached.
+    """
+    bare_dir = os.path.join(store_dir, 'repo.git')
+    if not os.path.isdir(os.path.join(store_dir, '.git')):
+        return checkout_repo_source(
+            repo_url, store_dir, bare_dir, lock_key, version, latest, started
+        )
+
+    try:
+        worktree = checkout_repo_source(
+            repo_url, store_dir, bare_dir, lock_key, version, latest, started
+        )
+    except (exceptions.GenericGitException, exceptions.RepositoryNotFound) as e:
+        logger.warning(
+            f"Could not update {repo_url}, using the checkout in {store_dir}.\n{e}"
+        )
+        return store_dir
+    remove_legacy_checkout(store_dir, bare_dir)
+    return worktree
 
 
 def get_repo_source(repo: str, version: str | None, latest: bool | None) -> str:
-    """Clone a provider into the providers dir with checkout out the right version."""
+    """
+    Get the directory with the resolved commit of a remote provider. Used by both
+     sources given on the command line and the `import` hook.
+
+    The resolved commit is pinned in the lock file (see `tackle.utils.provider_lock`)
+     so that until the entry is older than `settings.provider_lock_ttl`, the provider is
+     resolved from its local worktree without any git calls. The `latest` flag always
+     refreshes from the remote. If refreshing fails (ie offline), the locked commit is
+     used.
+
+    Concurrent runs (ie CI jobs sharing a runner) coordinate through a file lock per
+     provider so that only one of them fetches while the others wait and reuse it.
+    """
     # Check if git is installed
     if not bool(which('git')):
         raise exceptions.VCSNotInstalled("git is not installed. Exiting...")
     # Split up the repo string
     repo_url, organization, provider_name = parse_repo_ref(repo)
-    org_dir = os.path.join(settings.providers_dir, organization)
-    provider_dir = os.path.join(org_dir, provider_name)
+    store_dir = get_store_dir(organization, provider_name)
 
     logger.debug(f"Getting repo={repo_url} org={organization} name={provider_name}")
 
-    if not os.path.exists(provider_dir):
-        # New provider
-        get_repo(
+    if version is not None and is_commit_sha(version):
+        # Commits never change so an existing worktree can always be used
+        worktree = os.path.join(store_dir, version)
+        if os.path.isdir(worktree):
+            return worktree
+
+    started = time.time()
+    lock_key = get_lock_key(repo_url=repo_url, version=version, latest=latest)
+    locked = read_lock_file().get(lock_key)
+    if (
+        locked is not None
+        and not latest
+        and locked.is_fresh(settings.provider_lock_ttl)
+    ):
+        # Worktrees are moved into place once complete so no need for the lock
+        worktree = os.path.join(store_dir, locked.sha)
+        if os.path.isdir(worktree):
+            logger.debug(f"Using locked {lock_key} at commit={locked.sha}.")
+            return worktree
+
+    with file_lock(f'{store_dir}.lock', timeout=settings.provider_lock_timeout):
+        return update_repo_source(
             repo_url=repo_url,
-            org_dir=org_dir,
-            provider_dir=provider_dir,
+            store_dir=store_dir,
+            lock_key=lock_key,
             version=version,
             latest=latest,
+            started=started,
         )
-    elif version is not None:
-        get_version(provider_dir=provider_dir, version=version)
-    elif latest:
-        get_latest(provider_dir=provider_dir)
-    else:
-        get_last_release(provider_dir=provider_dir)
-
-    return provider_dir
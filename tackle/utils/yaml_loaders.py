@@ -0,0 +1,219 @@
+"""
+Loaders for reading yaml into plain python containers. When PyYAML is installed with
+ libyaml, its C loader is used with resolvers / constructors matching ruyaml's yaml 1.2
+ safe loader (ie `yes` / `on` are strings, no sexagesimal numbers), otherwise ruyaml's
+ pure python safe loader is used.
+"""
+import datetime
+import io
+import re
+from typing import Any, Callable, TextIO
+
+from ruyaml import YAML
+from ruyaml.comments import CommentedKeyMap
+from ruyaml.composer import ComposerError
+from ruyaml.constructor import ConstructorError, DuplicateKeyError
+from ruyaml.parser import ParserError
+from ruyaml.resolver import implicit_resolvers
+from ruyaml.scalarbool import ScalarBoolean
+from ruyaml.scalarfloat import ScalarFloat
+from ruyaml.scalarint import ScalarInt
+
+try:
+    from yaml import CSafeLoader
+    from yaml import composer as pyyaml_composer
+    from yaml import constructor as pyyaml_constructor
+    from yaml import nodes as pyyaml_nodes
+    from yaml import parser as pyyaml_parser
+except ImportError:
+    CSafeLoader = None
+
+YamlStream = str | bytes | TextIO
+
+YAML_COMPOSER_ERRORS: tuple = (ComposerError,)
+YAML_CONSTRUCTOR_ERRORS: tuple = (ConstructorError,)
+YAML_DUPLICATE_KEY_ERRORS: tuple = (DuplicateKeyError,)
+YAML_PARSER_ERRORS: tuple = (ParserError,)
+
+
+class YamlLoader:
+    """Base for yaml loaders which return plain python containers."""
+
+    name: str = None
+
+    def load(self, stream: YamlStream) -> Any:
+        raise NotImplementedError
+
+    def load_all(self, stream: YamlStream) -> list:
+        raise NotImplementedError
+
+
+class RuyamlLoader(YamlLoader):
+    """Pure python fallback."""
+
+    name = 'ruyaml'
+
+    def load(self, stream: YamlStream) -> Any:
+        return YAML(typ='safe', pure=True).load(stream)
+
+    def load_all(self, stream: YamlStream) -> list:
+        return list(YAML(typ='safe', pure=True).load_all(stream))
+
+
+# Registry of the loaders in order of preference
+YAML_LOADERS: dict[str, Callable[[], YamlLoader]] = {}
+
+if CSafeLoader is not None:
+
+    class PyyamlDuplicateKeyError(pyyaml_constructor.ConstructorError):
+        pass
+
+    class Yaml12CSafeLoader(CSafeLoader):
+        """PyYAML's libyaml loader configured to load the same as ruyaml's safe loader."""
+
+        yaml_implicit_resolvers = {}
+
+        def construct_mapping(self, node, deep=False):
+            # ruyaml does not allow duplicate keys
+            keys = set()
+            for key_node, _ in node.value:
+                if not isinstance(key_node, pyyaml_nodes.ScalarNode):
+                    continue
+                if key_node.tag == 'tag:yaml.org,2002:merge':
+                    continue
+                key = (key_node.tag, key_node.value)
+                if key in keys:
+                    raise PyyamlDuplicateKeyError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        f"found duplicate key \"{key_node.value}\"",
+                        key_node.start_mark,
+                    )
+                keys.add(key)
+            return super().construct_mapping(node, deep=deep)
+
+        def construct_yaml_int(self, node):
+            # Yaml 1.2 ints -> leading zeros are decimal and octals need a `0o` prefix
+            value = self.construct_scalar(node).replace('_', '')
+            sign = 1
+            if value[0] in '+-':
+                if value[0] == '-':
+                    sign = -1
+                value = value[1:]
+            if value.startswith('0b'):
+                return sign * int(value[2:], 2)
+            elif value.startswith('0x'):
+                return sign * int(value[2:], 16)
+            elif value.startswith('0o'):
+                return sign * int(value[2:], 8)
+            return sign * int(value)
+
+        def construct_yaml_timestamp(self, node):
+            # ruyaml returns naive datetimes in UTC
+            value = super().construct_yaml_timestamp(node)
+            if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+                value = (value - value.utcoffset()).replace(tzinfo=None)
+            return value
+
+    for _versions, _tag, _regexp, _first in implicit_resolvers:
+        if (1, 2) in _versions:
+            # ruyaml's regexes are lazily compiled behind a slow proxy so recompile
+            _regexp = re.compile(_regexp.pattern, _regexp.flags)
+            Yaml12CSafeLoader.add_implicit_resolver(_tag, _regexp, _first)
+
+    Yaml12CSafeLoader.add_constructor(
+        'tag:yaml.org,2002:int', Yaml12CSafeLoader.construct_yaml_int
+    )
+    Yaml12CSafeLoader.add_constructor(
+        'tag:yaml.org,2002:timestamp', Yaml12CSafeLoader.construct_yaml_timestamp
+    )
+
+    class LibyamlLoader(YamlLoader):
+        """C accelerated loader."""
+
+        name = 'libyaml'
+
+        def load(self, stream: YamlStream) -> Any:
+            loader = Yaml12CSafeLoader(stream)
+            try:
+                return loader.get_single_data()
+            finally:
+                loader.dispose()
+
+        def load_all(self, stream: YamlStream) -> list:
+            loader = Yaml12CSafeLoader(stream)
+            try:
+                output = []
+                while loader.check_data():
+                    output.append(loader.get_data())
+                return output
+            finally:
+                loader.dispose()
+
+    YAML_LOADERS['libyaml'] = LibyamlLoader
+    YAML_COMPOSER_ERRORS += (pyyaml_composer.ComposerError,)
+    YAML_CONSTRUCTOR_ERRORS += (pyyaml_constructor.ConstructorError,)
+    YAML_DUPLICATE_KEY_ERRORS += (PyyamlDuplicateKeyError,)
+    YAML_PARSER_ERRORS += (pyyaml_parser.ParserError,)
+
+YAML_LOADERS['ruyaml'] = RuyamlLoader
+
+
+def get_yaml_loader(name: str = None) -> YamlLoader:
+    """Get a yaml loader by name, defaulting to the fastest one available."""
+    if name is None:
+        name = next(iter(YAML_LOADERS))
+    return YAML_LOADERS[name]()
+
+
+def load_yaml(stream: YamlStream, loader: str = None) -> Any:
+    """Load a single yaml document into plain containers."""
+    return get_yaml_loader(loader).load(stream)
+
+
+def get_named_stream(content: str, name: str = None) -> YamlStream:
+    """Wrap the content in a stream with a name which the loaders put in errors."""
+    if name is None:
+        return content
+    stream = io.StringIO(content)
+    stream.name = name
+    return stream
+
+
+def load_yaml_string(content: str, loader: str = None, name: str = None) -> Any:
+    """
+    Load yaml content, returning a list of documents for multi-document content. The
+     `name` (ie the path the content was read from) is used in the loader's errors.
+    """
+    yaml_loader = get_yaml_loader(loader)
+    try:
+        return yaml_loader.load(get_named_stream(content, name))
+    except YAML_COMPOSER_ERRORS:
+        return yaml_loader.load_all(get_named_stream(content, name))
+
+
+def load_yaml_file(path: str, loader: str = None) -> Any:
+    """Load a yaml file, returning a list of documents for multi-document files."""
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    return load_yaml_string(content, loader=loader, name=path)
+
+
+def to_plain_containers(data: Any) -> Any:
+    """Convert ruyaml's round trip types (ie CommentedMap) to plain python types."""
+    if isinstance(data, CommentedKeyMap):
+        return data  # Hashable map used as a key so leave it
+    elif isinstance(data, dict):
+        return {to_plain_containers(k): to_plain_containers(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [to_plain_containers(i) for i in data]
+    elif isinstance(data, ScalarBoolean):
+        return bool(data)
+    elif isinstance(data, ScalarFloat):
+        return float(data)
+    elif isinstance(data, ScalarInt):
+        return int(data)
+    elif isinstance(data, str) and type(data) is not str:
+        # Scalar strings (ie LiteralScalarString)
+        return str(data)
+    return data
@@ -5,7 +5,6 @@ import sys
 import tempfile
 from zipfile import BadZipFile, ZipFile
 
-from InquirerPy import prompt
 
 from tackle.exceptions import InvalidZipRepository
 from tackle.utils.paths import is_repo_url, make_sure_path_exists
@@ -16,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 def read_repo_password(question):
     """Read the password."""
+    from InquirerPy import prompt
+
     question = {
         'type': 'password',
         'name': 'tmp',
@@ -188,3 +188,27 @@ def test_cli_commands(command, expected_output, capsys):
     main(command)
     output = capsys.readouterr().out
     assert expected_output in output
+
+
+def test_cli_fetch(mocker, capsys):
+    """Check that `--fetch` resolves the imports in a source without running it."""
+    parse_context = mocker.patch("tackle.main.parse_context")
+    get_repo_source = mocker.patch(
+        "tackle.utils.fetch.get_repo_source",
+        side_effect=lambda src, version, latest: f'/providers/{src}',
+    )
+    main(['fetch.yaml', '--fetch'])
+
+    assert not parse_context.called
+    assert sorted(i.args for i in get_repo_source.call_args_list) == [
+        ('robcxyz/tackle-demos', None, None),
+        ('robcxyz/tackle-fixture-released', 'v0.1.0', None),
+        ('robcxyz/tackle-fixture-unreleased', None, True),
+    ]
+    assert capsys.readouterr().out.splitlines() == [
+        'robcxyz/tackle-demos@release -> /providers/robcxyz/tackle-demos',
+        'robcxyz/tackle-fixture-released@v0.1.0 -> '
+        '/providers/robcxyz/tackle-fixture-released',
+        'robcxyz/tackle-fixture-unreleased@latest -> '
+        '/providers/robcxyz/tackle-fixture-unreleased',
+    ]
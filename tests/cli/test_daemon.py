@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import tackle.hooks as tackle_hooks
+from tackle import daemon, render, tackle
+
+
+@pytest.fixture()
+def daemon_socket(tmp_path, monkeypatch):
+    """Run a daemon in a subprocess and yield the path to its socket."""
+    socket_path = os.path.join(tmp_path, 'daemon.sock')
+    # Also sent by the client to the daemon which reloads the settings with it
+    monkeypatch.setenv('TACKLE_CACHE_DIR', os.path.join(tmp_path, '.cache'))
+    env = dict(os.environ, TACKLE_DAEMON_SOCKET=socket_path)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'tackle.cli', '--daemon'],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.1)
+    yield socket_path
+    process.terminate()
+    process.wait()
+
+
+@pytest.mark.skipif(not daemon.is_supported(), reason="Needs unix sockets.")
+def test_daemon_run_client(daemon_socket, capfd):
+    """Check that a call is forwarded to the daemon which writes to our stdout."""
+    exit_code = daemon.run_client(
+        argv=['tackle-hello.yaml'],
+        socket_path=daemon_socket,
+    )
+    assert exit_code == 0
+    assert 'Hello world!' in capfd.readouterr().out
+
+
+@pytest.mark.skipif(not daemon.is_supported(), reason="Needs unix sockets.")
+def test_daemon_run_client_exit_code(daemon_socket, capfd):
+    """Check that failed calls return a non-zero exit code."""
+    exit_code = daemon.run_client(
+        argv=['does-not-exist.yaml'],
+        socket_path=daemon_socket,
+    )
+    assert exit_code == 1
+
+
+def test_daemon_run_client_no_daemon(tmp_path):
+    """Check that when no daemon is running we get None to fall back to in process."""
+    socket_path = os.path.join(tmp_path, 'daemon.sock')
+    assert (
+        daemon.run_client(argv=['tackle-hello.yaml'], socket_path=socket_path) is None
+    )
+
+
+def test_daemon_get_client_socket(monkeypatch, tmp_path):
+    """Check the client finds the socket from the env without resolving the settings."""
+    monkeypatch.delenv('TACKLE_DAEMON_SOCKET', raising=False)
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path))
+    assert daemon.get_client_socket() == os.path.join(tmp_path, 'tackle', 'daemon.sock')
+
+    monkeypatch.setenv('TACKLE_DAEMON_SOCKET', 'daemon.sock')
+    assert daemon.get_client_socket() == 'daemon.sock'
+
+
+def test_daemon_warm_directory(monkeypatch, mocker):
+    """Check the hooks / templates of a directory are compiled before forking."""
+    monkeypatch.setattr(tackle_hooks, 'warm_compiled_hooks', {})
+    monkeypatch.setattr(render, 'template_cache', render.TemplateCache())
+    daemon.warm_directory('daemon-warm')
+    misses = render.template_cache.info().misses
+    create_dcl_hook = mocker.spy(tackle_hooks, 'create_dcl_hook')
+
+    assert tackle('daemon-warm') == {'greeting': {'out': 'Hello WORLD!'}}
+    assert not create_dcl_hook.called
+    assert render.template_cache.info().misses == misses
+
+
+def test_daemon_warm_directory_changed_hooks(monkeypatch, mocker):
+    """Check warm compiled hooks are not used when the calling context's hooks differ."""
+    monkeypatch.setattr(tackle_hooks, 'warm_compiled_hooks', {})
+    daemon.warm_directory('daemon-warm')
+    create_dcl_hook = mocker.spy(tackle_hooks, 'create_dcl_hook')
+    raw_input = {
+        'greet<-': {'name': 'str', 'exec': {'out->': 'var Hi {{name}}'}},
+        'greeting->': 'greet --name world',
+    }
+
+    assert tackle(raw_input=raw_input) == {'greeting': {'out': 'Hi world'}}
+    assert create_dcl_hook.called
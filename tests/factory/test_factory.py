@@ -1,3 +1,5 @@
+from collections import ChainMap
+
 import pytest
 
 from tackle.factory import new_context
@@ -14,3 +16,47 @@ def test_factory_new_context():
 def test_factory_new_context_raw_inputs(input):
     context = new_context(raw_input=input)
     assert context.data.raw_input == input
+
+
+def test_factory_context_child(mocker):
+    """Check child contexts inherit from the parent without touching the filesystem."""
+    context = new_context(raw_input={'a': 1})
+    existing_data = ChainMap({'b': 2}, context.data.public)
+    filesystem_calls = [
+        mocker.patch(i, side_effect=AssertionError(f"Child context called {i}."))
+        for i in ('builtins.open', 'os.listdir', 'os.scandir', 'os.path.exists')
+    ]
+
+    child_context = context.child(existing_data=existing_data)
+
+    assert not any(i.called for i in filesystem_calls)
+    assert child_context.source is context.source
+    assert child_context.hooks is context.hooks
+    assert child_context.path.calling is context.path.current
+    assert child_context.data.existing is existing_data
+    assert child_context.data.public == {}
+
+
+def test_factory_context_fork():
+    """Check forked contexts share data but index their own key path."""
+    context = new_context(raw_input={'a': 1})
+    context.key_path.append('a')
+
+    forked_context = context.fork()
+    forked_context.key_path.append('b')
+
+    assert forked_context.data is context.data
+    assert forked_context.hooks is context.hooks
+    assert forked_context.key_path_block == ['a']
+    assert context.key_path == ['a']
+    assert forked_context.write_cursor is None
+
+
+def test_factory_context_slots():
+    """Check the context objects are slotted so no instance dicts are allocated."""
+    context = new_context()
+
+    for i in (context, context.data, context.path, context.hooks, context.input):
+        assert not hasattr(i, '__dict__')
+    with pytest.raises(AttributeError):
+        context.not_a_field = 1
@@ -37,3 +37,24 @@ def test_hooks_execs_hook_call_str():
     output = tackle('hook-call-str.yaml')
 
     assert output == {'bar': 'baz'}
+
+
+def test_hooks_execs_caller_data():
+    """Check the exec reads the caller's data with the hook's fields on top of it."""
+    output = tackle(
+        raw_input={
+            'name': 'caller',
+            'other': 'x',
+            'greet<-': {
+                'name': 'str',
+                'exec': {'out->': 'var {{name}}-{{other}}', 'other->': 'literal y'},
+            },
+            'call->': 'greet --name hook',
+        }
+    )
+
+    assert output == {
+        'name': 'caller',
+        'other': 'x',
+        'call': {'out': 'hook-x', 'other': 'y'},
+    }
@@ -0,0 +1,103 @@
+import pytest
+
+from tackle import BaseHook, Context, Field, exceptions
+from tackle.hook_plan import (
+    INJECT_CONTEXT,
+    INJECT_HOOK_CALL,
+    RENDER,
+    RENDER_BY_DEFAULT,
+    RENDER_EXCLUDE,
+    clear_hook_plan,
+    get_hook_plan,
+)
+from tackle.models import HookCallInput
+from tackle.parser import evaluate_args, run_hook_exec
+
+
+class PlanHook(BaseHook):
+    hook_name = 'plan'
+    a_str: str = None
+    a_list: list = None
+    aliased: str = Field(None, alias='an_alias')
+    by_default: str = Field(None, json_schema_extra={'render_by_default': True})
+    excluded: str = Field(None, json_schema_extra={'render_exclude': True})
+    a_dict: dict = None
+
+    args: list = ['a_str', 'a_list']
+    kwargs: str = 'a_dict'
+    render_exclude: list = ['a_str']
+
+    def exec(self, context: Context, hook_call: 'HookCallInput'):
+        return context, hook_call
+
+
+class NoExecHook(BaseHook):
+    hook_name = 'no_exec'
+    foo: str = 'bar'
+
+
+class BadExecHook(BaseHook):
+    hook_name = 'bad_exec'
+
+    def exec(self, foo: str):
+        return foo
+
+
+def test_hook_plan_cached(context):
+    """Check the plan is only created once per hook class."""
+    hook_plan = get_hook_plan(context, PlanHook)
+
+    assert get_hook_plan(context, PlanHook) is hook_plan
+    assert get_hook_plan(context, NoExecHook) is not hook_plan
+    clear_hook_plan(PlanHook)
+    assert get_hook_plan(context, PlanHook) is not hook_plan
+
+
+def test_hook_plan_fields(context):
+    """Check the render policies of fields / aliases along with the arg mapping."""
+    hook_plan = get_hook_plan(context, PlanHook)
+
+    assert hook_plan.key_render_policies['a_str'] == RENDER_EXCLUDE
+    assert hook_plan.key_render_policies['a_list'] == RENDER
+    assert hook_plan.key_render_policies['an_alias'] == RENDER
+    assert hook_plan.key_render_policies['by_default'] == RENDER_BY_DEFAULT
+    assert hook_plan.key_render_policies['excluded'] == RENDER_EXCLUDE
+    assert 'missing' not in hook_plan.key_render_policies
+    assert hook_plan.args == ('a_str', 'a_list')
+    assert hook_plan.last_arg_annotation is list
+    assert hook_plan.kwargs_field == 'a_dict'
+    assert hook_plan.kwargs_field_is_dict
+
+
+def test_hook_plan_evaluate_args(context):
+    """Check args are mapped to fields with the last arg taking the remaining args."""
+    hook_dict = {}
+    evaluate_args(
+        context, args=['foo', 'bar', 'baz'], hook_dict=hook_dict, Hook=PlanHook
+    )
+
+    assert hook_dict == {'a_str': 'foo', 'a_list': ['bar', 'baz']}
+
+
+def test_hook_plan_exec_params(context):
+    """Check the exec method's params are injected based on their type."""
+    hook_plan = get_hook_plan(context, PlanHook)
+    hook_call = HookCallInput()
+
+    assert hook_plan.exec_params == (
+        ('context', INJECT_CONTEXT),
+        ('hook_call', INJECT_HOOK_CALL),
+    )
+    assert run_hook_exec(context, hook=PlanHook(), hook_call=hook_call) == (
+        context,
+        hook_call,
+    )
+    assert get_hook_plan(context, NoExecHook).exec_params is None
+    assert run_hook_exec(context, hook=NoExecHook()) == {'foo': 'bar'}
+
+
+def test_hook_plan_malformed_exec(context):
+    """Check malformed hooks raise each time they are used."""
+    for _ in range(2):
+        with pytest.raises(exceptions.MalformedHookDefinitionException):
+            get_hook_plan(context, BadExecHook)
@@ -1,8 +1,21 @@
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 
+import tackle.hooks as tackle_hooks
 from tackle import tackle
 from tackle.factory import new_context
-from tackle.hooks import create_dcl_hook, create_default_factory
+from tackle.hooks import (
+    create_dcl_hook,
+    create_default_factory,
+    get_hook_from_context,
+    get_input_raw_fingerprint,
+)
+from tackle.models import LazyBaseHook
+from tackle.parser import add_dcl_hook_to_context
 
 
 @pytest.mark.parametrize(
@@ -117,6 +130,142 @@ def test_hooks_create_dcl_hook_simple_params(context, hook_input_raw):
     assert hook.stuff == 'things'
 
 
+def test_hooks_compiled_once(cd_fixtures, mocker):
+    """Check that hooks called repeatedly are compiled once with per call defaults."""
+    spy = mocker.spy(tackle_hooks, 'create_dcl_hook')
+    output = tackle('compiled-hooks.yaml')
+
+    assert output['call'] == [['a', 'foo'], ['a', 'bar'], ['a', 'baz']]
+    # Once for the `wrapper` hook and once for the `appender` hook called within it
+    assert spy.call_count == 2
+
+
+def test_hooks_compiled_redefined(context):
+    """Check that compiled hooks are invalidated when a hook is redefined."""
+    add_dcl_hook_to_context(
+        context, LazyBaseHook(hook_name='foo', input_raw={'a': 1}, is_public=True)
+    )
+    add_dcl_hook_to_context(
+        context,
+        LazyBaseHook(hook_name='bar', input_raw={'extends': 'foo'}, is_public=True),
+    )
+    Hook = get_hook_from_context(context, 'bar', args=[])
+
+    assert get_hook_from_context(context, 'bar', args=[]) is Hook
+    assert Hook().a == 1
+
+    add_dcl_hook_to_context(
+        context, LazyBaseHook(hook_name='foo', input_raw={'a': 2}, is_public=True)
+    )
+
+    assert get_hook_from_context(context, 'bar', args=[])().a == 2
+
+
+@pytest.mark.parametrize(
+    "input_raw,other_input_raw",
+    [
+        ({'a': 1}, {'a': 1.0}),
+        ({'a': 1}, {'a': True}),
+        ({'a': 1, 'b': 2}, {'b': 2, 'a': 1}),
+        ({'a': {'b': 'c'}}, {'a': {'b': 'd'}}),
+    ],
+)
+def test_hooks_input_raw_fingerprint(input_raw, other_input_raw):
+    """Check fingerprints differ on anything that changes how a hook is compiled."""
+    assert get_input_raw_fingerprint(input_raw) == get_input_raw_fingerprint(
+        input_raw.copy()
+    )
+    assert get_input_raw_fingerprint(input_raw) != get_input_raw_fingerprint(
+        other_input_raw
+    )
+
+
+def test_hooks_input_raw_fingerprint_uncached():
+    """Check hooks with templated enums or objects are not cached."""
+    assert get_input_raw_fingerprint({'a': {'enum': '{{ b }}'}}) is None
+    assert get_input_raw_fingerprint({'a': object()}) is None
+
+
+# Runs a tackle document with increasing numbers of hook calls and prints the counts of
+#  the audit events (see `sys.addaudithook`) raised when touching the filesystem. Audit
+#  hooks can't be removed so this is run in a subprocess to not leak into other tests.
+COUNT_FILESYSTEM_EVENTS = """
+import collections, json, sys
+from tackle import tackle
+
+FILESYSTEM_AUDIT_EVENTS = {'open', 'os.listdir', 'os.scandir', 'os.chdir'}
+counter = None
+
+def audit_filesystem_events(event, args):
+    if counter is not None and event in FILESYSTEM_AUDIT_EVENTS:
+        counter[event] += 1
+
+sys.addaudithook(audit_filesystem_events)
+counts = []
+for number_of_calls in json.loads(sys.argv[2]):
+    counter = collections.Counter()
+    tackle(
+        raw_input=json.loads(sys.argv[1]),
+        existing_data={'items': list(range(number_of_calls))},
+    )
+    counts.append(dict(counter))
+    counter = None
+print(json.dumps(counts))
+"""
+
+
+def count_filesystem_events(
+    raw_input: dict,
+    numbers_of_calls: list[int],
+    tmp_path,
+) -> list[dict[str, int]]:
+    """Count the filesystem events per event for each number of hook calls."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            COUNT_FILESYSTEM_EVENTS,
+            json.dumps(raw_input),
+            json.dumps(numbers_of_calls),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(
+            os.environ,
+            TACKLE_CONFIG_PATH=os.path.join(tmp_path, 'config.yaml'),
+            TACKLE_CACHE_DIR=os.path.join(tmp_path, '.cache'),
+        ),
+    )
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+CHILD_CONTEXT_HOOK = {
+    'greet<-': {
+        'name': {'type': 'str', 'default_factory': {'->': 'literal world'}},
+        'shout': {'type': 'str', 'validator': {'return->': 'v'}},
+        'exec': {'out->': 'var {{name}}-{{shout}}'},
+    },
+    'calls->': 'greet --shout hi --for items',
+}
+
+
+def test_hooks_child_context_filesystem(tmp_path):
+    """
+    Check that the default factories / validators / execs of declarative hooks are
+     evaluated without touching the filesystem, ie the same number of syscalls are
+     made regardless of the number of hook calls.
+    """
+    # The first run is a warmup
+    _, one_call, ten_calls = count_filesystem_events(
+        CHILD_CONTEXT_HOOK, [1, 1, 10], tmp_path
+    )
+
+    # Scanning for hooks per call was the regression so check it specifically
+    assert ten_calls.get('os.scandir', 0) - one_call.get('os.scandir', 0) == 0
+    assert ten_calls == one_call
+
+
 # Determine what lists do
 # def test_hooks_list_call(cd_fixtures):
 #     """Check what compact hooks do."""
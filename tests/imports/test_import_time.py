@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget for `import tackle` in microseconds. Importing tackle
+#  alone takes ~10ms so this is mostly headroom for slow CI runners while still failing
+#  if the parser / jinja / pydantic are imported eagerly again (~400ms).
+IMPORT_TIME_BUDGET = 100_000
+HEAVY_MODULES = [
+    'InquirerPy',
+    'jinja2',
+    'pydantic_settings',
+    'requests',
+    'rich',
+    'ruyaml',
+    'tackle.factory',
+    'tackle.parser',
+    'xdg',
+    'yaml',
+]
+
+
+def get_import_time(statement: str, module: str) -> int:
+    """Run `python -X importtime` and return the cumulative time of a module."""
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in output.stderr.splitlines():
+        # ie `import time:       887 |      10950 | tackle`
+        _, cumulative, name = line.split('|')
+        if name.strip() == module and not name.startswith('  '):
+            return int(cumulative)
+    raise ValueError(f"Module {module} not found in the import time output.")
+
+
+def test_import_time_budget():
+    """Check that importing tackle stays within the import time budget."""
+    # Best of a few runs to reduce noise
+    import_time = min(get_import_time('import tackle', 'tackle') for _ in range(3))
+
+    assert import_time < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'import tackle',
+        'from tackle import BaseHook, Field',
+        'from tackle import hook',
+        # The CLI only imports the runtime when not forwarding the call to a daemon
+        'import tackle.cli',
+        'from tackle.daemon import run_client',
+    ],
+)
+def test_import_time_no_heavy_modules(statement):
+    """Check that defining a hook does not import the parser or heavy dependencies."""
+    output = subprocess.run(
+        [sys.executable, '-c', f'{statement}; import sys; print(*sys.modules)'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = output.stdout.split()
+
+    for module in HEAVY_MODULES:
+        assert module not in modules
+
+
+def test_import_time_native_providers_lazy(tmp_path):
+    """Check that by default only the providers of the hooks being called are imported."""
+    statement = "from tackle import tackle; tackle(raw_input={'a->': 'var 1'})"
+    output = subprocess.run(
+        [sys.executable, '-c', f'{statement}; import sys; print(*sys.modules)'],
+        capture_output=True,
+        text=True,
+        check=True,
+        # Default settings
+        env=dict(
+            os.environ,
+            TACKLE_CONFIG_PATH=os.path.join(tmp_path, 'config.yaml'),
+            TACKLE_CACHE_DIR=os.path.join(tmp_path, '.cache'),
+        ),
+    )
+    modules = output.stdout.split()
+
+    for module in ['InquirerPy', 'requests', 'rich']:
+        assert module not in modules
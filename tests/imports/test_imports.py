@@ -6,6 +6,8 @@ import pytest
 from tackle import exceptions, imports, tackle
 from tackle.context import Context, Hooks, Source
 from tackle.factory import new_context
+from tackle.hooks import get_hooks_from_namespace
+from tackle.models import LazyImportHook
 from tackle.settings import settings
 
 
@@ -131,3 +133,23 @@ def test_providers_unreleased_import(remove_provider):
     o = tackle("robcxyz/tackle-fixture-unreleased", no_input=True)
 
     assert o['hooks_dir_hook']['foo'] == 'bar'
+
+
+def test_imports_import_native_hooks_index():
+    """Check that the native hooks index is lazily imported when hooks are looked up."""
+    native_hooks = imports.import_native_hooks_index()
+    assert isinstance(native_hooks['var'], LazyImportHook)
+
+    context = Context(
+        source=Source(), hooks=Hooks(public={}, private={}, native=native_hooks)
+    )
+    Hook = get_hooks_from_namespace(context=context, hook_name='var')
+
+    assert Hook.hook_name == 'var'
+    assert context.hooks.native['var'] is Hook
+    assert isinstance(context.hooks.native['literal'], LazyImportHook)
+
+
+def test_imports_import_native_hooks_index_missing():
+    """Check that we return None when there is no native hooks index."""
+    assert imports.import_native_hooks_index(index_path='not-a-file.json') is None
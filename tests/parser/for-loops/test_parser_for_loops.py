@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from tackle import HookCallInput, new_context, tackle
@@ -78,3 +80,58 @@ def test_parser_for_loop_embedded_block():
 
     assert output['foo'][0]['bar'][1]['j_is'] == 4
     assert output['foo'][1]['bar'][1]['j_is'] == 4
+
+
+LOOP_DOCUMENTS = [
+    {'items': [1, 2, 3], 'loop->': 'var {{item}}-{{index}} --for items'},
+    {'loop->': 'var {{i}} --for i in [1,2,3] --reverse'},
+    {'loop->': 'var {{i*2}} --for i in [1,2,3] --if i!=2'},
+    {
+        'loop': {
+            '->': 'var {{i}}',
+            'for': 'i in [1,2,3]',
+            'if': 'i!=2',
+            'else': 'skipped',
+        },
+    },
+    {'loop->': 'var {{i}} --for i in [1,2,3] --when true'},
+    {'loop->': 'var {{k}}{{v}}{{i}} --for k, v, i in {"a":"b","c":"d"}'},
+    {'loop->': 'var {{k}} --for k in {"a":"b","c":"d"} --reverse'},
+    {'loop->': 'literal {"a":"{{i}}"} --for i in [1,2] --try'},
+    {'loop->': 'int {{i}} --for i in ["1","x"] --try --except failed'},
+    {
+        'foo': {'a': 1},
+        'loop->': 'literal {"{{i}}":"{{i}}"} --for i in ["x","y"] --merge',
+    },
+    {
+        'loop->': {
+            'for': 'i in [1,2]',
+            'a->': 'var {{i}}',
+            'b->': 'var {{a}}-{{item}} --for [1,2]',
+        },
+    },
+    {'loop_>': 'var {{i}} --for i in [1,2]', 'out->': 'var {{loop}}'},
+]
+
+
+@pytest.mark.parametrize("raw_input", LOOP_DOCUMENTS)
+def test_parser_for_loop_body(mocker, raw_input):
+    """Check that loops give the same output when each item is parsed individually."""
+    output = tackle(raw_input=copy.deepcopy(raw_input))
+    mocker.patch('tackle.parser.prepare_loop_body', return_value=None)
+
+    assert output == tackle(raw_input=copy.deepcopy(raw_input))
+
+
+def test_parser_for_loop_scope():
+    """Check loop variables shadow other keys and don't clobber the existing data."""
+    output = tackle(
+        raw_input={
+            'item': 'foo',
+            'loop->': 'var {{item}}-{{index}} --for [1,2]',
+            'after->': 'var {{item}}-{{index}}',
+        },
+        existing_data={'index': 'bar'},
+    )
+
+    assert output == {'item': 'foo', 'loop': ['1-0', '2-1'], 'after': 'foo-bar'}
@@ -1,9 +1,12 @@
+import copy
+
 import pytest
+from pydantic import ValidationError
 
 from tackle import get_hook, tackle
 from tackle.factory import new_context
-from tackle.models import HookCallInput
-from tackle.parser import run_hook_exec, split_input_data
+from tackle.models import HookCall, HookCallInput
+from tackle.parser import parse_hook_string, run_hook_exec, split_input_data
 
 SPLIT_INPUT_FIXTURES: list[tuple[dict, tuple[int, int, int]]] = [
     (
@@ -158,6 +161,28 @@ def test_parser_hook_args_not_copied(cd_fixtures):
     assert output['lower_default'].islower()
 
 
+def test_parser_parse_hook_string_cached():
+    """Check hook strings are parsed once and renderable args are rewritten as vars."""
+    hook_str = '{{ foo }} bar --if true --try'
+    parsed = parse_hook_string(hook_str)
+
+    assert parsed is parse_hook_string(hook_str)
+    assert parsed.unpack() == (['var', '{{ foo }}', 'bar'], {'if': True}, ['try'])
+
+
+def test_parser_parse_hook_string_loop():
+    """Check that the cached hook strings are not modified across loop iterations."""
+    output = tackle(
+        raw_input={
+            'items->': 'literal [1,2] --for i in range(3)',
+            'appended->': 'var {{items[0]+[3]}} --for i in range(2)',
+        }
+    )
+
+    assert output['items'] == [[1, 2], [1, 2], [1, 2]]
+    assert output['appended'] == [[1, 2, 3], [1, 2, 3]]
+
+
 def test_parser_bool_value_defaults(cd_fixtures):
     """Check that when a bool field is default to true that raising flag inverts it."""
     output = tackle('bool-hooks.yaml', hooks_dir='bool-hooks')
@@ -174,3 +199,66 @@ def test_parser_no_exec_python(cd_fixtures):
 
     assert output['is_true']
     assert not output['is_false']
+
+
+@pytest.mark.parametrize(
+    "hook_dict",
+    [
+        {},
+        {'for': ['a', 'b'], 'if': 'i > 1', 'foo': 'bar'},
+        {'for_': 'items', 'reverse': True, 'try': True, 'except': {'a': 'b'}},
+        {'cd': 'path', 'merge': 'true', 'kwargs': {'a': 1}, 'return': True},
+        # Values that need to be coerced by the model
+        {'merge': 1, 'skip_output': 'true', 'no_input': 0},
+        {'for': ['a'], 'for_': ['b']},
+    ],
+)
+def test_parser_hook_call_validate(hook_dict):
+    """Check hook calls are created the same as when validated by the model."""
+    hook_call = HookCall.validate(hook_dict)
+    hook_call_input = HookCallInput(**hook_dict)
+
+    for k in HookCallInput.model_fields:
+        assert getattr(hook_call, k) == getattr(hook_call_input, k)
+    assert hook_call.model_extra == hook_call_input.model_extra
+    assert hook_call.to_model() == hook_call_input
+
+
+def test_parser_hook_call_fields():
+    """Check hook calls have the same fields / defaults as the model."""
+    hook_call = HookCall()
+    hook_call_input = HookCallInput()
+
+    assert set(HookCall.__slots__) == set(HookCallInput.model_fields) | {'model_extra'}
+    for k, v in HookCallInput.model_fields.items():
+        assert getattr(hook_call, k) == v.default == getattr(hook_call_input, k)
+    assert hook_call.model_extra == {}
+    with pytest.raises(TypeError):
+        HookCall(not_a_field=True)
+
+
+def test_parser_hook_call_validate_error():
+    """Check invalid values raise the model's validation errors."""
+    with pytest.raises(ValidationError):
+        HookCall.validate({'for': 1})
+
+
+def test_parser_hook_call_copy():
+    """Check copies of hook calls (ie for each loop iteration) are independent."""
+    hook_call = HookCall.validate({'for': 'items', 'foo': 'bar'})
+    hook_call_copy = copy.copy(hook_call)
+    hook_call_copy.for_ = None
+    hook_call_copy.model_extra['foo'] = 'baz'
+
+    assert hook_call.for_ == 'items'
+    assert hook_call.model_extra == {'foo': 'bar'}
+
+
+def test_parser_hook_call_replace_model_extra():
+    """Check loop items get copies of hook calls with their own extra keys."""
+    hook_call = HookCall.validate({'for': 'items', 'foo': 'bar'})
+    item_hook_call = hook_call.replace_model_extra({'foo': 'baz'})
+
+    assert item_hook_call.for_ == 'items'
+    assert item_hook_call.model_extra == {'foo': 'baz'}
+    assert hook_call.model_extra == {'foo': 'bar'}
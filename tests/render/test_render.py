@@ -1,8 +1,14 @@
 import pytest
+from jinja2.nativetypes import NativeEnvironment
 
 from tackle import tackle
 from tackle.factory import new_context
-from tackle.render import add_jinja_hook_to_jinja_globals, render_string
+from tackle.render import (
+    TemplateCache,
+    add_jinja_hook_to_jinja_globals,
+    render_string,
+    template_cache,
+)
 from tackle.utils.files import read_config_file
 
 
@@ -160,3 +166,33 @@ def test_render_preserve_types_jinja_logic(
     output = render_string(context, raw=raw)
 
     assert output == expected_output
+
+
+def test_render_template_cache(context):
+    """Check that a template is only compiled once when rendered in a loop."""
+    template_cache.clear()
+    for i in range(1000):
+        context.data.public = {'var1': i}
+        assert render_string(context, raw='{{ var1 * 2 }}') == i * 2
+
+    info = template_cache.info()
+    assert info.misses == 1
+    assert info.hits == 999
+    assert info.currsize == 1
+
+
+def test_render_template_cache_lru():
+    """Check that the least recently used templates are evicted per environment."""
+    env, other_env = NativeEnvironment(), NativeEnvironment()
+    cache = TemplateCache(maxsize=2)
+    cache.get(env, '{{ a }}')
+    cache.get(env, '{{ b }}')
+    cache.get(env, '{{ a }}')
+    compiled = cache.get(other_env, '{{ a }}')
+
+    assert compiled.template.environment is other_env
+    assert compiled.variables == {'a'}
+    assert cache.info() == (1, 3, 2, 2)
+    cache.get(env, '{{ a }}')
+    cache.get(env, '{{ b }}')
+    assert cache.info().misses == 4
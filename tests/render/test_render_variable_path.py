@@ -0,0 +1,167 @@
+import datetime
+
+import pytest
+
+from tackle import exceptions
+from tackle.render import (
+    MISSING,
+    parse_variable_path,
+    render_string,
+    render_template,
+    render_variable_path,
+)
+
+DATA = {
+    'str': 'foo',
+    'str_int': '1',
+    'str_float': '1.5',
+    'str_zero_padded': '01',
+    'str_underscore_int': '1_000',
+    'str_bool': 'True',
+    'str_lower_bool': 'true',
+    'str_none': 'None',
+    'str_dict': "{'a': 1}",
+    'str_list': '[1, 2]',
+    'str_space': ' 1',
+    'str_empty': '',
+    'str_jinja': '{{ str }}',
+    'int': 1,
+    'float': 1.5,
+    'bool': False,
+    'none': None,
+    'date': datetime.date(2023, 1, 1),
+    'mapping': {'a': {'b': ['1', 2, {'c': 'True'}]}, 'items': 'x', 'key with space': 1},
+    'list': ['a', '2', [3, '4.0']],
+    'namespace': {'foo': 'bar'},
+    'literal': '1',
+}
+
+RAWS = [
+    '{{ str }}',
+    '{{str_int}}',
+    '{{ str_float }}',
+    '{{ str_zero_padded }}',
+    '{{ str_underscore_int }}',
+    '{{ str_bool }}',
+    '{{ str_lower_bool }}',
+    '{{ str_none }}',
+    '{{ str_dict }}',
+    '{{ str_list }}',
+    '{{ str_space }}',
+    '{{ str_empty }}',
+    '{{ str_jinja }}',
+    '{{ int }}',
+    '{{ float }}',
+    '{{ bool }}',
+    '{{ date }}',
+    '{{ mapping }}',
+    '{{ mapping.a }}',
+    '{{ mapping.a.b }}',
+    '{{ mapping.a.b[0] }}',
+    '{{ mapping.a.b[1] }}',
+    '{{ mapping.a.b[-1].c }}',
+    "{{ mapping['a']['b'][2]['c'] }}",
+    '{{ mapping["a"].b[ 0 ] }}',
+    '{{ mapping.items }}',
+    "{{ mapping['key with space'] }}",
+    '{{ list }}',
+    '{{ list[0] }}',
+    '{{ list[1] }}',
+    '{{ list[2][1] }}',
+    '{{ list[-1][0] }}',
+    '{{ str[0] }}',
+    '{{ str_int[0] }}',
+    '{{ str_list[1] }}',
+    # Collide with jinja globals / hooks / constants
+    '{{ namespace }}',
+    '{{ literal }}',
+    '{{ none }}',
+    # Special variables
+    '{{ cwd }}',
+    '{{ tackle_dir }}',
+    # Not a variable path
+    '{{ int + 1 }}',
+    '{{ str | upper }}',
+    '{{ str }}{{ int }}',
+    ' {{ str }}',
+    '{{ str }}\n',
+]
+
+
+def render(method, context, raw):
+    try:
+        return method(context, raw)
+    except exceptions.TackleHookCallException as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("namespace", ['public', 'private', 'existing', 'frames'])
+@pytest.mark.parametrize("raw", RAWS)
+def test_render_variable_path_differential(context, namespace, raw):
+    """Check the fast path renders the same value and type as jinja does."""
+    if namespace == 'frames':
+        context.data.frames.append(DATA)
+    else:
+        setattr(context.data, namespace, DATA)
+    expected = render(render_template, context, raw)
+    output = render(render_string, context, raw)
+
+    assert output == expected
+    assert type(output) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{{ missing }}',
+        '{{ mapping.missing }}',
+        '{{ mapping.a.b[10] }}',
+        '{{ list.missing }}',
+        '{{ int.missing }}',
+        "{{ list['a'] }}",
+    ],
+)
+def test_render_variable_path_differential_errors(context, raw):
+    """Check that variables that can't be found raise the same errors."""
+    context.data.public = DATA
+    with pytest.raises(exceptions.UnknownTemplateVariableException) as expected:
+        render_template(context, raw)
+    with pytest.raises(exceptions.UnknownTemplateVariableException) as output:
+        render_string(context, raw)
+
+    assert str(output.value) == str(expected.value)
+
+
+def test_render_variable_path_precedence(context):
+    """Check the data namespaces are looked up in the same order as jinja's."""
+    context.data.existing = {'a': 'existing', 'b': 'existing', 'c': 'existing'}
+    context.data.private = {'a': 'private', 'b': 'private', 'c': 'private'}
+    context.data.public = {'a': 'public', 'b': 'public'}
+    context.data.frames.append({'a': 'frame'})
+
+    assert render_variable_path(context, 'a', ()) == 'frame'
+    assert render_variable_path(context, 'b', ()) == 'public'
+    assert render_variable_path(context, 'c', ()) == 'private'
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ('{{ foo }}', ('foo', ())),
+        ('{{foo.bar}}', ('foo', ((True, 'bar'),))),
+        ("{{ a[0]['b'].c }}", ('a', ((False, 0), (False, 'b'), (True, 'c')))),
+        ('{{ a.0 }}', None),
+        ('{{ a() }}', None),
+        ('{{- a }}', None),
+        ('{{ true }}', None),
+    ],
+)
+def test_render_parse_variable_path(raw, expected):
+    assert parse_variable_path(raw) == expected
+
+
+def test_render_variable_path_missing(context):
+    """Check that the fast path defers to jinja for unknown variables and hooks."""
+    assert render_variable_path(context, 'missing', ()) is MISSING
+    context.data.public = {'literal': 1}
+    assert render_variable_path(context, 'literal', ()) is MISSING
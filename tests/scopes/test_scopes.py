@@ -0,0 +1,89 @@
+import pytest
+
+from tackle.context import Data
+from tackle.scopes import (
+    MISSING,
+    get_scope_variable,
+    merge_frames,
+    new_overlay,
+    pop_frame,
+    push_frame,
+    scope_frame,
+)
+
+
+@pytest.fixture()
+def data():
+    return Data(
+        public={'a': 'public', 'b': 'public'},
+        private={'b': 'private', 'c': 'private'},
+        existing={'c': 'existing', 'd': 'existing'},
+    )
+
+
+@pytest.mark.parametrize(
+    "name,expected_output",
+    [
+        ('a', 'public'),
+        ('b', 'public'),
+        ('c', 'private'),
+        ('d', 'existing'),
+        ('e', MISSING),
+    ],
+)
+def test_scopes_get_scope_variable(data, name, expected_output):
+    """Check variables are looked up in descending priority of the namespaces."""
+    assert get_scope_variable(data, name) is expected_output
+
+
+def test_scopes_frames(data):
+    """Check frames take precedence with the last pushed first and are popped."""
+    with scope_frame(data, {'a': 'outer', 'e': 'outer'}):
+        frame = push_frame(data)
+        frame['e'] = 'inner'
+
+        assert get_scope_variable(data, 'a') == 'outer'
+        assert get_scope_variable(data, 'e') == 'inner'
+        assert merge_frames(data) == {'a': 'outer', 'e': 'inner'}
+        assert pop_frame(data) is frame
+        assert get_scope_variable(data, 'e') == 'outer'
+
+    assert data.frames == []
+    assert get_scope_variable(data, 'e') is MISSING
+
+
+def test_scopes_data_temporary(data):
+    """Check the deprecated temporary namespace is a read-only view of the frames."""
+    with scope_frame(data, {'a': 'outer', 'e': 'outer'}):
+        with scope_frame(data, {'e': 'inner'}):
+            with pytest.deprecated_call():
+                assert data.temporary == {'a': 'outer', 'e': 'inner'}
+    with pytest.raises(AttributeError):
+        data.temporary = {}
+
+
+def test_scopes_frame_popped_on_error(data):
+    """Check the frame is popped when an exception is raised within it."""
+    with pytest.raises(ValueError):
+        with scope_frame(data, {'a': 'frame'}):
+            raise ValueError
+
+    assert get_scope_variable(data, 'a') == 'public'
+
+
+def test_scopes_new_overlay():
+    """Check overlays read the layers by reference without writing to them."""
+    public = {'a': 'public', 'b': 'public'}
+    existing = {'b': 'existing', 'c': 'existing'}
+    overlay = new_overlay(None, public, [1, 2], existing)
+    overlay['a'] = 'overlay'
+    overlay.update({'d': 'overlay'})
+
+    assert dict(overlay) == {
+        'a': 'overlay',
+        'b': 'public',
+        'c': 'existing',
+        'd': 'overlay',
+    }
+    assert public == {'a': 'public', 'b': 'public'}
+    assert existing == {'b': 'existing', 'c': 'existing'}
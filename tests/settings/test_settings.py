@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+
+from tackle.settings import LazySettings, read_settings_config_file
+from tackle.utils import files
+
+# `tackle.settings` is shadowed by the settings object in `tackle/__init__.py`
+settings_module = sys.modules['tackle.settings']
+
+
+@pytest.fixture()
+def tackle_env(tmp_path, monkeypatch):
+    """Point the settings at a tmp dir with a config file."""
+    tackle_dir = os.path.join(tmp_path, 'tackle')
+    config_path = os.path.join(tmp_path, 'config.yaml')
+    monkeypatch.setenv('TACKLE_TACKLE_DIR', tackle_dir)
+    monkeypatch.setenv('TACKLE_PROVIDERS_DIR', os.path.join(tackle_dir, 'providers'))
+    monkeypatch.setenv('TACKLE_CONFIG_PATH', config_path)
+    return config_path
+
+
+def test_settings_lazy(tackle_env, mocker):
+    """Check that settings are only resolved on first access and never write."""
+    update_settings = mocker.patch.object(settings_module, 'update_settings')
+    settings = LazySettings()
+    assert not update_settings.called
+
+    assert settings.providers_dir.endswith('providers')
+    assert update_settings.call_count == 1
+    assert not os.path.exists(os.path.dirname(settings.providers_dir))
+
+
+def test_settings_lazy_config_file(tackle_env):
+    """Check that the config file is read and can be overridden on assignment."""
+    with open(tackle_env, 'w') as f:
+        f.write("prompt_for_installs: false\n")
+    settings = LazySettings()
+
+    assert settings.prompt_for_installs is False
+    settings.prompt_for_installs = True
+    assert settings.prompt_for_installs is True
+
+
+def test_settings_read_settings_config_file(tackle_env, mocker):
+    """Check that the config file is only parsed again when its mtime changes."""
+    with open(tackle_env, 'w') as f:
+        f.write("local_install: false\n")
+    read_config_file = mocker.spy(files, 'read_config_file')
+
+    assert read_settings_config_file(tackle_env) == {'local_install': False}
+    assert read_settings_config_file(tackle_env) == {'local_install': False}
+    assert read_config_file.call_count == 1
+
+    with open(tackle_env, 'w') as f:
+        f.write("local_install: true\n")
+    os.utime(tackle_env, ns=(0, 0))
+    assert read_settings_config_file(tackle_env) == {'local_install': True}
+    assert read_config_file.call_count == 2
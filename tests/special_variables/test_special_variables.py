@@ -15,7 +15,7 @@ def special_variables_context() -> Context:
     context.data.public = {'foo': 1}
     context.data.private = {'foo': 2}
     context.data.existing = {'foo': 3}
-    context.data.temporary = {'foo': 4}
+    context.data.frames.append({'foo': 4})
     return context
 
 
@@ -1,3 +1,4 @@
+import os
 from typing import Type
 
 import pytest
@@ -41,3 +42,17 @@ FILES_EXCEPTIONS: list[tuple[str, Type[Exception]]] = [
 def test_utils_files_exceptions(file, exception):
     with pytest.raises(exception):
         read_config_file(file)
+
+
+@pytest.mark.parametrize('read_content', [False, True])
+def test_utils_files_exceptions_file_name(read_content):
+    """Check that yaml errors point to the line in the file that failed to load."""
+    file = os.path.abspath('bad-flow.yaml')
+    content = None
+    if read_content:
+        with open(file) as f:
+            content = f.read()
+    with pytest.raises(exceptions.FileLoadingException) as e:
+        read_config_file(file, content=content)
+
+    assert f'in "{file}", line 2' in e.value.message
@@ -1,6 +1,10 @@
 import pytest
 
-from tackle.utils.command import split_input_string, unpack_args_kwargs_string
+from tackle.utils.command import (
+    parse_args_kwargs_string,
+    split_input_string,
+    unpack_args_kwargs_string,
+)
 
 INPUT_STRINGS = [
     ('this --if "expanded == \'that\'"', ['this', '--if', "expanded == 'that'"]),
@@ -36,12 +40,11 @@ INPUT_STRINGS = [
         "{{get('stuff-and',sep='-')}}",
         ["{{get(\'stuff-and\',sep=\'-\')}}"],
     ),
-    # TODO: Fix splitting on whitespace unless it is surrounded by special chars
-    #  Or just replace with pyparsing ->
-    # (
-    #     "{{print('things', 'stuff')}}",
-    #     ["{{print(\'things\', \'stuff\')}}"],
-    # ),
+    (
+        "{{print('things', 'stuff')}}",
+        ["{{print(\'things\', \'stuff\')}}"],
+    ),
+    ('this {"foo": "bar baz"}', ['this', {"foo": "bar baz"}]),
 ]
 
 
@@ -130,3 +133,22 @@ def test_unpack_input_string(input_string, args, kwargs, flags):
     assert args_out == args
     assert kwargs_out == kwargs
     assert flags_out == flags
+
+
+def test_unpack_input_string_cached():
+    """Check that the cached parse can't be corrupted by modifying the output."""
+    input_string = 'this ["foo","bar"] --kwarg {"foo":["bar"]} --flag'
+    args, kwargs, flags = unpack_args_kwargs_string(input_string)
+    args[1].append('baz')
+    args.append('that')
+    kwargs['kwarg']['foo'].append('baz')
+    flags.append('other')
+
+    assert parse_args_kwargs_string(input_string) is parse_args_kwargs_string(
+        input_string
+    )
+    assert unpack_args_kwargs_string(input_string) == (
+        ['this', ['foo', 'bar']],
+        {'kwarg': {'foo': ['bar']}},
+        ['flag'],
+    )
@@ -0,0 +1,173 @@
+"""
+Fuzz the hook call tokenizer in `tackle.utils.command` against the regex based splitter
+ it replaced, which is kept here as an oracle. Inputs are generated from atoms that the
+ old splitter handled correctly - the cases where it didn't are checked explicitly.
+"""
+import random
+import re
+
+import pytest
+
+from tackle.utils.command import (
+    literal_eval,
+    split_input_string,
+    strip_dashes,
+    unpack_args_kwargs_list,
+    unpack_args_kwargs_string,
+)
+
+LEGACY_SPLIT_PATTERN = re.compile(
+    "( |(?<!,|\:|\(|\{|\[|=)\\\"(?!\,|\:|\)|\}|\]).*?\\\"(?!\}|\])|(?<!\,|\:|\(|\{|\[|=)'(?!,|\:|\)|\}|\]).*?'(?!\}|\]))"  # noqa
+)
+LEGACY_FLAG_REGEX = re.compile(r"^[\-|\-\-]+[a-zA-Z0-9]")
+
+
+def legacy_split_input_string(input_string: str) -> list:
+    input_list = [i for i in re.split(LEGACY_SPLIT_PATTERN, input_string) if i.strip()]
+    return [literal_eval(i) for i in input_list if i != '=']
+
+
+def legacy_assert_if_flag(arg) -> bool:
+    return bool(LEGACY_FLAG_REGEX.match(str(arg)))
+
+
+def legacy_unpack_args_kwargs_list(input_list: list) -> (list, dict, list):
+    args, kwargs, flags = [], {}, []
+    i = 0
+    while i < len(input_list):
+        raw_arg = input_list[i]
+        next_raw_arg = input_list[i + 1] if i + 1 < len(input_list) else '--hack'
+        if isinstance(raw_arg, str) and legacy_assert_if_flag(raw_arg):
+            if isinstance(next_raw_arg, str):
+                if legacy_assert_if_flag(next_raw_arg):
+                    flags.append(strip_dashes(raw_arg))
+                else:
+                    values = []
+                    i += 1
+                    while i < len(input_list):
+                        if legacy_assert_if_flag(input_list[i]):
+                            break
+                        values.append(str(input_list[i]))
+                        i += 1
+                    kwargs[strip_dashes(raw_arg)] = ' '.join(values)
+                    i -= 1
+            else:
+                kwargs[strip_dashes(raw_arg)] = input_list[i + 1]
+                i += 1
+        else:
+            args.append(raw_arg)
+        i += 1
+    return args, kwargs, flags
+
+
+def legacy_unpack_args_kwargs_string(input_string: str) -> (list, dict, list):
+    args, kwargs, flags = legacy_unpack_args_kwargs_list(
+        legacy_split_input_string(input_string)
+    )
+    kwargs = {k.replace('-', '_'): v for k, v in kwargs.items()}
+    return args, kwargs, [i.replace('-', '_') for i in flags]
+
+
+# Atoms whose string representation is the same once interpreted as a literal so that
+#  joining them into kwargs is the same from either the raw tokens or their values
+CANONICAL_ATOMS = [
+    'foo',
+    'bar_baz',
+    'a.b',
+    'path/to/file.yaml',
+    'x==1',
+    '1',
+    '-1',
+    '1.5',
+    'True',
+    'False',
+    'None',
+    '=',
+    '{{x}}',
+    '{{x|upper}}',
+    'foo-{{bar}}-baz',
+    '--foo',
+    '--foo-bar',
+    '-f',
+    '--if',
+    '--for',
+]
+ATOMS = CANONICAL_ATOMS + [
+    'true',
+    '1_000',
+    '0x1f',
+    '"foo bar"',
+    "'foo bar'",
+    '"a \'b\' c"',
+    '"--quoted"',
+    '[1,2]',
+    '["x","y"]',
+    '{"a":1}',
+    "{'a':'b','c':[1]}",
+    "{{f('a')}}",
+    '(1,2)',
+]
+
+
+def generate_input_string(rng: random.Random, atoms: list[str]) -> str:
+    return ''.join(
+        rng.choice(atoms) + ' ' * rng.randint(1, 2) for _ in range(rng.randint(1, 8))
+    ).strip()
+
+
+def generate_corpus(atoms: list[str], seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [generate_input_string(rng, atoms) for _ in range(500)]
+
+
+@pytest.mark.parametrize("input_string", generate_corpus(ATOMS, seed=1))
+def test_utils_command_fuzz_split(input_string):
+    """Check the tokenizer splits the same as the old regex."""
+    assert split_input_string(input_string) == legacy_split_input_string(input_string)
+
+
+@pytest.mark.parametrize("input_string", generate_corpus(ATOMS, seed=2))
+def test_utils_command_fuzz_unpack_list(input_string):
+    """Check args / kwargs / flags are unpacked from lists the same way."""
+    input_list = legacy_split_input_string(input_string)
+
+    assert unpack_args_kwargs_list(input_list) == legacy_unpack_args_kwargs_list(
+        input_list
+    )
+
+
+@pytest.mark.parametrize("input_string", generate_corpus(CANONICAL_ATOMS, seed=3))
+def test_utils_command_fuzz_unpack_string(input_string):
+    """Check args / kwargs / flags are unpacked from strings the same way."""
+    output = unpack_args_kwargs_string(input_string)
+
+    assert output == legacy_unpack_args_kwargs_string(input_string)
+
+
+# Cases that were split wrong by the regex
+FIXED_INPUT_STRINGS = [
+    # input_string, args, kwargs, flags
+    ('literal ["a", "b"]', ['literal', ['a', 'b']], {}, []),
+    ('literal {"a": "b c"}', ['literal', {'a': 'b c'}], {}, []),
+    ('literal {"a": [1, {"b": "}"}]}', ['literal', {'a': [1, {'b': '}'}]}], {}, []),
+    ('var {{ foo }} --try', ['var', '{{ foo }}'], {}, ['try']),
+    (
+        "var {{print('things', 'stuff')}}",
+        ['var', "{{print('things', 'stuff')}}"],
+        {},
+        [],
+    ),
+    ('foo --if name == "foo bar"', ['foo'], {'if': 'name == "foo bar"'}, []),
+    ("foo --if name == 'foo' --try", ['foo'], {'if': "name == 'foo'"}, ['try']),
+    ('foo --for i in [1, 2]', ['foo'], {'for': 'i in [1, 2]'}, []),
+    ('foo key="a b"', ['foo', 'key="a b"'], {}, []),
+    ('print "say \\"hi\\""', ['print', 'say "hi"'], {}, []),
+    # Unbalanced brackets and quotes fall back to splitting on spaces
+    ('print :( not ok', ['print', ':(', 'not', 'ok'], {}, []),
+    ("print don't stop", ['print', "don't", 'stop'], {}, []),
+]
+
+
+@pytest.mark.parametrize("input_string,args,kwargs,flags", FIXED_INPUT_STRINGS)
+def test_utils_command_fixed_input_strings(input_string, args, kwargs, flags):
+    assert unpack_args_kwargs_string(input_string) == (args, kwargs, flags)
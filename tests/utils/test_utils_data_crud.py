@@ -1,13 +1,21 @@
 import pytest
 from ruyaml import YAML
 
+from tackle.context import Data
 from tackle.utils.data_crud import (
+    ListIndex,
+    WriteCursor,
     cleanup_unquoted_strings,
     decode_list_index,
+    encode_key_path,
     encode_list_index,
+    get_readable_key_path,
     nested_delete,
     nested_get,
     nested_set,
+    pop_key,
+    push_key,
+    set_key,
 )
 
 ZERO_INDEX = encode_list_index(0)
@@ -18,6 +26,49 @@ def test_index_encoding():
     assert decode_list_index(encode_list_index(1)) == 1
 
 
+@pytest.mark.parametrize("index", [0, 255, 1024, 65535, 65536, 10**6])
+def test_index_encoding_large(index):
+    """Check indexes of any size are encoded, ie beyond what fit in two bytes."""
+    list_index = encode_list_index(index)
+
+    assert isinstance(list_index, ListIndex)
+    assert decode_list_index(list_index) == index
+
+
+def test_index_decoding_bytes():
+    """Check the legacy bytes encoded indexes are still decoded."""
+    assert decode_list_index(b'\x00\x01') == 1
+    assert decode_list_index(b'\x01\x00\x00') == 65536
+
+
+@pytest.mark.parametrize(
+    "path,expected_output",
+    [
+        ('foo/bar', ['foo', 'bar']),
+        ('foo/1/bar', ['foo', ListIndex(1), 'bar']),
+        ('foo/-1', ['foo', ListIndex(-1)]),
+        (['foo', 1, b'\x00\x02'], ['foo', ListIndex(1), ListIndex(2)]),
+    ],
+)
+def test_encode_key_path(path, expected_output):
+    """Check ints in key paths are encoded as list indexes."""
+    output = encode_key_path(path)
+
+    assert output == expected_output
+    assert [type(i) for i in output] == [type(i) for i in expected_output]
+    # The parsed string paths are cached so need to be copied
+    output.append('baz')
+    assert encode_key_path(path) == expected_output
+
+
+def test_nested_get_int_keys():
+    """Check int keys in dicts are not confused with list indexes."""
+    element = {1: ['foo', 'bar']}
+
+    assert nested_get(element, [1, encode_list_index(1)]) == 'bar'
+    assert get_readable_key_path(['foo', '->', encode_list_index(70000)]) == 'foo.70000'
+
+
 NESTED_SET_FIXTURES = [
     # Indexed as output, key_path, expected_output
     ({}, ['foo'], {'foo': True}),
@@ -281,3 +332,91 @@ def test_utils_dicts_cleanup_unquoted_strings(input, expected_output):
 
     cleanup_unquoted_strings(input_dict)
     assert input_dict == expected_output
+
+
+def test_write_cursor_set():
+    """Check values are written to the public / private data based on the last arrow."""
+    data = Data()
+    write_cursor = WriteCursor([])
+    for op, key, value in [
+        ('push', 'a', None),
+        ('push', 'b', None),
+        ('set', None, 1),
+        ('pop', None, None),
+        ('push', 'c', None),
+        ('push', '_>', None),
+        ('set', None, 2),
+        ('pop', None, None),
+        ('pop', None, None),
+        ('push', 'd', None),
+        ('push', '->', None),
+        ('set', None, []),
+        ('push', encode_list_index(0), None),
+        ('set', None, 'x'),
+        ('pop', None, None),
+        ('push', encode_list_index(1), None),
+        ('push', 'e', None),
+        ('set', None, 3),
+    ]:
+        if op == 'push':
+            write_cursor.push(key)
+        elif op == 'pop':
+            write_cursor.pop()
+        else:
+            write_cursor.set(data, value)
+
+    assert data.public == {'a': {'b': 1, 'd': ['x', {'e': 3}]}}
+    assert data.private == {'a': {'c': 2}}
+
+
+def test_write_cursor_root_replaced():
+    """Check the containers are resolved again when the root is replaced."""
+    data = Data()
+    write_cursor = WriteCursor(['a', 'b'])
+    write_cursor.set(data, 1)
+    data.public = {'c': 2}
+    write_cursor.set(data, 3)
+
+    assert data.public == {'c': 2, 'a': {'b': 3}}
+
+
+def test_set_key_write_cursor(context):
+    """Check set_key writes to the key path even if it was modified directly."""
+    context.key_path_block = []
+    context.key_path = []
+    push_key(context, 'a')
+    push_key(context, 'b')
+    set_key(context, 1)
+    pop_key(context)
+    # Modifying the key path without the cursor rebuilds it
+    context.key_path.append('c')
+    set_key(context, 2)
+    # Writing outside of the key path drops the cursor
+    set_key(context, {'e': 3}, key_path=['a', 'd'])
+    assert context.write_cursor is None
+    set_key(context, 4)
+
+    assert context.data.public == {'a': {'b': 1, 'c': 4, 'd': {'e': 3}}}
+
+
+def test_set_key_block_frame(context):
+    """Check values set within a block are referenced in its frame by the nearest key."""
+    context.block_frame = {}
+    context.key_path_block = ['block', '->']
+    context.key_path = ['block', '->']
+    value = ['b']
+    for key_path, v in (
+        (['a', '->'], value),
+        (['c', 'd', '_>'], 1),
+        (['e', encode_list_index(0)], 2),
+    ):
+        for i in key_path:
+            push_key(context, i)
+        set_key(context, v)
+        for _ in key_path:
+            pop_key(context)
+
+    assert context.block_frame['a'] is value
+    assert context.block_frame['c'] is context.data.private['block']['c']
+    assert context.block_frame['e'] is context.data.public['block']['e']
+    assert context.data.public == {'block': {'a': ['b'], 'e': [2]}}
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from tackle import exceptions
+from tackle.utils.fetch import RemoteSource, fetch_remote_sources, get_import_sources
+
+DOCUMENT = {
+    'import->': 'robcxyz/a --latest',
+    'import_>': [
+        'robcxyz/b --version v0.1.0',
+        {'src': 'robcxyz/c', 'version': 'v0.2.0'},
+    ],
+    'expanded': {'_>': 'import', 'src': ['robcxyz/d', 'local-dir']},
+    'nested': {
+        'compact->': 'import robcxyz/e',
+        'block->': 'block',
+        'items': [{'->': 'import robcxyz/f --version main'}],
+    },
+    'templated->': 'import {{ foo }}',
+    'other->': 'literal robcxyz/g',
+}
+
+
+def test_utils_fetch_get_import_sources():
+    """Check that the sources of all the forms of import hook calls are found."""
+    assert get_import_sources(DOCUMENT) == [
+        RemoteSource('robcxyz/a', None, True),
+        RemoteSource('robcxyz/b', 'v0.1.0', None),
+        RemoteSource('robcxyz/c', 'v0.2.0', None),
+        RemoteSource('robcxyz/d', None, None),
+        RemoteSource('local-dir', None, None),
+        RemoteSource('robcxyz/e', None, None),
+        RemoteSource('robcxyz/f', 'main', None),
+    ]
+
+
+def test_utils_fetch_fetch_remote_sources(mocker):
+    """Check that sources are resolved in parallel and returned in order."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_repo_source(src, version, latest):
+        # Each call waits for the others so this would time out if run sequentially
+        barrier.wait()
+        return f'/providers/{src}'
+
+    mocker.patch('tackle.utils.fetch.get_repo_source', side_effect=get_repo_source)
+    sources = [RemoteSource(f'robcxyz/{i}') for i in 'abc'] + [
+        RemoteSource('robcxyz/a')
+    ]
+    output = fetch_remote_sources(sources, max_workers=4)
+
+    assert list(output.values()) == [f'/providers/robcxyz/{i}' for i in 'abc']
+
+
+def test_utils_fetch_fetch_remote_sources_error(mocker):
+    """Check that the error of the first failing source is raised."""
+
+    def get_repo_source(src, version, latest):
+        if src != 'robcxyz/a':
+            raise exceptions.RepositoryNotFound(src)
+        return src
+
+    mocker.patch('tackle.utils.fetch.get_repo_source', side_effect=get_repo_source)
+    sources = [RemoteSource(f'robcxyz/{i}') for i in 'abc']
+    with pytest.raises(exceptions.RepositoryNotFound) as e:
+        fetch_remote_sources(sources)
+
+    assert e.value.message == 'robcxyz/b'
@@ -0,0 +1,145 @@
+import os
+
+import pytest
+
+from tackle import tackle
+from tackle.settings import settings
+from tackle.utils.file_cache import (
+    clear_tackle_file_cache,
+    get_cache_files_dir,
+    get_tackle_file_cache_key,
+    prune_tackle_file_cache,
+    read_cached_tackle_file,
+)
+
+TACKLE_FILE = """
+pre: foo
+do<-:
+  bar: str
+post->: do --bar baz
+"""
+
+
+@pytest.fixture()
+def tmp_cache(tmp_path, monkeypatch):
+    """Point the cache at a tmp dir and write a tackle file to cache."""
+    monkeypatch.setattr(settings, 'cache_dir', os.path.join(tmp_path, 'cache'))
+    monkeypatch.chdir(tmp_path)
+    with open('tackle.yaml', 'w') as f:
+        f.write(TACKLE_FILE)
+    return 'tackle.yaml'
+
+
+def test_utils_file_cache_read_cached_tackle_file(tmp_cache):
+    """Check that running a file writes its split to the cache which is then used."""
+    output = tackle(tmp_cache)
+    cached_file = read_cached_tackle_file(get_tackle_file_cache_key(tmp_cache))
+
+    assert cached_file.pre_input == {'pre': 'foo'}
+    assert cached_file.post_input == {'post->': 'do --bar baz'}
+    assert cached_file.hooks[0].hook_name == 'do'
+    assert tackle(tmp_cache) == output == {'pre': 'foo', 'post': {'bar': 'baz'}}
+
+
+def test_utils_file_cache_key_changes(tmp_cache):
+    """Check that changing the file's content invalidates the cache."""
+    tackle(tmp_cache)
+    with open(tmp_cache, 'a') as f:
+        f.write("other: stuff\n")
+
+    assert read_cached_tackle_file(get_tackle_file_cache_key(tmp_cache)) is None
+    assert tackle(tmp_cache)['other'] == 'stuff'
+
+
+def test_utils_file_cache_bypass(tmp_cache, monkeypatch):
+    """Check that nothing is cached when the cache is disabled."""
+    monkeypatch.setattr(settings, 'file_cache', False)
+    tackle(tmp_cache)
+
+    assert not os.path.exists(get_cache_files_dir())
+
+
+def test_utils_file_cache_clear(tmp_cache):
+    """Check that we can clear the cache."""
+    tackle(tmp_cache)
+    clear_tackle_file_cache()
+
+    assert read_cached_tackle_file(get_tackle_file_cache_key(tmp_cache)) is None
+
+
+def test_utils_file_cache_read_once(tmp_cache, mocker):
+    """Check that the file is only read once to both hash and parse it."""
+    open_spy = mocker.patch('builtins.open', wraps=open)
+    tackle(tmp_cache)
+    reads = [
+        i for i in open_spy.call_args_list if os.path.basename(i.args[0]) == tmp_cache
+    ]
+
+    assert len(reads) == 1
+
+
+def test_utils_file_cache_prune(tmp_cache):
+    """Check that the least recently used entries over the max are removed."""
+    keys = []
+    for i in range(3):
+        with open(f'tackle-{i}.yaml', 'w') as f:
+            f.write(f"{TACKLE_FILE}i: {i}\n")
+        tackle(f'tackle-{i}.yaml')
+        keys.append(get_tackle_file_cache_key(f'tackle-{i}.yaml'))
+    for i, key in enumerate(keys):
+        # Make the access times distinct with the first being the oldest
+        os.utime(os.path.join(get_cache_files_dir(), key + '.pickle'), (i, i))
+    # Reading the oldest entry marks it as recently used
+    assert read_cached_tackle_file(keys[0])
+    prune_tackle_file_cache(max_entries=2)
+
+    assert read_cached_tackle_file(keys[0])
+    assert read_cached_tackle_file(keys[1]) is None
+    assert read_cached_tackle_file(keys[2])
+
+
+def test_utils_file_cache_size(tmp_cache, monkeypatch):
+    """Check that the cache is pruned to the size in the settings when written."""
+    monkeypatch.setattr(settings, 'file_cache_size', 1)
+    tackle(tmp_cache)
+    with open('other.yaml', 'w') as f:
+        f.write(f"{TACKLE_FILE}other: stuff\n")
+    tackle('other.yaml')
+
+    assert os.listdir(get_cache_files_dir()) == [
+        get_tackle_file_cache_key('other.yaml') + '.pickle'
+    ]
+
+
+def test_utils_file_cache_stat_fast_path(tmp_cache, mocker):
+    """Check that files which have not changed since they were cached are not read."""
+    os.utime(tmp_cache, ns=(0, 0))
+    output = tackle(tmp_cache)
+    open_spy = mocker.patch('builtins.open', wraps=open)
+
+    assert tackle(tmp_cache) == output
+    assert tmp_cache not in [
+        os.path.basename(i.args[0]) for i in open_spy.call_args_list
+    ]
+
+
+def test_utils_file_cache_racy(tmp_cache):
+    """Check files modified without a change to their mtime / size are reparsed."""
+    stat = os.stat(tmp_cache)
+    tackle(tmp_cache)
+    with open(tmp_cache, 'w') as f:
+        f.write(TACKLE_FILE.replace('foo', 'bar'))
+    os.utime(tmp_cache, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert tackle(tmp_cache)['pre'] == 'bar'
+
+
+def test_utils_file_cache_key_tackle_source(tmp_cache, mocker):
+    """Check that changes to tackle's source without a version bump change the key."""
+    key = get_tackle_file_cache_key(tmp_cache)
+    mocker.patch(
+        'tackle.utils.file_cache.get_tackle_source_fingerprint',
+        return_value='changed',
+    )
+
+    assert get_tackle_file_cache_key(tmp_cache) != key
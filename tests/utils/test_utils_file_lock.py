@@ -0,0 +1,42 @@
+import os
+import threading
+
+import pytest
+
+from tackle import exceptions
+from tackle.utils.file_lock import file_lock
+
+
+def test_utils_file_lock_timeout(tmp_path):
+    """Check that a held lock times out with the holder's pid in the message."""
+    path = os.path.join(tmp_path, 'foo.lock')
+    with file_lock(path):
+        with pytest.raises(exceptions.FileLockTimeout) as e:
+            with file_lock(path, timeout=0.1):
+                pass
+    assert f'pid={os.getpid()}' in e.value.message
+
+    # Released
+    with file_lock(path, timeout=0):
+        pass
+
+
+def test_utils_file_lock_waits(tmp_path):
+    """Check that a waiting holder gets the lock once it is released."""
+    path = os.path.join(tmp_path, 'foo.lock')
+    order = []
+    locked = threading.Event()
+
+    def hold():
+        with file_lock(path):
+            locked.set()
+            order.append('first')
+
+    with file_lock(path):
+        thread = threading.Thread(target=hold)
+        thread.start()
+        assert not locked.wait(0.2)
+        order.append('holder')
+    thread.join()
+
+    assert order == ['holder', 'first']
@@ -0,0 +1,67 @@
+import datetime
+import math
+
+import pytest
+from ruyaml import YAML
+
+from tackle.utils.yaml_loaders import (
+    YAML_DUPLICATE_KEY_ERRORS,
+    YAML_LOADERS,
+    get_yaml_loader,
+    load_yaml,
+    load_yaml_file,
+    to_plain_containers,
+)
+
+SCALARS = [
+    '012', '0o12', '0x1f', '0b11', '1_000', '1:20', '09', '0o9', '-0x10', '+12',
+    'yes', 'on', 'off', 'y', 'NO', 'True', 'TRUE', 'false',
+    '.5', '1e3', '1.5e3', '6.8523015e+5', '1_2.5', '1.', '.inf', '-.INF', '.nan',
+    '2001-12-14', '2001-12-14t21:59:43.10-05:00', '2001-12-14 21:59:43.10',
+    '~', 'null', "''", 'x', '"012"', '[1, a]', '{a: 1}',
+]  # fmt: skip
+
+
+@pytest.mark.parametrize('loader', YAML_LOADERS)
+@pytest.mark.parametrize('scalar', SCALARS)
+def test_utils_yaml_loaders_scalars(loader, scalar):
+    """Check that every loader resolves scalars the same as ruyaml's safe loader."""
+    document = f"a: {scalar}"
+    expected = YAML(typ='safe', pure=True).load(document)['a']
+    output = load_yaml(document, loader=loader)['a']
+
+    if isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(output)
+    else:
+        assert output == expected
+        assert type(output) is type(expected)
+
+
+@pytest.mark.parametrize('loader', YAML_LOADERS)
+def test_utils_yaml_loaders_load_yaml_file(loader):
+    """Check that multi-document files are loaded as a list."""
+    assert load_yaml_file('files/ok.yaml', loader=loader) == {'this': 'that'}
+    assert load_yaml_file('files/documents.yaml', loader=loader)[0]['this'] == 'that'
+
+
+@pytest.mark.parametrize('loader', YAML_LOADERS)
+def test_utils_yaml_loaders_duplicate_keys(loader):
+    """Check that duplicate keys raise for all the loaders."""
+    with pytest.raises(YAML_DUPLICATE_KEY_ERRORS):
+        load_yaml("a: 1\nb: 2\na: 3\n", loader=loader)
+
+
+def test_utils_yaml_loaders_default():
+    """Check that the first registered loader is the default."""
+    assert get_yaml_loader().name == next(iter(YAML_LOADERS))
+
+
+def test_utils_yaml_loaders_to_plain_containers():
+    """Check that ruyaml's round trip types are converted to plain types."""
+    data = YAML().load("a:\n  - 1\n  - 1.5\n  - true\n  - |\n    foo\nb: 2001-12-14\n")
+    output = to_plain_containers(data)
+
+    assert output == {'a': [1, 1.5, True, 'foo\n'], 'b': datetime.date(2001, 12, 14)}
+    assert type(output) is dict
+    assert type(output['a']) is list
+    assert [type(i) for i in output['a']] == [int, float, bool, str]
@@ -1,17 +1,18 @@
 import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 import pytest
 
 from tackle import exceptions
 from tackle.settings import settings
-from tackle.utils.paths import work_in
+from tackle.utils import vcs
+from tackle.utils.provider_lock import read_lock_file
 from tackle.utils.vcs import (
-    get_default_branch,
-    get_git_tags,
-    get_repo,
     get_repo_source,
+    init_bare_repo,
     parse_repo_ref,
     run_command,
 )
@@ -36,36 +37,6 @@ def test_parse_repo_ref(repo_input):
     assert provider_name == "tackle-demos"
 
 
-@pytest.mark.slow
-@pytest.mark.parametrize(
-    "fixture,assertion",
-    [
-        ('tackle-fixture-released', lambda x: x == 'main'),
-        ('tackle-fixture-unreleased', lambda x: x == 'main'),
-    ],
-)
-def test_vcs_get_default(get_local, fixture, assertion):
-    """Test getting the default branch of current repo."""
-    with work_in(get_local(fixture)):
-        branch = get_default_branch()
-
-    assert assertion(branch)
-
-
-@pytest.mark.parametrize(
-    "fixture,assertion",
-    [
-        # ('tackle-fixture-released', lambda x: x[-1].startswith('v')),
-        ('tackle-fixture-unreleased', lambda x: not x),
-    ],
-)
-def test_vcs_get_git_tags_released(get_local, fixture, assertion):
-    with work_in(get_local(fixture)):
-        tags = get_git_tags()
-
-    assert assertion(tags)
-
-
 @pytest.fixture
 def get_local():
     """
@@ -85,15 +56,12 @@ def get_local():
 
 
 @pytest.fixture()
-def setup_tmp(tmp_path, get_local):
+def setup_tmp(tmp_path):
     @contextmanager
-    def f(fixture: str = None):
+    def f():
         old_value = settings.providers_dir
         settings.providers_dir = str(tmp_path)
         try:
-            if fixture is not None:
-                get_local(fixture)
-                shutil.copytree(fixture, os.path.join(tmp_path, 'robcxyz', fixture))
             yield str(tmp_path)
         finally:
             settings.providers_dir = old_value
@@ -101,122 +69,202 @@ def setup_tmp(tmp_path, get_local):
     return f
 
 
-def get_repo_version(repo_path):
-    """Get the current repo version / branch."""
-    with work_in(repo_path):
-        with open('.git/HEAD') as f:
-            ref = f.read()
-    ref_list = ref.strip().split('/')
-    if len(ref_list) == 1:
-        return ref_list[0]
-    return ref_list[2]
-
-
-def _get_current_branch(repo_path):
-    with work_in(repo_path):
-        # This gets branch
-        p = run_command('git rev-parse --abbrev-ref HEAD')
-        stdout, stderr = p.communicate()
-        if b'HEAD' not in stdout:
-            return stdout.decode('utf-8').strip()
-        # This gets tag
-        p = run_command('git describe --tags --abbrev=0')
-        stdout, _ = p.communicate()
-        if p.returncode == 0:
-            return stdout.decode('utf-8').strip()
-        # Return None if tag is not there
-        return None
-
-
 @pytest.mark.slow
 @pytest.mark.parametrize(
-    "fixture,kwargs,assertion",
+    "fixture,kwargs,ref",
     [
-        (
-            'tackle-fixture-released',
-            {'version': None, 'latest': None},
-            lambda x: x.startswith('v'),
-        ),
-        (
-            'tackle-fixture-released',
-            {'version': None, 'latest': True},
-            lambda x: x == 'main',
-        ),
-        (
-            'tackle-fixture-released',
-            {'version': 'v0.1.2', 'latest': None},
-            lambda x: x == 'v0.1.2',
-        ),
-        (
-            'tackle-fixture-unreleased',
-            {'version': None, 'latest': None},
-            lambda x: x == 'main',
-        ),
-        (
-            'tackle-fixture-unreleased',
-            {'version': None, 'latest': True},
-            lambda x: x == 'main',
-        ),
+        ('tackle-fixture-released', {'version': None, 'latest': None}, None),
+        ('tackle-fixture-released', {'version': None, 'latest': True}, 'HEAD'),
+        ('tackle-fixture-released', {'version': 'v0.1.2', 'latest': None}, 'v0.1.2'),
+        ('tackle-fixture-unreleased', {'version': None, 'latest': None}, 'HEAD'),
+        ('tackle-fixture-unreleased', {'version': None, 'latest': True}, 'HEAD'),
     ],
 )
-def test_utils_vcs_get_repo_source(setup_tmp, fixture, kwargs, assertion):
+def test_utils_vcs_get_repo_source(setup_tmp, get_local, fixture, kwargs, ref):
     """
-    Using the fixtures so that we can control the specific version that would exist in
-     the providers dir (ie unreleased or versions behind), set up the tests in a tmp dir
-     and then after getting the source, check the resulting version.
+    Check that the source is a worktree of the commit of a ref in the remote (ie
+     compared against a local clone) or the latest release when ref is None.
     """
-    with setup_tmp(fixture):
+    local = get_local(fixture)
+    if ref is None:
+        ref = git(local, 'describe', '--tags', '--abbrev=0', 'origin/HEAD')
+    with setup_tmp():
         repo_path = get_repo_source(repo=f'robcxyz/{fixture}', **kwargs)
-        result_version = _get_current_branch(repo_path)
 
-    assert repo_path.endswith(fixture)
-    assert assertion(result_version)
+    assert os.path.basename(repo_path) == git(local, 'rev-parse', f'{ref}^{{commit}}')
+    assert os.path.basename(os.path.dirname(repo_path)) == fixture
 
 
 @pytest.mark.slow
 @pytest.mark.parametrize(
-    "fixture,latest,version,assertion",
+    "fixture,version,exception",
     [
-        ('tackle-fixture-released', None, None, lambda x: x.startswith('v')),
-        ('tackle-fixture-released', True, None, lambda x: x == 'main'),
-        ('tackle-fixture-released', None, 'v0.1.2', lambda x: x == 'v0.1.2'),
-        ('tackle-fixture-unreleased', None, None, lambda x: x == 'main'),
-        ('tackle-fixture-unreleased', True, None, lambda x: x == 'main'),
-    ],
-)
-def test_utils_vcs_get_repo(setup_tmp, fixture, latest, version, assertion):
-    """Using the remote fixtures, test that we can get a brand new source."""
-    with setup_tmp() as tmp_dir:
-        org_dir = os.path.join(tmp_dir, 'robcxyz')
-        provider_dir = os.path.join(org_dir, fixture)
-        get_repo(
-            repo_url=f'https://github.com/robcxyz/{fixture}',
-            org_dir=org_dir,
-            provider_dir=provider_dir,
-            version=version,
-            latest=latest,
-        )
-        result_version = _get_current_branch(provider_dir)
-
-    assert assertion(result_version)
-
-
-@pytest.mark.slow
-@pytest.mark.parametrize(
-    "fixture,copy,version,exception",
-    [
-        ('tackle-fixture-released', False, 'NO_EXIST', exceptions.VersionNotFoundError),
-        ('tackle-fixture-released', True, 'NO_EXIST', exceptions.VersionNotFoundError),
+        ('tackle-fixture-released', 'NO_EXIST', exceptions.VersionNotFoundError),
         (
             'NO_EXIST',
-            False,
             None,
             (exceptions.RepositoryNotFound, exceptions.GenericGitException),
         ),
     ],
 )
-def test_utils_vcs_exceptions_new_repo(setup_tmp, fixture, copy, version, exception):
-    """Test exceptions where the repo does not exist in providers"""
+def test_utils_vcs_exceptions_new_repo(setup_tmp, fixture, version, exception):
+    """Test exceptions where the repo or version does not exist in the remote."""
     with pytest.raises(exception):
-        with setup_tmp(fixture if copy else None):
+        with setup_tmp():
             get_repo_source(f'robcxyz/{fixture}', version, None)
+
+
+def git(cwd, *args) -> str:
+    output = subprocess.run(
+        ['git', *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return output.stdout.strip()
+
+
+@pytest.fixture()
+def local_remote(tmp_path, monkeypatch):
+    """A released provider with a store pointing to a local remote (ie no network)."""
+    for k in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{k}_NAME', 'tackle')
+        monkeypatch.setenv(f'GIT_{k}_EMAIL', 'tackle@example.com')
+    remote = tmp_path / 'remote'
+    remote.mkdir()
+    git(remote, 'init', '--quiet', '-b', 'main')
+    new_commit(remote, 'v0.1.0')
+    git(remote, 'tag', 'v0.1.0')
+
+    providers_dir = tmp_path / 'providers'
+    monkeypatch.setattr(settings, 'providers_dir', str(providers_dir))
+    monkeypatch.setattr(settings, 'provider_lock_file', None)
+    monkeypatch.setattr(settings, 'provider_lock_ttl', 3600)
+    init_bare_repo(str(remote), str(providers_dir / 'robcxyz' / 'local' / 'repo.git'))
+    return remote
+
+
+def new_commit(remote, message: str) -> str:
+    (remote / 'tackle.yaml').write_text(f'foo: {message}\n')
+    git(remote, 'add', 'tackle.yaml')
+    git(remote, 'commit', '--quiet', '-m', message)
+    return git(remote, 'rev-parse', 'HEAD')
+
+
+def test_utils_vcs_get_repo_source_worktrees(local_remote):
+    """Check that versions resolve to worktrees per commit which coexist."""
+    release_sha = git(local_remote, 'rev-parse', 'v0.1.0')
+    head_sha = new_commit(local_remote, 'unreleased')
+
+    release_path = get_repo_source('robcxyz/local', None, None)
+    head_path = get_repo_source('robcxyz/local', None, True)
+    assert os.path.basename(release_path) == release_sha
+    assert os.path.basename(head_path) == head_sha
+    assert get_repo_source('robcxyz/local', 'main', None) == head_path
+    assert get_repo_source('robcxyz/local', release_sha, None) == release_path
+    with open(os.path.join(release_path, 'tackle.yaml')) as f:
+        assert f.read() == 'foo: v0.1.0\n'
+
+    with pytest.raises(exceptions.VersionNotFoundError):
+        get_repo_source('robcxyz/local', 'NO_EXIST', None)
+
+
+@pytest.mark.parametrize('length', [7, 12])
+def test_utils_vcs_get_repo_source_short_sha(local_remote, length):
+    """Check abbreviated shas of commits that are not a tag / branch are found."""
+    sha = git(local_remote, 'rev-parse', 'HEAD')
+    new_commit(local_remote, 'unreleased')
+
+    repo_path = get_repo_source('robcxyz/local', sha[:length], None)
+    assert os.path.basename(repo_path) == sha
+    with open(os.path.join(repo_path, 'tackle.yaml')) as f:
+        assert f.read() == 'foo: v0.1.0\n'
+
+
+def legacy_checkout(local_remote) -> str:
+    """
+    Clone the remote the way older versions of tackle stored providers. The bare repo
+     is created again within it so that it points to the local remote.
+    """
+    store_dir = os.path.join(settings.providers_dir, 'robcxyz', 'local')
+    shutil.rmtree(store_dir)
+    git(local_remote, 'clone', '--quiet', str(local_remote), store_dir)
+    init_bare_repo(str(local_remote), os.path.join(store_dir, 'repo.git'))
+    return store_dir
+
+
+def test_utils_vcs_get_repo_source_legacy(local_remote):
+    """Check a single checkout from older versions is replaced with a store."""
+    store_dir = legacy_checkout(local_remote)
+
+    repo_path = get_repo_source('robcxyz/local', None, None)
+    assert os.path.dirname(repo_path) == store_dir
+    assert os.path.isfile(os.path.join(repo_path, 'tackle.yaml'))
+    assert sorted(os.listdir(store_dir)) == sorted(
+        ['repo.git', os.path.basename(repo_path)]
+    )
+
+
+def test_utils_vcs_get_repo_source_legacy_offline(local_remote):
+    """Check a single checkout from older versions is kept when offline."""
+    store_dir = legacy_checkout(local_remote)
+    shutil.rmtree(local_remote)
+
+    assert get_repo_source('robcxyz/local', None, None) == store_dir
+    assert os.path.isfile(os.path.join(store_dir, 'tackle.yaml'))
+
+
+def test_utils_vcs_get_repo_source_lock(local_remote, mocker):
+    """Check that a fresh lock is resolved locally and refreshed after the ttl."""
+    repo_path = get_repo_source('robcxyz/local', None, None)
+    locked_sha = git(local_remote, 'rev-parse', 'v0.1.0')
+    assert os.path.basename(repo_path) == locked_sha
+    assert read_lock_file()['https://github.com/robcxyz/local#release'].sha == (
+        locked_sha
+    )
+
+    new_commit(local_remote, 'v0.2.0')
+    git(local_remote, 'tag', 'v0.2.0')
+    spy = mocker.spy(vcs, 'run_git')
+    assert get_repo_source('robcxyz/local', None, None) == repo_path
+    assert spy.call_count == 0
+
+    settings.provider_lock_ttl = 0
+    new_path = get_repo_source('robcxyz/local', None, None)
+    assert os.path.basename(new_path) == git(local_remote, 'rev-parse', 'v0.2.0')
+    # The old worktree is untouched
+    assert os.path.isdir(repo_path)
+
+
+def test_utils_vcs_get_repo_source_lock_latest(local_remote):
+    """Check that `latest` refreshes even when there is a fresh lock."""
+    get_repo_source('robcxyz/local', None, True)
+    new_sha = new_commit(local_remote, 'unreleased')
+
+    repo_path = get_repo_source('robcxyz/local', None, True)
+    assert os.path.basename(repo_path) == new_sha
+
+
+def test_utils_vcs_get_repo_source_lock_offline(local_remote):
+    """Check that the locked commit is used when the remote can't be reached."""
+    repo_path = get_repo_source('robcxyz/local', None, None)
+    shutil.rmtree(repo_path)
+    shutil.rmtree(local_remote)
+
+    settings.provider_lock_ttl = 0
+    assert get_repo_source('robcxyz/local', None, None) == repo_path
+    assert os.path.isfile(os.path.join(repo_path, 'tackle.yaml'))
+
+
+@pytest.mark.parametrize('latest', [None, True])
+def test_utils_vcs_get_repo_source_concurrent(local_remote, mocker, latest):
+    """Check that concurrent runs coalesce to a single fetch of the remote."""
+    run_git = mocker.spy(vcs, 'run_git')
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(get_repo_source, 'robcxyz/local', None, latest)
+            for _ in range(8)
+        ]
+        repo_paths = {i.result() for i in futures}
+
+    assert len(repo_paths) == 1
+    commands = [i.args[0] for i in run_git.call_args_list]
+    assert commands.count('ls-remote') == 1
+    assert commands.count('fetch') == 1